@@ -0,0 +1,72 @@
+"""
+Startup benchmark for the Digitone configuration.
+
+Times a fresh interpreter importing elektron_mcp.digitone.config.config and
+reading the sections the MCP server registers tools for, with the on-disk
+config cache disabled ("uncached"), and with a warm cache in a temporary
+directory ("cached"), so the figures include everything a newly spawned MCP
+server process pays before it can serve a request.
+
+Usage:
+    uv run python benchmarks/config_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+IMPORT = (
+    "import time; start = time.perf_counter(); "
+    "from elektron_mcp.digitone.config.config import digitone_config as c; "
+    "c.wavetone, c.multi_mode_filter, c.amp_page, c.fx_page, c.lfo; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def import_time(env: dict) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def measure(env: dict, runs: int) -> float:
+    return statistics.median(import_time(env) for _ in range(runs)) * 1000
+
+
+def run(runs: int) -> None:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        uncached_env = {**os.environ, "ELEKTRON_MCP_CONFIG_CACHE": "0"}
+        cached_env = {
+            **os.environ,
+            "ELEKTRON_MCP_CONFIG_CACHE": "1",
+            "ELEKTRON_MCP_CACHE_DIR": cache_dir,
+        }
+        # Populate the cache
+        import_time(cached_env)
+
+        uncached = measure(uncached_env, runs)
+        cached = measure(cached_env, runs)
+
+    print(f"{'config import':<24}{'median':>12}")
+    print(f"{'uncached':<24}{uncached:>9.1f} ms")
+    print(f"{'cached':<24}{cached:>9.1f} ms")
+    print(f"{'saved':<24}{uncached - cached:>9.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="imports per case")
+    args = parser.parse_args()
+    run(args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Microbenchmark for parameter descriptors.
+
+Compares reading the MIDI numbers of a parameter through the pydantic
+DigitoneParams model ("before") with reading them from its compact
+ParameterDescriptor ("after"), and the memory held by each.
+
+Usage:
+    uv run python benchmarks/parameter_descriptor.py [--count N]
+"""
+
+import argparse
+import sys
+import time
+
+from elektron_mcp.digitone.config.config import digitone_config
+from elektron_mcp.digitone.models.descriptor import ParameterDescriptor
+
+
+def deep_size(obj, seen=None) -> int:
+    """Approximate memory held by an object graph."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(deep_size(item, seen) for item in obj)
+    if hasattr(obj, "__dict__"):
+        size += deep_size(vars(obj), seen)
+    for name in getattr(type(obj), "__slots__", ()):
+        if hasattr(obj, name):
+            size += deep_size(getattr(obj, name), seen)
+    return size
+
+
+def reads_per_second(read, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        read()
+    return count / (time.perf_counter() - start)
+
+
+def run(count: int) -> None:
+    param = digitone_config.wavetone.pages["page_1"].parameters["TUN1"]
+    descriptor = ParameterDescriptor.from_model(0, "wavetone", "page_1", "TUN1", param)
+
+    before = reads_per_second(
+        lambda: (int(param.midi.cc_msb), param.midi.nrpn_msb, param.midi.nrpn_lsb),
+        count,
+    )
+    after = reads_per_second(
+        lambda: (descriptor.cc, descriptor.nrpn_msb, descriptor.nrpn_lsb), count
+    )
+
+    print(f"{'':<24}{'before (pydantic)':>20}{'after (descriptor)':>20}")
+    print(f"{'reads/s (cc, nrpn)':<24}{before:>20,.0f}{after:>20,.0f}")
+    print(
+        f"{'bytes per parameter':<24}{deep_size(param):>20}{deep_size(descriptor):>20}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=500_000, help="reads per case")
+    args = parser.parse_args()
+    run(args.count)
+
+
+if __name__ == "__main__":
+    main()
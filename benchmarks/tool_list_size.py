@@ -0,0 +1,55 @@
+"""
+Size of the MCP tool list in each tool mode.
+
+Registers the tools of the "full" mode (default sections and all sections) and
+the "compact" mode on a FastMCP server and
+reports how many tools it lists, the size of the serialized list_tools
+payload that every client handshake and LLM prompt carries, and the time
+spent registering them.
+
+Usage:
+    uv run python benchmarks/tool_list_size.py
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from mcp.server.fastmcp import FastMCP
+
+from elektron_mcp.tools.generated_tools import DEFAULT_SECTIONS, parse_sections
+from elektron_mcp.tools.registration import COMPACT_MODE, FULL_MODE, register_tools
+
+RUNS = (
+    ("full", FULL_MODE, DEFAULT_SECTIONS),
+    ("full/all", FULL_MODE, parse_sections("all")),
+    ("compact", COMPACT_MODE, DEFAULT_SECTIONS),
+)
+
+
+def measure(mode: str, sections):
+    mcp = FastMCP("Digitone 2")
+    start = time.perf_counter()
+    # Registration does not touch the MIDI interface
+    register_tools(mcp, None, mode, sections)
+    elapsed = time.perf_counter() - start
+    tools = asyncio.run(mcp.list_tools())
+    payload = json.dumps([tool.model_dump(mode="json") for tool in tools])
+    return len(tools), len(payload.encode()), elapsed * 1000
+
+
+def run() -> None:
+    print(f"{'mode':<10}{'tools':>8}{'list_tools bytes':>20}{'register':>14}")
+    for label, mode, sections in RUNS:
+        count, size, elapsed = measure(mode, sections)
+        print(f"{label:<10}{count:>8}{size:>20,}{elapsed:>11.1f} ms")
+
+
+def main() -> None:
+    argparse.ArgumentParser(description=__doc__.splitlines()[1]).parse_args()
+    run()
+
+
+if __name__ == "__main__":
+    main()
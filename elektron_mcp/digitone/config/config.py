@@ -1,21 +1,20 @@
-from elektron_mcp.digitone.data.filters import (
-    MULTI_MODE_FILTER_PARAMS,
-    LOWPASS_4_FILTER_PARAMS,
-    LEGACY_LP_HP_FILTER_PARAMS,
-    COMB_PLUS_FILTER_PARAMS,
-    COMB_MINUS_FILTER_PARAMS,
-    EQUALIZER_FILTER_PARAMS,
-    BASE_WIDTH_FILTER_PARAMS,
-)
+from functools import cache
 
-from elektron_mcp.digitone.data.fm_drum import FM_DRUM_PARAMS
-from elektron_mcp.digitone.data.fm_tone import FM_TONE_PARAMS
-from elektron_mcp.digitone.data.swarmer import SWARMER_PARAMS
-from elektron_mcp.digitone.data.wavetone import WAVETONE_PARAMS
-from elektron_mcp.digitone.data.lfo import LFO1_PARAMS, LFO2_PARAMS, LFO3_PARAMS
-from elektron_mcp.digitone.data.amp import AMP_PARAMS_DATA
-from elektron_mcp.digitone.data.fx import FX_PARAMS_DATA
-from elektron_mcp.digitone.models.models import DigitoneConfig
+from elektron_mcp.digitone.models.models import (
+    AmpParameters,
+    DigitoneConfig,
+    FilterParameters,
+    FxParameters,
+    LfoParameters,
+    SynthParameters,
+)
+from elektron_mcp.digitone.config.config_cache import load_or_build
+from elektron_mcp.digitone.config.lazy_config import LazyDigitoneConfig
+from elektron_mcp.digitone.config.parameter_index import (
+    ParameterIndex,
+    build_parameter_index,
+)
+from elektron_mcp.digitone.config.parameter_table import ParameterTable
 from elektron_mcp.digitone.utils.parameter_utils import (
     create_lfo_params,
     create_parameter_group,
@@ -23,52 +22,132 @@ from elektron_mcp.digitone.utils.parameter_utils import (
     create_param_from_dict,
 )
 
-# Create the elektron configuration
-digitone_config = DigitoneConfig()
+# Each section imports its data module when it is built, so engines that are
+# never used do not load their data either.
 
-# Set up LFO groups
-digitone_config.lfo.lfo_groups = {
-    "lfo_1": create_lfo_params(LFO1_PARAMS),
-    "lfo_2": create_lfo_params(LFO2_PARAMS),
-    "lfo_3": create_lfo_params(LFO3_PARAMS),
-}
 
-# Set up FMDRUM parameters
-digitone_config.fmdrum.pages = {
-    page: create_parameter_group(params) for page, params in FM_DRUM_PARAMS.items()
-}
+def build_lfo() -> LfoParameters:
+    from elektron_mcp.digitone.data.lfo import LFO1_PARAMS, LFO2_PARAMS, LFO3_PARAMS
 
-# Set up FMTONE parameters
-digitone_config.fmtone.pages = {
-    page: create_parameter_group(params) for page, params in FM_TONE_PARAMS.items()
-}
+    return LfoParameters(
+        lfo_groups={
+            "lfo_1": create_lfo_params(LFO1_PARAMS),
+            "lfo_2": create_lfo_params(LFO2_PARAMS),
+            "lfo_3": create_lfo_params(LFO3_PARAMS),
+        }
+    )
 
-# Set up SWARMER parameters
-digitone_config.swarmer.pages = {
-    page: create_parameter_group(params) for page, params in SWARMER_PARAMS.items()
-}
 
-# Set up WAVETONE parameters
-digitone_config.wavetone.pages = {
-    page: create_parameter_group(params) for page, params in WAVETONE_PARAMS.items()
-}
+def build_synth(params: dict) -> SynthParameters:
+    return SynthParameters(
+        pages={page: create_parameter_group(group) for page, group in params.items()}
+    )
 
 
-# Set up filter parameters
-setup_filter_parameters(digitone_config.multi_mode_filter, MULTI_MODE_FILTER_PARAMS)
-setup_filter_parameters(digitone_config.lowpass_4_filter, LOWPASS_4_FILTER_PARAMS)
-setup_filter_parameters(digitone_config.legacy_lp_hp_filter, LEGACY_LP_HP_FILTER_PARAMS)
-setup_filter_parameters(digitone_config.comb_minus_filter, COMB_MINUS_FILTER_PARAMS)
-setup_filter_parameters(digitone_config.comb_plus_filter, COMB_PLUS_FILTER_PARAMS)
-setup_filter_parameters(digitone_config.equalizer_filter, EQUALIZER_FILTER_PARAMS)
-setup_filter_parameters(digitone_config.base_width_filter, BASE_WIDTH_FILTER_PARAMS)
+def build_fmdrum() -> SynthParameters:
+    from elektron_mcp.digitone.data.fm_drum import FM_DRUM_PARAMS
 
-# AMP page
-digitone_config.amp_page.parameters = {
-    name: create_param_from_dict(param) for name, param in AMP_PARAMS_DATA.items()
-}
+    return build_synth(FM_DRUM_PARAMS)
+
+
+def build_fmtone() -> SynthParameters:
+    from elektron_mcp.digitone.data.fm_tone import FM_TONE_PARAMS
+
+    return build_synth(FM_TONE_PARAMS)
+
+
+def build_swarmer() -> SynthParameters:
+    from elektron_mcp.digitone.data.swarmer import SWARMER_PARAMS
+
+    return build_synth(SWARMER_PARAMS)
+
+
+def build_wavetone() -> SynthParameters:
+    from elektron_mcp.digitone.data.wavetone import WAVETONE_PARAMS
+
+    return build_synth(WAVETONE_PARAMS)
+
+
+def filter_builder(params_name: str):
+    """Return a builder for the filter whose parameters are filters.<params_name>."""
 
-# FX page
-digitone_config.fx_page.parameters = {
-    name: create_param_from_dict(param) for name, param in FX_PARAMS_DATA.items()
+    def build_filter() -> FilterParameters:
+        from elektron_mcp.digitone.data import filters
+
+        filter_params = FilterParameters()
+        setup_filter_parameters(filter_params, getattr(filters, params_name))
+        return filter_params
+
+    return build_filter
+
+
+def build_amp_page() -> AmpParameters:
+    from elektron_mcp.digitone.data.amp import AMP_PARAMS_DATA
+
+    return AmpParameters(
+        parameters={
+            name: create_param_from_dict(param)
+            for name, param in AMP_PARAMS_DATA.items()
+        }
+    )
+
+
+def build_fx_page() -> FxParameters:
+    from elektron_mcp.digitone.data.fx import FX_PARAMS_DATA
+
+    return FxParameters(
+        parameters={
+            name: create_param_from_dict(param)
+            for name, param in FX_PARAMS_DATA.items()
+        }
+    )
+
+
+SECTION_BUILDERS = {
+    "fmdrum": build_fmdrum,
+    "fmtone": build_fmtone,
+    "swarmer": build_swarmer,
+    "wavetone": build_wavetone,
+    "multi_mode_filter": filter_builder("MULTI_MODE_FILTER_PARAMS"),
+    "lowpass_4_filter": filter_builder("LOWPASS_4_FILTER_PARAMS"),
+    "legacy_lp_hp_filter": filter_builder("LEGACY_LP_HP_FILTER_PARAMS"),
+    "comb_minus_filter": filter_builder("COMB_MINUS_FILTER_PARAMS"),
+    "comb_plus_filter": filter_builder("COMB_PLUS_FILTER_PARAMS"),
+    "equalizer_filter": filter_builder("EQUALIZER_FILTER_PARAMS"),
+    "base_width_filter": filter_builder("BASE_WIDTH_FILTER_PARAMS"),
+    "amp_page": build_amp_page,
+    "fx_page": build_fx_page,
+    "lfo": build_lfo,
 }
+
+
+def build_digitone_config() -> DigitoneConfig:
+    """Build and validate every section from the data modules, bypassing the cache."""
+    return DigitoneConfig(**{name: build() for name, build in SECTION_BUILDERS.items()})
+
+
+# Sections are built on first access and cached on disk, see config_cache
+digitone_config = LazyDigitoneConfig(
+    {
+        name: lambda name=name, build=build: load_or_build(name, build)
+        for name, build in SECTION_BUILDERS.items()
+    }
+)
+
+# Flat table of compiled parameters used by the controllers on the send path,
+# filled in as sections are built, under the same lock
+parameter_table = ParameterTable(lock=digitone_config.lock)
+digitone_config.add_build_listener(parameter_table.add_section)
+
+
+@cache
+def get_digitone_index() -> ParameterIndex:
+    """Reverse lookups from CC numbers and NRPN addresses, over every section."""
+    return build_parameter_index(digitone_config)
+
+
+def __getattr__(name: str):
+    # digitone_index builds every section, so it is only built when first used
+    if name == "digitone_index":
+        return get_digitone_index()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,154 @@
+"""
+On-disk cache of the built Digitone configuration sections.
+
+Building a section validates every one of its DigitoneParams models, which every
+short-lived server process pays for. Each built section is pickled to the user
+cache directory together with a hash of the modules it is built from
+(digitone/data/*.py, the pydantic models, the section builders in config.py and
+utils/parameter_utils.py), and later processes unpickle it without re-running
+validators. Any change to those modules, or to
+the Python or pydantic version, changes the hash and triggers a rebuild.
+
+The cache lives in $ELEKTRON_MCP_CACHE_DIR, or $XDG_CACHE_HOME/elektron-mcp
+(~/.cache/elektron-mcp by default). Set ELEKTRON_MCP_CONFIG_CACHE=0 to disable it.
+
+Unpickling runs code chosen by whoever wrote the file, so on POSIX systems a
+cache file is only loaded if it is owned by the current user and not writable
+by group or others. Any other file is ignored and replaced.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import stat
+import sys
+import tempfile
+from functools import cache
+from pathlib import Path
+from typing import Callable, Optional
+
+import pydantic
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+_DIGITONE_DIR = Path(__file__).resolve().parent.parent
+
+
+def source_files() -> list[Path]:
+    """Modules whose content determines the built configuration."""
+    data_files = sorted((_DIGITONE_DIR / "data").glob("*.py"))
+    return data_files + [
+        _DIGITONE_DIR / "models" / "models.py",
+        # The section builders and the helpers they call
+        _DIGITONE_DIR / "config" / "config.py",
+        _DIGITONE_DIR / "utils" / "parameter_utils.py",
+    ]
+
+
+@cache
+def config_hash() -> str:
+    """Hash of the configuration sources and of the interpreter and pydantic versions."""
+    digest = hashlib.sha256()
+    digest.update(f"{sys.version_info[:2]} pydantic {pydantic.VERSION}".encode())
+    for path in source_files():
+        digest.update(path.relative_to(_DIGITONE_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_dir() -> Path:
+    """Directory holding the cache file."""
+    directory = os.environ.get("ELEKTRON_MCP_CACHE_DIR")
+    if directory:
+        return Path(directory)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "elektron-mcp"
+
+
+def cache_path(section: str) -> Path:
+    """Cache file of a config section."""
+    return cache_dir() / f"digitone_{section}.pickle"
+
+
+def cache_enabled() -> bool:
+    return os.environ.get("ELEKTRON_MCP_CONFIG_CACHE", "1") != "0"
+
+
+def _trusted(f) -> bool:
+    """Return True if an open cache file is owned by us and writable only by us."""
+    if not hasattr(os, "getuid"):
+        return True
+    info = os.fstat(f.fileno())
+    return info.st_uid == os.getuid() and not info.st_mode & (
+        stat.S_IWGRP | stat.S_IWOTH
+    )
+
+
+def load_section(path: Path, key: str) -> Optional[BaseModel]:
+    """
+    Load a cached config section.
+
+    Returns:
+        The section, or None if the file is missing, unreadable, not safe to
+        unpickle (see _trusted) or was built from different sources.
+    """
+    try:
+        with path.open("rb") as f:
+            if not _trusted(f):
+                logger.warning(
+                    f"Ignoring config cache {path}: not owned by the current "
+                    "user, or writable by others"
+                )
+                return None
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable config cache {path}: {e}")
+        return None
+
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        logger.info(f"Config cache {path.name} is stale, rebuilding")
+        return None
+    section = cached.get("section")
+    return section if isinstance(section, BaseModel) else None
+
+
+def save_section(path: Path, key: str, section: BaseModel) -> None:
+    """Write the configuration atomically, so concurrent processes never read half a file."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    {"key": key, "section": section}, f, pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except Exception as e:
+        logger.warning(f"Could not write config cache {path}: {e}")
+
+
+def load_or_build(section: str, build: Callable[[], BaseModel]) -> BaseModel:
+    """
+    Return a cached config section, or build and cache it.
+
+    Args:
+        section: Name of the DigitoneConfig section, e.g. 'wavetone'.
+        build: Builds the section from its data module.
+    """
+    if not cache_enabled():
+        return build()
+
+    path = cache_path(section)
+    key = config_hash()
+    value = load_section(path, key)
+    if value is None:
+        value = build()
+        save_section(path, key, value)
+    return value
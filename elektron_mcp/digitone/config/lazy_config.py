@@ -0,0 +1,81 @@
+"""
+Lazily built Digitone configuration.
+
+Exposes the same section attributes as DigitoneConfig (digitone_config.wavetone,
+digitone_config.lfo, ...), but builds each section the first time it is read.
+Engines whose tools are never registered are never built, so they cost nothing
+at startup or in memory.
+"""
+
+import threading
+from typing import Callable, Dict, List
+
+from pydantic import BaseModel
+
+from elektron_mcp.digitone.models.models import DigitoneConfig
+
+SectionBuilder = Callable[[], BaseModel]
+BuildListener = Callable[[str, BaseModel], None]
+
+
+class LazyDigitoneConfig:
+    """DigitoneConfig whose sections are built on first attribute access."""
+
+    def __init__(self, builders: Dict[str, SectionBuilder]):
+        """
+        Args:
+            builders: Zero-argument function building each DigitoneConfig section.
+        """
+        unknown = set(builders) - set(DigitoneConfig.model_fields)
+        if unknown:
+            raise ValueError(f"Unknown config sections: {sorted(unknown)}")
+        self._builders = builders
+        self._listeners: List[BuildListener] = []
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name: str) -> BaseModel:
+        # Only called for sections that are not built yet
+        builders = self.__dict__.get("_builders", {})
+        if name not in builders:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        with self._lock:
+            section = self.__dict__.get(name)
+            if section is None:
+                section = builders[name]()
+                self.__dict__[name] = section
+                for listener in self._listeners:
+                    listener(name, section)
+        return section
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock held while a section is built and its build listeners run."""
+        return self._lock
+
+    def __dir__(self):
+        return [*super().__dir__(), *self._builders]
+
+    def built_sections(self) -> List[str]:
+        """Names of the sections built so far."""
+        return [name for name in self._builders if name in self.__dict__]
+
+    def add_build_listener(self, listener: BuildListener) -> None:
+        """
+        Call listener(name, section) for every section, as soon as it is built.
+
+        Sections that are already built are reported immediately.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+            for name in self.built_sections():
+                listener(name, self.__dict__[name])
+
+    def to_config(self) -> DigitoneConfig:
+        """Build every section and return them as a regular DigitoneConfig."""
+        return DigitoneConfig(**{name: getattr(self, name) for name in self._builders})
+
+    def model_copy(self, **kwargs) -> DigitoneConfig:
+        """Same as DigitoneConfig.model_copy, building every section first."""
+        return self.to_config().model_copy(**kwargs)
@@ -0,0 +1,102 @@
+"""
+Reverse lookup indexes from MIDI numbers to Digitone parameters.
+
+Maps CC numbers and NRPN (msb, lsb) addresses back to the (engine, page, name)
+of every parameter in a DigitoneConfig, for decoding incoming traffic and
+recorded logs without scanning the nested parameter groups.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from elektron_mcp.digitone.models.models import DigitoneConfig
+from elektron_mcp.digitone.utils.parameter_utils import iter_parameters
+
+logger = logging.getLogger(__name__)
+
+NrpnAddress = Tuple[int, int]
+
+
+class ParameterRef(NamedTuple):
+    """Location of a parameter in the Digitone configuration."""
+
+    engine: str  # Config section, e.g. 'wavetone', 'amp_page', 'lfo'
+    page: Optional[str]  # Page or LFO group key, None for flat sections
+    name: str
+
+
+class ParameterIndex:
+    """O(1) lookups from CC numbers and NRPN addresses to parameters."""
+
+    def __init__(self, refs: List[Tuple[ParameterRef, Optional[int], NrpnAddress]]):
+        """
+        Build the indexes.
+
+        Args:
+            refs: (parameter, cc number or None, NRPN address) for every parameter.
+        """
+        by_cc: Dict[int, List[ParameterRef]] = defaultdict(list)
+        by_nrpn: Dict[NrpnAddress, List[ParameterRef]] = defaultdict(list)
+        self._by_engine_cc: Dict[Tuple[str, int], ParameterRef] = {}
+        self._by_engine_nrpn: Dict[Tuple[str, NrpnAddress], ParameterRef] = {}
+        self._cc_to_nrpn: Dict[int, NrpnAddress] = {}
+
+        for ref, cc, address in refs:
+            by_nrpn[address].append(ref)
+            self._by_engine_nrpn.setdefault((ref.engine, address), ref)
+            if cc is not None:
+                by_cc[cc].append(ref)
+                self._by_engine_cc.setdefault((ref.engine, cc), ref)
+                self._cc_to_nrpn.setdefault(cc, address)
+
+        self._by_cc = {cc: tuple(refs) for cc, refs in by_cc.items()}
+        self._by_nrpn = {address: tuple(refs) for address, refs in by_nrpn.items()}
+        self.cc_collisions = self._engine_collisions(self._by_cc)
+        self.nrpn_collisions = self._engine_collisions(self._by_nrpn)
+
+        if self.cc_collisions:
+            logger.debug(
+                f"{len(self.cc_collisions)} CC numbers are shared between engines"
+            )
+
+    @staticmethod
+    def _engine_collisions(index: Dict) -> Dict:
+        """Keep the entries whose parameters belong to more than one engine."""
+        return {
+            key: refs
+            for key, refs in index.items()
+            if len({ref.engine for ref in refs}) > 1
+        }
+
+    def lookup_cc(self, cc: int) -> Tuple[ParameterRef, ...]:
+        """Return every parameter controlled by a CC number."""
+        return self._by_cc.get(cc, ())
+
+    def lookup_nrpn(self, nrpn_msb: int, nrpn_lsb: int) -> Tuple[ParameterRef, ...]:
+        """Return every parameter at an NRPN address."""
+        return self._by_nrpn.get((nrpn_msb, nrpn_lsb), ())
+
+    def resolve_cc(self, engine: str, cc: int) -> Optional[ParameterRef]:
+        """Return the parameter of an engine controlled by a CC number, if any."""
+        return self._by_engine_cc.get((engine, cc))
+
+    def resolve_nrpn(
+        self, engine: str, nrpn_msb: int, nrpn_lsb: int
+    ) -> Optional[ParameterRef]:
+        """Return the parameter of an engine at an NRPN address, if any."""
+        return self._by_engine_nrpn.get((engine, (nrpn_msb, nrpn_lsb)))
+
+    def cc_to_nrpn(self, cc: int) -> Optional[NrpnAddress]:
+        """Return the NRPN address of the parameters controlled by a CC number."""
+        return self._cc_to_nrpn.get(cc)
+
+
+def build_parameter_index(config: DigitoneConfig) -> ParameterIndex:
+    """Build the reverse lookup indexes for every parameter in a configuration."""
+    refs = []
+    for engine, page, name, param in iter_parameters(config):
+        cc = int(param.midi.cc_msb) if param.midi.cc_msb else None
+        address = (param.midi.nrpn_msb, param.midi.nrpn_lsb)
+        refs.append((ParameterRef(engine, page, name), cc, address))
+    return ParameterIndex(refs)
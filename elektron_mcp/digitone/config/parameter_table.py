@@ -0,0 +1,128 @@
+"""
+Compiled flat parameter table.
+
+Flattens the nested pydantic configuration into ParameterDescriptors keyed by
+integer parameter id, with the MIDI numbers and ranges already converted to
+ints, so the send path does not have to walk ParameterGroup dictionaries or
+parse CC numbers from strings on every call.
+
+The table is append-only: each section's parameters are added once, when the
+section is built, and never change afterwards. Configs that are not part of
+the table are compiled on the fly by group() and never added to it.
+"""
+
+import threading
+from typing import ContextManager, Dict, Iterator, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from elektron_mcp.digitone.models.descriptor import ParameterDescriptor
+from elektron_mcp.digitone.models.models import DigitoneConfig
+from elektron_mcp.digitone.utils.parameter_utils import (
+    iter_controller_configs,
+    iter_group_parameters,
+    iter_section_configs,
+)
+
+# Key of a parameter within a controller config: (page, name) or name
+ControllerKey = Union[str, Tuple[str, str]]
+
+
+class ParameterTable:
+    """Append-only table of compiled parameters, indexed by integer id.
+
+    Sections are added as they are built, see LazyDigitoneConfig. Readers see
+    an immutable tuple of entries, replaced as a whole by each addition.
+    """
+
+    def __init__(self, lock: Optional[ContextManager] = None):
+        """
+        Args:
+            lock: Held while parameters are added, e.g. the lock a
+                LazyDigitoneConfig holds while building a section. Defaults to
+                a lock of the table's own.
+        """
+        self._lock = lock if lock is not None else threading.RLock()
+        self._entries: Tuple[ParameterDescriptor, ...] = ()
+        self._ids: Dict[Tuple[str, Optional[str], str], int] = {}
+        # id() of a controller config -> (the config, its parameters by key).
+        # Holding the config keeps its id from being reused.
+        self._groups: Dict[
+            int, Tuple[dict, Dict[ControllerKey, ParameterDescriptor]]
+        ] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[ParameterDescriptor]:
+        return iter(self._entries)
+
+    def __getitem__(self, param_id: int) -> ParameterDescriptor:
+        return self._entries[param_id]
+
+    def id_of(self, engine: str, page: Optional[str], name: str) -> int:
+        """
+        Return the id of a parameter.
+
+        Raises:
+            KeyError: If the parameter is not in the table.
+        """
+        return self._ids[(engine, page, name)]
+
+    def add_group(
+        self, engine: str, controller_config: dict, group: Optional[str] = None
+    ) -> None:
+        """
+        Compile the parameters of a controller config into the table.
+
+        Args:
+            engine: Config section the parameters belong to, e.g. 'wavetone'.
+            controller_config: Dict of pages or parameters, as passed to controllers.
+            group: LFO group key of the config, if any.
+        """
+        with self._lock:
+            if id(controller_config) in self._groups:
+                return
+            entries = list(self._entries)
+            parameters: Dict[ControllerKey, ParameterDescriptor] = {}
+            for key, page, name, param in iter_group_parameters(
+                controller_config, group
+            ):
+                entry = ParameterDescriptor.from_model(
+                    len(entries), engine, page, name, param
+                )
+                entries.append(entry)
+                parameters[key] = entry
+                self._ids[(engine, page, name)] = entry.id
+            self._entries = tuple(entries)
+            self._groups[id(controller_config)] = (controller_config, parameters)
+
+    def add_section(self, engine: str, section: BaseModel) -> None:
+        """Compile every controller config of a DigitoneConfig section into the table."""
+        for _, group, controller_config in iter_section_configs(engine, section):
+            self.add_group(engine, controller_config, group)
+
+    def group(
+        self, controller_config: dict
+    ) -> Dict[ControllerKey, ParameterDescriptor]:
+        """
+        Return the compiled parameters of a controller config by controller key.
+
+        Configs that are not part of the table are compiled on the fly, with
+        entries that carry an id of -1.
+        """
+        registered = self._groups.get(id(controller_config))
+        if registered is not None:
+            return registered[1]
+        return {
+            key: ParameterDescriptor.from_model(-1, "", page, name, param)
+            for key, page, name, param in iter_group_parameters(controller_config)
+        }
+
+
+def compile_parameter_table(config: DigitoneConfig) -> ParameterTable:
+    """Compile every parameter of a configuration into a ParameterTable."""
+    table = ParameterTable()
+    for engine, group, controller_config in iter_controller_configs(config):
+        table.add_group(engine, controller_config, group)
+    return table
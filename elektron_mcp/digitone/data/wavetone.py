@@ -226,7 +226,7 @@ WAVETONE_PARAMS = {
             "min_midi": 0,
             "max_val": 2,
             "min_val": 0,
-            "options": ["grain nose", "tuned noise", "sample and hold noise"],
+            "options": ["grain noise", "tuned noise", "sample and hold noise"],
             "default": 0,
         },
         "CHAR": {
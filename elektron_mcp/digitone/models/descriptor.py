@@ -0,0 +1,130 @@
+"""
+Compact runtime descriptors of Digitone parameters.
+
+The pydantic models validate the parameter data and round-trip it to JSON.
+Controllers only need a handful of integers per parameter on the send path, so
+each validated DigitoneParams is reduced to a frozen ParameterDescriptor whose
+fields live in __slots__: no per-instance dict, no validation machinery and
+plain slot reads for every attribute.
+"""
+
+from typing import FrozenSet, Optional
+
+from elektron_mcp.digitone.models.models import DigitoneParams
+
+
+class ParameterDescriptor:
+    """Immutable MIDI description of one parameter."""
+
+    __slots__ = (
+        "id",
+        "engine",
+        "page",
+        "name",
+        "cc",
+        "nrpn_msb",
+        "nrpn_lsb",
+        "min_midi",
+        "max_midi",
+        "option_values",
+    )
+
+    id: int  # Position in the ParameterTable, -1 for ad hoc descriptors
+    engine: str  # Config section, e.g. 'wavetone'
+    page: Optional[str]  # Page or LFO group key, None for flat sections
+    name: str
+    cc: Optional[int]  # None if the parameter has no CC
+    nrpn_msb: int
+    nrpn_lsb: int
+    min_midi: int
+    max_midi: int
+    # MIDI values of named options, which may lie outside min_midi-max_midi
+    option_values: Optional[FrozenSet[int]]
+
+    def __init__(
+        self,
+        id: int,
+        engine: str,
+        page: Optional[str],
+        name: str,
+        cc: Optional[int],
+        nrpn_msb: int,
+        nrpn_lsb: int,
+        min_midi: int,
+        max_midi: int,
+        option_values: Optional[FrozenSet[int]] = None,
+    ):
+        setter = object.__setattr__
+        setter(self, "id", id)
+        setter(self, "engine", engine)
+        setter(self, "page", page)
+        setter(self, "name", name)
+        setter(self, "cc", cc)
+        setter(self, "nrpn_msb", nrpn_msb)
+        setter(self, "nrpn_lsb", nrpn_lsb)
+        setter(self, "min_midi", min_midi)
+        setter(self, "max_midi", max_midi)
+        setter(self, "option_values", option_values)
+
+    @classmethod
+    def from_model(
+        cls,
+        param_id: int,
+        engine: str,
+        page: Optional[str],
+        name: str,
+        param: DigitoneParams,
+    ) -> "ParameterDescriptor":
+        """Reduce a validated DigitoneParams model to a descriptor."""
+        return cls(
+            id=param_id,
+            engine=engine,
+            page=page,
+            name=name,
+            cc=int(param.midi.cc_msb) if param.midi.cc_msb else None,
+            nrpn_msb=int(param.midi.nrpn_msb),
+            nrpn_lsb=int(param.midi.nrpn_lsb),
+            min_midi=int(param.min_midi_value),
+            max_midi=int(param.max_midi_value),
+            option_values=(
+                frozenset(param.options.values())
+                if isinstance(param.options, dict)
+                else None
+            ),
+        )
+
+    def accepts(self, value: int) -> bool:
+        """Return True if value is a valid MIDI value for this parameter."""
+        low, high = self.min_midi, self.max_midi
+        # A few data entries list their range the other way around
+        if low > high:
+            low, high = high, low
+        if low <= value <= high:
+            return True
+        return self.option_values is not None and value in self.option_values
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def _astuple(self) -> tuple:
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def __eq__(self, other):
+        if not isinstance(other, ParameterDescriptor):
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    def __hash__(self):
+        return hash(self._astuple())
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{field}={getattr(self, field)!r}" for field in self.__slots__
+        )
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self):
+        return type(self), self._astuple()
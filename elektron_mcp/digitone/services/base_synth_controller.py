@@ -1,9 +1,25 @@
+import time
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+from elektron_mcp.digitone.config.config import parameter_table
+from elektron_mcp.digitone.config.parameter_table import ControllerKey
+from elektron_mcp.digitone.models.descriptor import ParameterDescriptor
 from elektron_mcp.digitone.models.models import ParameterGroup
+from elektron_mcp.digitone.services.shadow_state import (
+    ShadowState,
+    underlying_device,
+)
 from elektron_mcp.midi.digitone_midi import DigitoneMIDI
+from elektron_mcp.midi.metrics import Metrics
+from elektron_mcp.midi.scheduler import Lane
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Result of one parameter in set_parameters(): True if it was sent or already
+# held the value, False if the transport failed, or a validation error message
+ParameterResult = Union[bool, str]
+
 
 class BaseSynthController:
     """Base services for Digitone parameters."""
@@ -13,6 +29,7 @@ class BaseSynthController:
         config: dict[str, ParameterGroup],
         digitone_midi: DigitoneMIDI,
         midi_channel: int,
+        shadow_state: Optional[ShadowState] = None,
     ):
         """
         Initialize the services.
@@ -21,10 +38,109 @@ class BaseSynthController:
             config: A dictionary mapping parameter names/pages to ParameterGroup objects.
             digitone_midi: The DigitoneMIDI interface for sending MIDI messages.
             midi_channel: The MIDI channel to use (1-16).
+            shadow_state: Last known parameter values of the device. Defaults to
+                the state shared by all controllers using digitone_midi.
         """
-        self.config = config
         self.digitone_midi = digitone_midi
         self.midi_channel = midi_channel
+        self.shadow_state = shadow_state or ShadowState.for_device(digitone_midi)
+        # The metrics of the device behind the transport, if enabled
+        self.metrics: Optional[Metrics] = getattr(
+            underlying_device(digitone_midi), "metrics", None
+        )
+        # Only the compiled descriptors are kept, by (page, name) or name
+        self._parameters = parameter_table.group(config)
+        self._pages = frozenset(config)
+
+    def _entry(self, page: str, param_name: str) -> ParameterDescriptor:
+        """Return the compiled page-based parameter, validating page and name."""
+        entry = self._parameters.get((page, param_name))
+        if entry is None:
+            if page not in self._pages:
+                raise ValueError(f"Invalid page: {page}")
+            raise ValueError(f"Invalid parameter: {param_name} on {page}")
+        return entry
+
+    def _direct_entry(self, param_name: str) -> ParameterDescriptor:
+        """Return the compiled non-page-based parameter, validating its name."""
+        entry = self._parameters.get(param_name)
+        if entry is None:
+            raise ValueError(f"Invalid parameter: {param_name}")
+        return entry
+
+    @staticmethod
+    def _out_of_range(name: str, value: int, nrpn: bool = False) -> bool:
+        """Log and return True if value can't be sent as a CC (or NRPN) value."""
+        limit = 16383 if nrpn else 127
+        if isinstance(value, int) and 0 <= value <= limit:
+            return False
+        logger.error(f"Invalid value for {name}: {value}. Must be between 0-{limit}.")
+        return True
+
+    def _is_unchanged(
+        self, entry: ParameterDescriptor, value: int, nrpn: bool = False
+    ) -> bool:
+        """Return True if the device already holds this value, sent the same way."""
+        return self.shadow_state.matches(
+            self.midi_channel, entry.nrpn_msb, entry.nrpn_lsb, value, nrpn
+        )
+
+    def _remember(
+        self, entry: ParameterDescriptor, value: int, nrpn: bool = False
+    ) -> None:
+        """Record a value that was successfully sent, as CC or NRPN."""
+        self.shadow_state.set(
+            self.midi_channel, entry.nrpn_msb, entry.nrpn_lsb, value, nrpn
+        )
+
+    def _count_skipped(self, method: str) -> None:
+        if self.metrics is not None:
+            self.metrics.inc("controller_skipped_total", method)
+
+    def _record(self, method: str, start_ns: int, result) -> None:
+        """Count a send outcome and its latency, if metrics are enabled."""
+        metrics = self.metrics
+        if metrics is None:
+            return
+        metrics.inc(
+            "controller_sets_total" if result else "controller_errors_total", method
+        )
+        metrics.observe(
+            "controller_set_seconds", method, time.perf_counter_ns() - start_ns
+        )
+
+    def get_parameter(self, page: str, param_name: str) -> Optional[int]:
+        """
+        Return the last value set for a page-based parameter, without touching hardware.
+
+        Args:
+            page: Parameter page key in config (e.g. 'page_1', 'page_2').
+            param_name: The name of the parameter.
+
+        Returns:
+            The last known value, or None if it is not known.
+
+        Raises:
+            ValueError: If page or param_name is invalid.
+        """
+        entry = self._entry(page, param_name)
+        return self.shadow_state.get(self.midi_channel, entry.nrpn_msb, entry.nrpn_lsb)
+
+    def get_direct_parameter(self, param_name: str) -> Optional[int]:
+        """
+        Return the last value set for a non-page-based parameter, without touching hardware.
+
+        Args:
+            param_name: Parameter name in config.
+
+        Returns:
+            The last known value, or None if it is not known.
+
+        Raises:
+            ValueError: If the parameter is not in config.
+        """
+        entry = self._direct_entry(param_name)
+        return self.shadow_state.get(self.midi_channel, entry.nrpn_msb, entry.nrpn_lsb)
 
     def set_parameter(self, page: str, param_name: str, value: int) -> bool:
         """
@@ -42,18 +158,22 @@ class BaseSynthController:
             ValueError: If page or param_name is invalid.
             Exception: If sending CC fails.
         """
-        if page not in self.config:
-            raise ValueError(f"Invalid page: {page}")
-        if param_name not in self.config[page].parameters:
-            raise ValueError(f"Invalid parameter: {param_name} on {page}")
-
-        param = self.config[page].parameters[param_name]
-        cc_msb = int(param.midi.cc_msb)
+        start = time.perf_counter_ns() if self.metrics is not None else 0
+        entry = self._entry(page, param_name)
+        if self._out_of_range(param_name, value):
+            return False
+        if self._is_unchanged(entry, value):
+            logger.debug(f"{param_name} on {page} already set to {value}, skipping")
+            self._count_skipped("set_parameter")
+            return True
 
-        result = self.digitone_midi.send_cc(self.midi_channel, cc_msb, value)
+        result = self.digitone_midi.send_cc(self.midi_channel, entry.cc, value)
+        self._record("set_parameter", start, result)
 
         if result is None:
             raise Exception(f"Failed to set {param_name} on {page}")
+        if result:
+            self._remember(entry, value)
         return result
 
     def set_parameter_nrpn(self, page: str, param_name: str, value: int) -> bool:
@@ -72,25 +192,25 @@ class BaseSynthController:
             ValueError: If page or param_name is invalid.
             Exception: If neither NRPN nor CC succeeds.
         """
-        if page not in self.config:
-            raise ValueError(f"Invalid page: {page}")
-        if param_name not in self.config[page].parameters:
-            raise ValueError(f"Invalid parameter: {param_name} on {page}")
-
-        param = self.config[page].parameters[param_name]
+        start = time.perf_counter_ns() if self.metrics is not None else 0
+        entry = self._entry(page, param_name)
+        if self._out_of_range(param_name, value, nrpn=True):
+            return False
+        if self._is_unchanged(entry, value, nrpn=True):
+            logger.debug(f"{param_name} on {page} already set to {value}, skipping")
+            self._count_skipped("set_parameter_nrpn")
+            return True
 
         # Attempt NRPN if mappings exist
         try:
-            if hasattr(param.midi, "nrpn_msb") and hasattr(param.midi, "nrpn_lsb"):
-                result = self.digitone_midi.send_nrpn(
-                    self.midi_channel,
-                    param.midi.nrpn_msb,
-                    param.midi.nrpn_lsb,
-                    value,
-                )
-                if result:
-                    logger.debug(f"Set {param_name} on {page} to {value} using NRPN")
-                    return result
+            result = self.digitone_midi.send_nrpn(
+                self.midi_channel, entry.nrpn_msb, entry.nrpn_lsb, value
+            )
+            if result:
+                logger.debug(f"Set {param_name} on {page} to {value} using NRPN")
+                self._remember(entry, value, nrpn=True)
+                self._record("set_parameter_nrpn", start, result)
+                return result
             logger.debug(
                 f"No NRPN mapping for {param_name} on {page}, or NRPN failed. Trying CC..."
             )
@@ -98,15 +218,19 @@ class BaseSynthController:
             logger.warning(f"NRPN failed for {param_name} on {page}: {e}. Trying CC...")
 
         # Fall back to CC
+        if self.metrics is not None:
+            self.metrics.inc("controller_cc_fallbacks_total", "set_parameter_nrpn")
         try:
-            if not param.midi.cc_msb:
+            if entry.cc is None:
                 logger.error(f"No CC MSB defined for {param_name} on {page}")
+                self._record("set_parameter_nrpn", start, False)
                 return False
 
-            cc_msb = int(param.midi.cc_msb)
-            result = self.digitone_midi.send_cc(self.midi_channel, cc_msb, value)
+            result = self.digitone_midi.send_cc(self.midi_channel, entry.cc, value)
+            self._record("set_parameter_nrpn", start, result)
             if result:
                 logger.debug(f"Set {param_name} on {page} to {value} using CC")
+                self._remember(entry, value)
                 return True
 
             logger.error(f"Failed to set {param_name} on {page} using CC")
@@ -114,6 +238,7 @@ class BaseSynthController:
 
         except Exception as e:
             logger.error(f"Failed to set {param_name} on {page}: {e}")
+            self._record("set_parameter_nrpn", start, False)
             raise Exception(f"Failed to set {param_name} on {page}") from e
 
     def set_direct_parameter_nrpn(self, param_name: str, value: int) -> bool:
@@ -131,18 +256,23 @@ class BaseSynthController:
             ValueError: If the parameter is not in config.
             Exception: If sending NRPN fails.
         """
-        if param_name not in self.config:
-            raise ValueError(f"Invalid parameter: {param_name}")
+        start = time.perf_counter_ns() if self.metrics is not None else 0
+        entry = self._direct_entry(param_name)
+        if self._out_of_range(param_name, value, nrpn=True):
+            return False
+        if self._is_unchanged(entry, value, nrpn=True):
+            logger.debug(f"{param_name} already set to {value}, skipping")
+            self._count_skipped("set_direct_parameter_nrpn")
+            return True
 
-        param = self.config[param_name]
         result = self.digitone_midi.send_nrpn(
-            self.midi_channel,
-            param.midi.nrpn_msb,
-            param.midi.nrpn_lsb,
-            value,
+            self.midi_channel, entry.nrpn_msb, entry.nrpn_lsb, value
         )
+        self._record("set_direct_parameter_nrpn", start, result)
         if result is None:
             raise Exception(f"Failed to set {param_name}")
+        if result:
+            self._remember(entry, value, nrpn=True)
         return result
 
     def set_direct_parameter(self, param_name: str, value: int) -> bool:
@@ -160,19 +290,26 @@ class BaseSynthController:
             ValueError: If the parameter is not in config.
             Exception: If sending CC fails.
         """
-        if param_name not in self.config:
-            raise ValueError(f"Invalid parameter: {param_name}")
+        start = time.perf_counter_ns() if self.metrics is not None else 0
+        entry = self._direct_entry(param_name)
+        if self._out_of_range(param_name, value):
+            return False
+        if self._is_unchanged(entry, value):
+            logger.debug(f"{param_name} already set to {value}, skipping")
+            self._count_skipped("set_direct_parameter")
+            return True
 
-        param = self.config[param_name]
         try:
-            if not param.midi.cc_msb:
+            if entry.cc is None:
                 logger.error(f"No CC MSB defined for {param_name}")
+                self._record("set_direct_parameter", start, False)
                 return False
 
-            cc_msb = int(param.midi.cc_msb)
-            result = self.digitone_midi.send_cc(self.midi_channel, cc_msb, value)
+            result = self.digitone_midi.send_cc(self.midi_channel, entry.cc, value)
+            self._record("set_direct_parameter", start, result)
             if result:
                 logger.debug(f"Set {param_name} to {value} using CC")
+                self._remember(entry, value)
                 return True
 
             logger.error(f"Failed to set {param_name} using CC")
@@ -180,4 +317,89 @@ class BaseSynthController:
 
         except Exception as e:
             logger.error(f"Failed to set {param_name}: {e}")
+            self._record("set_direct_parameter", start, False)
             raise Exception(f"Failed to set {param_name}") from e
+
+    def _resolve(self, key: ControllerKey) -> ParameterDescriptor:
+        """Return the compiled parameter for a (page, name) or name key."""
+        if isinstance(key, tuple):
+            return self._entry(*key)
+        return self._direct_entry(key)
+
+    def set_parameters(
+        self,
+        values: Mapping[ControllerKey, int],
+        use_nrpn: bool = False,
+        lane: Optional[Lane] = None,
+    ) -> Dict[ControllerKey, ParameterResult]:
+        """
+        Set several parameters at once.
+
+        Every name and value is validated first. The valid changes that the
+        device does not already hold are then sent as one CC or NRPN batch.
+
+        Args:
+            values: New values by (page, name) for page-based parameters, or by
+                name for non-page-based ones.
+            use_nrpn: Send NRPN instead of CC messages.
+            lane: MidiScheduler lane of the batch, e.g. Lane.BULK for a whole
+                patch. Passed on to the MIDI interface only when given.
+
+        Returns:
+            A result per key: True if the value was sent or already set, False if
+            sending failed, or the validation error message.
+        """
+        start = time.perf_counter_ns() if self.metrics is not None else 0
+        results: Dict[ControllerKey, ParameterResult] = {}
+        pending: List[Tuple[ControllerKey, ParameterDescriptor, int]] = []
+
+        for key, value in values.items():
+            try:
+                entry = self._resolve(key)
+            except ValueError as e:
+                results[key] = str(e)
+                continue
+            if not isinstance(value, int) or not entry.accepts(value):
+                results[key] = (
+                    f"Invalid value for {entry.name}: {value}. "
+                    f"Must be between {entry.min_midi}-{entry.max_midi}."
+                )
+            elif not use_nrpn and entry.cc is None:
+                results[key] = f"No CC defined for {entry.name}"
+            elif self._is_unchanged(entry, value, use_nrpn):
+                results[key] = True
+                self._count_skipped("set_parameters")
+            else:
+                pending.append((key, entry, value))
+
+        if not pending:
+            return results
+
+        options = {} if lane is None else {"lane": lane}
+        try:
+            if use_nrpn:
+                sent = self.digitone_midi.send_nrpn_batch(
+                    self.midi_channel,
+                    [
+                        (entry.nrpn_msb, entry.nrpn_lsb, value)
+                        for _, entry, value in pending
+                    ],
+                    **options,
+                )
+            else:
+                sent = self.digitone_midi.send_cc_batch(
+                    self.midi_channel,
+                    [(entry.cc, value) for _, entry, value in pending],
+                    **options,
+                )
+        except Exception as e:
+            logger.error(f"Failed to set {len(pending)} parameters: {e}")
+            sent = False
+        self._record("set_parameters", start, sent)
+
+        for key, entry, value in pending:
+            if sent:
+                self._remember(entry, value, use_nrpn)
+            results[key] = bool(sent)
+        logger.debug(f"Set {len(pending)} parameters in one batch: {bool(sent)}")
+        return results
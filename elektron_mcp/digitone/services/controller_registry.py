@@ -0,0 +1,137 @@
+"""
+Controller registry
+
+Tools used to build a new controller on every call, compiling its parameter
+lookups again each time. The registry keeps one controller per (engine, track,
+device) instead, where the engine is the controller class together with the
+parameter config it was built for.
+
+Loading another machine on a track changes what its parameters mean, so
+set_machine() drops the track's controllers and its shadow state.
+
+Devices are held weakly: cached controllers only keep a weak proxy of their
+device, so a device nobody else uses is collected along with its entries.
+"""
+
+import logging
+import threading
+import weakref
+from typing import Dict, Optional, Tuple, Type, TypeVar
+from weakref import WeakKeyDictionary
+
+from elektron_mcp.digitone.services.base_synth_controller import BaseSynthController
+from elektron_mcp.digitone.services.shadow_state import TRACKS, ShadowState
+
+logger = logging.getLogger(__name__)
+
+C = TypeVar("C", bound=BaseSynthController)
+
+# (controller class, id() of its config, track)
+ControllerKey = Tuple[type, int, int]
+# (config, controller built from it)
+Entry = Tuple[dict, BaseSynthController]
+
+
+class ControllerRegistry:
+    """Caches one controller per (engine, track, device)."""
+
+    def __init__(self):
+        # Controllers are stored with their config, which keeps the config's id()
+        # in the key from being reused while the entry exists
+        self._controllers: "WeakKeyDictionary[object, Dict[ControllerKey, Entry]]" = (
+            WeakKeyDictionary()
+        )
+        self._machines: "WeakKeyDictionary[object, Dict[int, str]]" = (
+            WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def get(
+        self, controller_class: Type[C], config: dict, digitone_midi, track: int
+    ) -> C:
+        """
+        Return the controller for an engine on a track, creating it on first use.
+
+        Args:
+            controller_class: Controller type, e.g. WavetoneController.
+            config: Parameter config the controller is built from.
+            digitone_midi: The MIDI interface (or transport) the tool writes to.
+            track: Track/MIDI channel (1-16).
+
+        Returns:
+            The cached controller. Tracks outside 1-16 get an uncached one, so
+            it can report the invalid channel as before.
+        """
+        if not 1 <= track <= TRACKS:
+            return controller_class(config, digitone_midi, track)
+
+        key = (controller_class, id(config), track)
+        controllers = self._controllers.get(digitone_midi)
+        entry = controllers.get(key) if controllers is not None else None
+        if entry is None:
+            with self._lock:
+                controllers = self._controllers.setdefault(digitone_midi, {})
+                entry = controllers.get(key)
+                if entry is None:
+                    controller = controller_class(config, digitone_midi, track)
+                    # A strong reference would keep the device, the key of its
+                    # own entry, alive forever
+                    controller.digitone_midi = weakref.proxy(digitone_midi)
+                    entry = controllers[key] = (config, controller)
+        return entry[1]
+
+    def machine(self, digitone_midi, track: int) -> Optional[str]:
+        """Return the machine last reported for a track, if any."""
+        return self._machines.get(digitone_midi, {}).get(track)
+
+    def set_machine(self, digitone_midi, track: int, machine: str) -> bool:
+        """
+        Record the machine loaded on a track.
+
+        If it differs from the machine previously recorded, the track's cached
+        controllers and shadow parameter values are dropped.
+
+        Args:
+            digitone_midi: The MIDI interface (or transport) of the device.
+            track: Track/MIDI channel (1-16).
+            machine: Machine name, e.g. 'wavetone' or 'fmtone'.
+
+        Returns:
+            True if the machine changed.
+        """
+        with self._lock:
+            machines = self._machines.setdefault(digitone_midi, {})
+            previous = machines.get(track)
+            machines[track] = machine
+            if previous is None or previous == machine:
+                return False
+            self._drop_track(digitone_midi, track)
+
+        logger.debug(f"Track {track} machine changed from {previous} to {machine}")
+        ShadowState.for_device(digitone_midi).invalidate(track)
+        return True
+
+    def invalidate(self, digitone_midi=None, track: Optional[int] = None) -> None:
+        """
+        Drop cached controllers.
+
+        Args:
+            digitone_midi: Device whose controllers are dropped. None drops all.
+            track: Track whose controllers are dropped. None drops every track.
+        """
+        with self._lock:
+            if digitone_midi is None:
+                self._controllers.clear()
+            elif track is None:
+                self._controllers.pop(digitone_midi, None)
+            else:
+                self._drop_track(digitone_midi, track)
+
+    def _drop_track(self, digitone_midi, track: int) -> None:
+        controllers = self._controllers.get(digitone_midi, {})
+        for key in [key for key in controllers if key[2] == track]:
+            del controllers[key]
+
+
+# Registry shared by the MCP tools
+controller_registry = ControllerRegistry()
@@ -0,0 +1,184 @@
+"""
+Shadow parameter state
+
+Remembers the last value set on each track for each Digitone parameter, so
+controllers can skip sends that would not change anything and the current
+sound can be queried without touching the hardware.
+
+Parameters are identified by their NRPN address. Engines that share a knob
+(e.g. Wavetone TUN1 and FM Tone ALGO are both NRPN 73/1) share a slot, which
+mirrors how the device itself stores them.
+
+A value sent with send_nrpn is encoded as a 14-bit data entry (MSB 0, LSB 64
+for 64), which does not leave the device in the same state as a CC or panel
+change to the same value. Each value therefore records whether it was sent as
+NRPN, and only a send of the same kind and value counts as unchanged.
+"""
+
+import threading
+from array import array
+from itertools import repeat
+from typing import Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from elektron_mcp.midi.async_midi import AsyncDigitoneMIDI
+from elektron_mcp.midi.background_writer import BackgroundMidiWriter
+from elektron_mcp.midi.scheduler import MidiScheduler
+
+TRACKS = 16
+UNKNOWN = -1
+# Set in stored values that were sent as NRPN, above any 14-bit value
+NRPN_FLAG = 0x4000
+VALUE_MASK = NRPN_FLAG - 1
+
+
+def underlying_device(transport):
+    """
+    Return the DigitoneMIDI behind a transport.
+
+    Transports in front of a DigitoneMIDI (BackgroundMidiWriter, MidiScheduler,
+    AsyncDigitoneMIDI) keep it in their ``midi`` attribute.
+    """
+    while isinstance(
+        transport, (AsyncDigitoneMIDI, BackgroundMidiWriter, MidiScheduler)
+    ):
+        transport = transport.midi
+    return transport
+
+
+class ShadowState:
+    """Last known parameter values of one device, for 16 tracks.
+
+    Values live in a single compact array of 16-bit integers laid out slot by
+    slot, with one slot per NRPN address allocated the first time it is used.
+    """
+
+    _devices: "WeakKeyDictionary[object, ShadowState]" = WeakKeyDictionary()
+    _devices_lock = threading.Lock()
+
+    def __init__(self):
+        self._slots: Dict[Tuple[int, int], int] = {}
+        self._values = array("h")
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_device(cls, device) -> "ShadowState":
+        """
+        Return the shadow state shared by every controller using this MIDI device.
+
+        Transports in front of a DigitoneMIDI (BackgroundMidiWriter, MidiScheduler,
+        AsyncDigitoneMIDI) keep it in their ``midi`` attribute and share its state.
+
+        The state forgets a track's values when a write to it fails, which a
+        queued transport only learns after reporting the write as sent, and
+        forgets every value when the device's port is opened or closed.
+
+        Args:
+            device: The DigitoneMIDI interface (or transport in front of it).
+        """
+        device = underlying_device(device)
+        with cls._devices_lock:
+            state = cls._devices.get(device)
+            if state is None:
+                state = cls._devices[device] = cls()
+                add_callback = getattr(device, "add_invalidation_callback", None)
+                if add_callback is not None:
+                    add_callback(state.invalidate)
+            return state
+
+    def _slot(self, nrpn_msb: int, nrpn_lsb: int) -> int:
+        """Return the slot of an NRPN address, allocating it on first use."""
+        address = (nrpn_msb, nrpn_lsb)
+        slot = self._slots.get(address)
+        if slot is None:
+            with self._lock:
+                slot = self._slots.get(address)
+                if slot is None:
+                    slot = len(self._slots)
+                    self._values.extend(repeat(UNKNOWN, TRACKS))
+                    self._slots[address] = slot
+        return slot
+
+    @staticmethod
+    def _track_index(track: int) -> int:
+        if not 1 <= track <= TRACKS:
+            raise ValueError(f"Invalid track: {track}. Must be between 1-{TRACKS}.")
+        return track - 1
+
+    def get(self, track: int, nrpn_msb: int, nrpn_lsb: int) -> Optional[int]:
+        """
+        Return the last known value of a parameter on a track.
+
+        Args:
+            track: Track/MIDI channel (1-16).
+            nrpn_msb: NRPN Parameter MSB of the parameter.
+            nrpn_lsb: NRPN Parameter LSB of the parameter.
+
+        Returns:
+            The value, or None if it is not known.
+        """
+        slot = self._slots.get((nrpn_msb, nrpn_lsb))
+        if slot is None:
+            return None
+        value = self._values[slot * TRACKS + self._track_index(track)]
+        return None if value == UNKNOWN else value & VALUE_MASK
+
+    def set(
+        self, track: int, nrpn_msb: int, nrpn_lsb: int, value: int, nrpn: bool = False
+    ) -> None:
+        """
+        Record the value of a parameter on a track.
+
+        Args:
+            track: Track/MIDI channel (1-16).
+            nrpn_msb: NRPN Parameter MSB of the parameter.
+            nrpn_lsb: NRPN Parameter LSB of the parameter.
+            value: The value, 0-16383.
+            nrpn: The value was sent with send_nrpn. False for CC sends and
+                changes received from the device.
+        """
+        index = self._slot(nrpn_msb, nrpn_lsb) * TRACKS + self._track_index(track)
+        stored = value | NRPN_FLAG if nrpn else value
+        # invalidate() may swap the array: write to the current one
+        with self._lock:
+            self._values[index] = stored
+
+    def matches(
+        self, track: int, nrpn_msb: int, nrpn_lsb: int, value: int, nrpn: bool = False
+    ) -> bool:
+        """
+        Return True if the parameter is known to already hold this value, set
+        the same way (see set()).
+        """
+        slot = self._slots.get((nrpn_msb, nrpn_lsb))
+        if slot is None:
+            return False
+        stored = self._values[slot * TRACKS + self._track_index(track)]
+        if stored == UNKNOWN:
+            return False
+        return stored == (value | NRPN_FLAG if nrpn else value)
+
+    def invalidate(self, track: Optional[int] = None) -> None:
+        """
+        Forget known values, e.g. after loading a pattern or sound on the device.
+
+        Args:
+            track: Track (1-16) to forget. If None, all tracks are forgotten.
+        """
+        with self._lock:
+            if track is None:
+                self._values = array("h", repeat(UNKNOWN, len(self._values)))
+                return
+            track_idx = self._track_index(track)
+            for index in range(track_idx, len(self._values), TRACKS):
+                self._values[index] = UNKNOWN
+
+    def snapshot(self, track: int) -> Dict[Tuple[int, int], int]:
+        """Return every known value on a track, keyed by NRPN (msb, lsb) address."""
+        track_idx = self._track_index(track)
+        values = self._values
+        return {
+            address: values[slot * TRACKS + track_idx] & VALUE_MASK
+            for address, slot in self._slots.items()
+            if values[slot * TRACKS + track_idx] != UNKNOWN
+        }
@@ -0,0 +1,105 @@
+"""
+Keeps the shadow parameter state in sync with changes made on the device.
+
+Parameter changes the Digitone transmits when its knobs are turned are decoded
+back to parameter addresses and written to the shadow state as they arrive, so
+controllers know the current sound without polling or resending it.
+
+Values are recorded on the 7-bit scale of CC messages and tool arguments. An
+incoming NRPN carries that value in its data entry MSB; the LSB only adds
+resolution and is dropped.
+"""
+
+import logging
+from typing import Callable, Optional, Union
+
+import mido
+
+from elektron_mcp.digitone.config.parameter_index import ParameterIndex
+from elektron_mcp.digitone.services.shadow_state import ShadowState
+from elektron_mcp.midi.digitone_midi import (
+    DATA_ENTRY_LSB_CC,
+    DATA_ENTRY_MSB_CC,
+    PARAMETER_SELECT_CCS,
+    DigitoneMIDI,
+)
+from elektron_mcp.midi.nrpn_reassembler import NrpnReassembler
+
+logger = logging.getLogger(__name__)
+
+# CCs consumed by NRPN reassembly, never decoded as plain parameter CCs
+NRPN_CCS = PARAMETER_SELECT_CCS | {DATA_ENTRY_MSB_CC, DATA_ENTRY_LSB_CC}
+
+# Called with (track, nrpn_msb, nrpn_lsb, value) for every decoded change, the
+# value being 7-bit.
+# ParameterIndex.lookup_nrpn() turns the address into parameter names.
+ChangeCallback = Callable[[int, int, int, int], None]
+
+
+class StateListener:
+    """Decodes incoming CC/NRPN traffic into shadow state updates."""
+
+    def __init__(
+        self,
+        digitone_midi: DigitoneMIDI,
+        parameter_index: Union[ParameterIndex, Callable[[], ParameterIndex]],
+        shadow_state: Optional[ShadowState] = None,
+        on_change: Optional[ChangeCallback] = None,
+    ):
+        """
+        Start listening to the device's input port.
+
+        Args:
+            digitone_midi: The DigitoneMIDI interface to listen on.
+            parameter_index: Reverse index used to decode CC numbers, or a function
+                returning it, called when the first plain CC arrives.
+            shadow_state: State to update. Defaults to the device's shared state.
+            on_change: Optional function called for every decoded change.
+        """
+        self.digitone_midi = digitone_midi
+        self.shadow_state = shadow_state or ShadowState.for_device(digitone_midi)
+        self.on_change = on_change
+        self._parameter_index = parameter_index
+        self._reassembler = NrpnReassembler()
+        digitone_midi.add_input_callback(self.handle_message)
+
+    @property
+    def parameter_index(self) -> ParameterIndex:
+        if not isinstance(self._parameter_index, ParameterIndex):
+            self._parameter_index = self._parameter_index()
+        return self._parameter_index
+
+    def close(self) -> None:
+        """Stop listening."""
+        self.digitone_midi.remove_input_callback(self.handle_message)
+        self._reassembler.reset()
+
+    def handle_message(self, msg: mido.Message) -> None:
+        """Process one incoming message."""
+        if msg.type != "control_change":
+            return
+
+        change = self._reassembler.feed(msg.channel, msg.control, msg.value)
+        if change is not None:
+            nrpn_msb, nrpn_lsb, value = change
+            # The 7-bit value is the data entry MSB
+            value >>= 7
+        else:
+            if msg.control in NRPN_CCS:
+                return
+            address = self.parameter_index.cc_to_nrpn(msg.control)
+            if address is None:
+                return
+            (nrpn_msb, nrpn_lsb), value = address, msg.value
+
+        track = msg.channel + 1
+        self.shadow_state.set(track, nrpn_msb, nrpn_lsb, value)
+        logger.debug(
+            "Device changed NRPN %d/%d on track %d to %d",
+            nrpn_msb,
+            nrpn_lsb,
+            track,
+            value,
+        )
+        if self.on_change is not None:
+            self.on_change(track, nrpn_msb, nrpn_lsb, value)
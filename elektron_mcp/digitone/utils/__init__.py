@@ -4,6 +4,10 @@ from .parameter_utils import (
     create_parameter_group,
     setup_filter_parameters,
     create_param_from_dict,
+    iter_parameters,
+    iter_controller_configs,
+    iter_section_configs,
+    iter_group_parameters,
 )
 
 __all__ = [
@@ -12,4 +16,8 @@ __all__ = [
     "create_parameter_group",
     "setup_filter_parameters",
     "create_param_from_dict",
+    "iter_parameters",
+    "iter_controller_configs",
+    "iter_section_configs",
+    "iter_group_parameters",
 ]
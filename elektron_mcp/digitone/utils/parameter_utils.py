@@ -1,7 +1,14 @@
+from typing import Iterator, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
 from elektron_mcp.digitone.models.models import (
     MidiMapping,
     DigitoneParams,
+    DigitoneConfig,
     ParameterGroup,
+    SynthParameters,
+    LfoParameters,
 )
 
 
@@ -97,3 +104,72 @@ def setup_filter_parameters(filter_obj, params_dict):
     filter_obj.parameters = {
         name: create_param_from_dict(param) for name, param in params_dict.items()
     }
+
+
+def iter_section_configs(
+    section: str, value: BaseModel
+) -> Iterator[Tuple[str, Optional[str], dict]]:
+    """
+    Walk the parameter dictionaries of one config section.
+
+    Yields (section, group, controller_config) tuples, see iter_controller_configs.
+    """
+    if isinstance(value, SynthParameters):
+        yield section, None, value.pages
+    elif isinstance(value, LfoParameters):
+        for group, params in value.lfo_groups.items():
+            yield section, group, params
+    else:
+        yield section, None, value.parameters
+
+
+def iter_controller_configs(
+    config: DigitoneConfig,
+) -> Iterator[Tuple[str, Optional[str], dict]]:
+    """
+    Walk the parameter dictionaries controllers are built from.
+
+    Yields (section, group, controller_config) tuples where section is the config
+    field (e.g. 'wavetone', 'amp_page', 'lfo'), group is the LFO group key or None,
+    and controller_config is a dict of pages (synth engines) or of parameters.
+    """
+    for section in DigitoneConfig.model_fields:
+        yield from iter_section_configs(section, getattr(config, section))
+
+
+def iter_group_parameters(
+    controller_config: dict, group: Optional[str] = None
+) -> Iterator[Tuple[Union[str, Tuple[str, str]], Optional[str], str, DigitoneParams]]:
+    """
+    Walk the parameters of one controller config.
+
+    Yields (key, page, name, param) tuples. For page-based configs the key is
+    (page, name) and page is the page key; otherwise the key is the name and page
+    is group. Nested parameters are named 'GROUP.param'.
+    """
+    for key, value in controller_config.items():
+        if isinstance(value, ParameterGroup):
+            for name, param in value.parameters.items():
+                if isinstance(param, dict):
+                    for nested_name, nested_param in param.items():
+                        nested_key = f"{name}.{nested_name}"
+                        yield (key, nested_key), key, nested_key, nested_param
+                else:
+                    yield (key, name), key, name, param
+        else:
+            yield key, group, key, value
+
+
+def iter_parameters(
+    config: DigitoneConfig,
+) -> Iterator[Tuple[str, Optional[str], str, DigitoneParams]]:
+    """
+    Walk every parameter of a Digitone configuration.
+
+    Yields (section, page, name, param) tuples where section is the config field
+    (e.g. 'wavetone', 'amp_page', 'lfo'), page is the page or LFO group key, or
+    None for flat sections, and nested parameters are named 'GROUP.param'.
+    """
+    for section, group, controller_config in iter_controller_configs(config):
+        for _, page, name, param in iter_group_parameters(controller_config, group):
+            yield section, page, name, param
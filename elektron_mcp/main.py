@@ -1,39 +1,41 @@
 import sys
-from elektron_mcp.mcp_server.server import mcp
-from elektron_mcp.midi.digitone_midi import DigitoneMIDI
+from elektron_mcp.mcp_server.server import connection, mcp
+from elektron_mcp.midi.connection import MidiConnection
 
 
-def check_midi_connection():
-    """Verify MIDI connection before starting the server"""
-    try:
-        midi = DigitoneMIDI()
-        if not midi.connected:
-            print(
-                "ERROR: Could not connect to Digitone. Please check your USB connection.",
-                file=sys.stderr,
-            )
-            print(f"Available MIDI ports: {midi.list_ports()}", file=sys.stderr)
-            return False
+def report_midi_connection(connection: MidiConnection) -> bool:
+    """Print the outcome of a MIDI connection attempt"""
+    if not connection.connected:
         print(
-            f"Successfully connected to MIDI device: {midi.output_port}",
+            "ERROR: Could not connect to Digitone. Please check your USB connection.",
+            file=sys.stderr,
+        )
+        if connection.error:
+            print(f"ERROR connecting to MIDI: {connection.error}", file=sys.stderr)
+        try:
+            print(f"Available MIDI ports: {connection.list_ports()}", file=sys.stderr)
+        except Exception as e:
+            print(f"ERROR listing MIDI ports: {str(e)}", file=sys.stderr)
+        print(
+            "MIDI connection failed. Server is running but may not function correctly.",
             file=sys.stderr,
         )
-        return True
-    except Exception as e:
-        print(f"ERROR connecting to MIDI: {str(e)}", file=sys.stderr)
         return False
+    print(
+        f"Successfully connected to MIDI device: {connection.device.output_port}",
+        file=sys.stderr,
+    )
+    return True
 
 
 def main():
     """Entry point for the elektron-mcp command"""
     print("Starting Elektron MCP server...", file=sys.stderr)
 
-    # Verify MIDI connection before starting server
-    if not check_midi_connection():
-        print(
-            "MIDI connection failed. Server will start but may not function correctly.",
-            file=sys.stderr,
-        )
+    # Probe the MIDI device in the background, so the MCP handshake does not
+    # wait for it, and report the result once it is known
+    connection.add_done_callback(report_midi_connection)
+    connection.start()
 
     try:
         mcp.run()
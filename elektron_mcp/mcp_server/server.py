@@ -2,26 +2,85 @@
 MCP server configuration and initialization.
 """
 
-from mcp.server.fastmcp import FastMCP
+import atexit
+import os
 
-from elektron_mcp.midi.digitone_midi import DigitoneMIDI
-from elektron_mcp.tools.lfo_tool import register_lfo_tools
-from elektron_mcp.tools.wavetone_tool import register_wavetone_tools
-from elektron_mcp.tools.filter_tool import register_filter_tools
-from elektron_mcp.tools.amp_tool import register_amp_tools
-from elektron_mcp.tools.fx_tool import register_fx_tools
+from elektron_mcp.digitone.config.config import get_digitone_index
+from elektron_mcp.digitone.services.state_listener import StateListener
+from elektron_mcp.mcp_server.traced_mcp import TracedFastMCP
+from elektron_mcp.midi.async_midi import AsyncDigitoneMIDI
+from elektron_mcp.midi.backends import get_backend
+from elektron_mcp.midi.background_writer import BackgroundMidiWriter
+from elektron_mcp.midi.connection import shared_connection
+from elektron_mcp.midi.metrics import Metrics, serve_prometheus
+from elektron_mcp.midi.scheduler import MidiScheduler
+from elektron_mcp.midi.tracing import Tracer, set_tracer
+from elektron_mcp.midi.wire_log import WireRecorder
+from elektron_mcp.tools.generated_tools import parse_sections
+from elektron_mcp.tools.metrics_resource import register_metrics_resources
+from elektron_mcp.tools.registration import FULL_MODE, register_tools
 
 
 # Initialize MCP and MIDI
-mcp = FastMCP("Digitone 2")
-midi = DigitoneMIDI()
-
-# Register all tools
-register_wavetone_tools(mcp, midi)
-register_filter_tools(mcp, midi)
-register_amp_tools(mcp, midi)
-register_fx_tools(mcp, midi)
-register_lfo_tools(mcp, midi)
+mcp = TracedFastMCP("Digitone 2")
+
+# Optionally trace tool calls down to the port writes, for Perfetto
+if os.environ.get("ELEKTRON_MCP_TRACE"):
+    tracer = Tracer(float(os.environ.get("ELEKTRON_MCP_TRACE_SAMPLE_RATE", "1")))
+    set_tracer(tracer)
+    atexit.register(tracer.export, os.environ["ELEKTRON_MCP_TRACE"])
+
+# Optionally record all MIDI traffic for replaying a session later
+recorder = None
+if os.environ.get("ELEKTRON_MCP_WIRE_LOG"):
+    recorder = WireRecorder(os.environ["ELEKTRON_MCP_WIRE_LOG"])
+    atexit.register(recorder.close)
+
+# Optionally count MIDI traffic and time every send
+metrics = None
+metrics_port = os.environ.get("ELEKTRON_MCP_METRICS_PORT")
+if os.environ.get("ELEKTRON_MCP_METRICS") == "1" or metrics_port:
+    metrics = Metrics()
+    register_metrics_resources(mcp, metrics)
+    if metrics_port:
+        serve_prometheus(metrics, int(metrics_port))
+
+# The process-wide connection; its port is opened in the background on start()
+# or by the first write, so importing the server does not probe the hardware
+connection = shared_connection(
+    backend=get_backend(os.environ.get("ELEKTRON_MCP_MIDI_BACKEND", "mido")),
+    recorder=recorder,
+    metrics=metrics,
+)
+device = connection.device
+midi = device
+
+# Optionally pace output for slow links such as DIN MIDI (3125 bytes/s)
+if os.environ.get("ELEKTRON_MCP_MIDI_BYTES_PER_SECOND"):
+    midi = MidiScheduler(
+        midi, bytes_per_second=float(os.environ["ELEKTRON_MCP_MIDI_BYTES_PER_SECOND"])
+    )
+
+# Optionally hand writes to a background thread that drops stale values
+if os.environ.get("ELEKTRON_MCP_BACKGROUND_WRITER") == "1":
+    midi = BackgroundMidiWriter(midi)
+
+# Optionally keep port writes off the event loop, awaiting them or not
+async_midi = os.environ.get("ELEKTRON_MCP_ASYNC_MIDI")
+if async_midi in ("1", "enqueue"):
+    midi = AsyncDigitoneMIDI(midi, wait=async_midi == "1")
+
+# Keep the shadow parameter state in sync with knob changes on the device
+# The index covers every engine, so it is only built once CC traffic arrives
+state_listener = StateListener(device, get_digitone_index)
+
+# Register the per-parameter tools, or the compact generic ones
+register_tools(
+    mcp,
+    midi,
+    os.environ.get("ELEKTRON_MCP_TOOLS", FULL_MODE),
+    parse_sections(os.environ.get("ELEKTRON_MCP_SECTIONS")),
+)
 
 # Export the configured MCP server
 __all__ = ["mcp"]
@@ -0,0 +1,21 @@
+"""
+FastMCP server that traces tool calls.
+
+Each tool call is the first span of a trace (see elektron_mcp.midi.tracing),
+covering FastMCP's argument validation, the tool itself and the conversion of
+its result. Without a tracer it behaves exactly like FastMCP.
+"""
+
+from typing import Any, Dict
+
+from mcp.server.fastmcp import FastMCP
+
+from elektron_mcp.midi.tracing import span
+
+
+class TracedFastMCP(FastMCP):
+    """FastMCP with a span around every tool call."""
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]):
+        with span(f"tool:{name}", "mcp"):
+            return await super().call_tool(name, arguments)
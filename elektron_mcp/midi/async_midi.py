@@ -0,0 +1,301 @@
+"""
+Asyncio MIDI transport
+
+FastMCP serves every client from one asyncio event loop. Tool handlers that
+write to the port inline block that loop, so one slow write stalls every other
+request. AsyncDigitoneMIDI runs all port work on a dedicated I/O thread
+instead: async tool handlers hand their controller call to the thread with
+run() and either await its result or return as soon as it is queued.
+
+Calls run on the I/O thread one at a time, in submission order, so the
+controllers, the shadow state and the port only ever see one writer. Each call
+runs in a copy of its submitter's context, so a trace started by the tool call
+(see elektron_mcp.midi.tracing) continues on the I/O thread.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, Optional, Sequence, Tuple, TypeVar
+
+from elektron_mcp.midi.background_writer import BackgroundMidiWriter
+from elektron_mcp.midi.digitone_midi import DigitoneMIDI
+from elektron_mcp.midi.scheduler import MidiScheduler
+from elektron_mcp.midi.tracing import span
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TransportClosedError(RuntimeError):
+    """Raised for calls submitted to an AsyncDigitoneMIDI after close()."""
+
+
+class AsyncDigitoneMIDI:
+    """DigitoneMIDI front end that performs all writes on one I/O thread.
+
+    Exposes the same send methods as DigitoneMIDI, so it can be handed to the
+    controllers in its place. Called on the I/O thread they write directly;
+    called from any other thread they queue the write and return True, and
+    transport errors are logged. The asend_* coroutines await the write.
+    """
+
+    def __init__(self, midi: DigitoneMIDI, wait: bool = True):
+        """
+        Start the I/O thread.
+
+        Args:
+            midi: The DigitoneMIDI interface (or transport) that performs the
+                actual writes.
+            wait: Whether run() awaits the call by default. False makes tool
+                handlers return as soon as their call is queued.
+        """
+        self.midi = midi
+        self.wait = wait
+        self._queue: "queue.SimpleQueue[Optional[Tuple]]" = queue.SimpleQueue()
+        self._closed = False
+        # Makes the closed check and the queueing of a call one step, so that
+        # no call is queued behind the stop sentinel of close()
+        self._submit_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="digitone-midi-io", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        """Approximate number of calls waiting for the I/O thread."""
+        return self._queue.qsize()
+
+    def in_io_thread(self) -> bool:
+        """Return True when called on the I/O thread."""
+        return threading.current_thread() is self._thread
+
+    def submit(self, func: Callable[..., T], *args) -> "Future[T]":
+        """
+        Queue a blocking call for the I/O thread.
+
+        Returns:
+            A concurrent.futures.Future with the call's result or exception,
+            a TransportClosedError once the transport is closed.
+        """
+        future: "Future[T]" = Future()
+        with self._submit_lock:
+            if self._closed:
+                future.set_exception(TransportClosedError("MIDI I/O thread is closed"))
+            else:
+                self._queue.put((future, contextvars.copy_context(), func, args))
+        return future
+
+    async def run(self, func: Callable[..., T], *args, wait: Optional[bool] = None):
+        """
+        Run a blocking call, e.g. a controller method, on the I/O thread.
+
+        Args:
+            func: The callable to run.
+            *args: Its arguments.
+            wait: Await the result (True) or return True once the call is
+                queued (False). Defaults to the transport's wait setting.
+
+        Returns:
+            The call's result, or True if it was only queued.
+
+        Raises:
+            Exception: Whatever the call raised, if awaited.
+        """
+        if self.in_io_thread():
+            return func(*args)
+        future = self.submit(func, *args)
+        if not (self.wait if wait is None else wait):
+            future.add_done_callback(self._log_failure)
+            return True
+        return await asyncio.wrap_future(future)
+
+    def _log_failure(self, future: Future) -> None:
+        if future.exception() is not None:
+            logger.error(f"Queued MIDI call failed: {future.exception()}")
+        elif future.result() is False:
+            logger.warning("Queued MIDI write was not sent")
+
+    def _call(self, func: Callable[..., bool], *args) -> bool:
+        if self.in_io_thread():
+            return func(*args)
+        future = self.submit(func, *args)
+        if future.done():
+            self._log_failure(future)
+            return False
+        future.add_done_callback(self._log_failure)
+        return True
+
+    def send_cc(self, channel: int, cc: int, value: int) -> bool:
+        """Send a Control Change message. See DigitoneMIDI.send_cc."""
+        return self._call(self.midi.send_cc, channel, cc, value)
+
+    def send_nrpn(self, channel: int, nrpn_msb: int, nrpn_lsb: int, value: int) -> bool:
+        """Send an NRPN parameter change. See DigitoneMIDI.send_nrpn."""
+        return self._call(self.midi.send_nrpn, channel, nrpn_msb, nrpn_lsb, value)
+
+    def send_cc_batch(
+        self,
+        channel: int,
+        messages: Sequence[Tuple[int, int]],
+        lane: Optional[int] = None,
+    ) -> bool:
+        """
+        Send several Control Change messages. See DigitoneMIDI.send_cc_batch.
+
+        A lane is passed on to the wrapped interface, e.g. a MidiScheduler.
+        """
+        args = (
+            (channel, list(messages))
+            if lane is None
+            else (channel, list(messages), lane)
+        )
+        return self._call(self.midi.send_cc_batch, *args)
+
+    def send_nrpn_batch(
+        self,
+        channel: int,
+        messages: Sequence[Tuple[int, int, int]],
+        lane: Optional[int] = None,
+    ) -> bool:
+        """
+        Send several NRPN parameter changes. See DigitoneMIDI.send_nrpn_batch.
+
+        A lane is passed on to the wrapped interface, e.g. a MidiScheduler.
+        """
+        args = (
+            (channel, list(messages))
+            if lane is None
+            else (channel, list(messages), lane)
+        )
+        return self._call(self.midi.send_nrpn_batch, *args)
+
+    def send_message(self, data: Sequence[int]) -> bool:
+        """Send raw MIDI bytes. See DigitoneMIDI.send_message."""
+        return self._call(self.midi.send_message, list(data))
+
+    async def asend_cc(self, channel: int, cc: int, value: int) -> bool:
+        """Send a Control Change message and await the write."""
+        return await self.run(self.midi.send_cc, channel, cc, value, wait=True)
+
+    async def asend_nrpn(
+        self, channel: int, nrpn_msb: int, nrpn_lsb: int, value: int
+    ) -> bool:
+        """Send an NRPN parameter change and await the write."""
+        return await self.run(
+            self.midi.send_nrpn, channel, nrpn_msb, nrpn_lsb, value, wait=True
+        )
+
+    async def asend_cc_batch(
+        self, channel: int, messages: Sequence[Tuple[int, int]]
+    ) -> bool:
+        """Send several Control Change messages and await the writes."""
+        return await self.run(
+            self.midi.send_cc_batch, channel, list(messages), wait=True
+        )
+
+    async def asend_nrpn_batch(
+        self, channel: int, messages: Sequence[Tuple[int, int, int]]
+    ) -> bool:
+        """Send several NRPN parameter changes and await the writes."""
+        return await self.run(
+            self.midi.send_nrpn_batch, channel, list(messages), wait=True
+        )
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every call queued so far has run.
+
+        Returns:
+            bool: True if the queue drained before the timeout, False otherwise.
+        """
+        if self.in_io_thread():
+            return True
+        future = self.submit(lambda: None)
+        try:
+            future.result(timeout)
+        except Exception:
+            return False
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Run the remaining queued calls and stop the I/O thread."""
+        with self._submit_lock:
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, context, func, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(context.run(func, *args))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+async def run_midi_call(midi, func: Callable[..., T], *args) -> T:
+    """
+    Run a blocking controller call from an async tool handler.
+
+    On an AsyncDigitoneMIDI the call runs on its I/O thread, so the event loop
+    keeps serving other clients while the port is busy. Other transports run
+    it inline, as before, unless the device is not connected yet: a send then
+    waits for the connection (see elektron_mcp.midi.connection), so the call
+    runs on a worker thread instead of stalling the loop.
+
+    Args:
+        midi: The MIDI interface the tools were registered with.
+        func: The blocking call, e.g. a bound controller method.
+        *args: Its arguments.
+
+    Returns:
+        The call's result, or False if the transport or the event loop's
+        executor was shut down before the call could run.
+    """
+    if isinstance(midi, AsyncDigitoneMIDI):
+        with span("run_on_io_thread", "midi"):
+            try:
+                return await midi.run(_traced_call, func, *args)
+            except TransportClosedError as e:
+                logger.error(f"MIDI call not run: {e}")
+                return False
+    if not _device_connected(midi):
+        with span("wait_for_connection", "midi"):
+            call = functools.partial(
+                contextvars.copy_context().run, _traced_call, func, *args
+            )
+            try:
+                pending = asyncio.get_running_loop().run_in_executor(None, call)
+            except RuntimeError as e:
+                # The executor is shut down, e.g. the server is stopping
+                logger.error(f"MIDI call not run: {e}")
+                return False
+            return await pending
+    return _traced_call(func, *args)
+
+
+def _device_connected(midi) -> bool:
+    """Return whether the DigitoneMIDI behind a transport has its port open."""
+    # Transports keep the interface they write to in their midi attribute
+    while isinstance(midi, (BackgroundMidiWriter, MidiScheduler)):
+        midi = midi.midi
+    return not isinstance(midi, DigitoneMIDI) or midi.connected
+
+
+def _traced_call(func: Callable[..., T], *args) -> T:
+    """Call func in a span named after it, e.g. 'AmpController.set_parameters'."""
+    name = getattr(func, "__qualname__", repr(func)).rpartition(".<locals>.")[2]
+    with span(name, "controller"):
+        return func(*args)
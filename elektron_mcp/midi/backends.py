@@ -0,0 +1,280 @@
+"""
+MIDI backends
+
+DigitoneMIDI opens its ports through a backend: any object with mido's
+get_input_names, get_output_names, open_input and open_output functions. The
+default is the mido module itself, which talks to real devices. The backends
+here let the rest of the stack run, and be benchmarked, on a machine without
+a Digitone:
+
+- MemoryBackend records every write with a perf_counter_ns() timestamp and can
+  feed messages to the input callbacks as if the device had sent them.
+- LoopbackBackend additionally delivers every write to the input port of the
+  same name, in process.
+- VirtualPortBackend creates a virtual rtmidi port and connects to it, so
+  writes make a round trip through the operating system's MIDI stack (ALSA
+  on Linux).
+
+Memory ports expose send_raw(), which DigitoneMIDI uses as its raw byte writer,
+so they exercise the same encode and write path as an rtmidi port: one write
+per message, unless created with coalesce=True. VirtualPortBackend ports are
+mido rtmidi ports, written one message per call like a real device.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Union
+
+import mido
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT_NAME = "Digitone (memory)"
+
+Clock = Callable[[], int]
+
+
+class WireRecord(NamedTuple):
+    timestamp_ns: int  # time.perf_counter_ns() when the write happened
+    data: bytes
+
+
+class MemoryOutputPort:
+    """Output port that records raw writes instead of sending them."""
+
+    def __init__(
+        self,
+        name: str,
+        coalesce: bool = False,
+        clock: Clock = time.perf_counter_ns,
+        on_write: Optional[Callable[[bytes], None]] = None,
+    ):
+        """
+        Args:
+            name: Port name.
+            coalesce: Whether DigitoneMIDI may write several messages at once.
+                False, the default, records one write per message, like every
+                rtmidi port, which rejects longer writes that are not SysEx.
+            clock: Nanosecond timestamp source.
+            on_write: Called with the bytes of every write, e.g. for loopback.
+        """
+        self.name = name
+        self.coalesces_writes = coalesce
+        self.closed = False
+        self.records: List[WireRecord] = []
+        self._clock = clock
+        self._on_write = on_write
+        self._lock = threading.Lock()
+
+    def send_raw(self, data: Sequence[int]) -> None:
+        """Record a write of encoded MIDI bytes."""
+        if self.closed:
+            raise IOError(f"Port {self.name} is closed")
+        data = bytes(data)
+        with self._lock:
+            self.records.append(WireRecord(self._clock(), data))
+        if self._on_write is not None:
+            self._on_write(data)
+
+    def send(self, msg: mido.Message) -> None:
+        """Record a mido message, like a mido output port."""
+        self.send_raw(msg.bytes())
+
+    @property
+    def bytes_sent(self) -> int:
+        """Total number of bytes written."""
+        with self._lock:
+            return sum(len(record.data) for record in self.records)
+
+    def wire_bytes(self) -> bytes:
+        """Everything written so far, as one byte string."""
+        with self._lock:
+            return b"".join(record.data for record in self.records)
+
+    def messages(self) -> List[mido.Message]:
+        """Everything written so far, parsed into mido messages."""
+        return mido.parse_all(self.wire_bytes())
+
+    def clear(self) -> None:
+        """Forget the recorded writes."""
+        with self._lock:
+            self.records.clear()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class MemoryInputPort:
+    """Input port that hands messages to its callback when they are fed in."""
+
+    def __init__(
+        self, name: str, callback: Optional[Callable[[mido.Message], None]] = None
+    ):
+        self.name = name
+        self.callback = callback
+        self.closed = False
+        self._parser = mido.Parser()
+        self._lock = threading.Lock()
+
+    def feed(self, data: Union[mido.Message, Sequence[int]]) -> None:
+        """Deliver a message, or raw bytes holding any number of messages."""
+        if self.closed or self.callback is None:
+            return
+        if isinstance(data, mido.Message):
+            messages = [data]
+        else:
+            with self._lock:
+                self._parser.feed(bytes(data))
+                messages = list(self._parser)
+        for msg in messages:
+            self.callback(msg)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class MemoryBackend:
+    """Backend whose ports live in memory. See the module docstring."""
+
+    def __init__(
+        self,
+        port_names: Sequence[str] = (DEFAULT_PORT_NAME,),
+        coalesce: bool = False,
+        clock: Clock = time.perf_counter_ns,
+    ):
+        """
+        Args:
+            port_names: Names of the ports the backend lists.
+            coalesce: See MemoryOutputPort.
+            clock: Nanosecond timestamp source of the recorded writes.
+        """
+        self.port_names = list(port_names)
+        self.coalesce = coalesce
+        self.clock = clock
+        # Most recently opened port of each name
+        self.outputs: Dict[str, MemoryOutputPort] = {}
+        self.inputs: Dict[str, MemoryInputPort] = {}
+
+    def get_input_names(self) -> List[str]:
+        return list(self.port_names)
+
+    def get_output_names(self) -> List[str]:
+        return list(self.port_names)
+
+    def _check_name(self, name: Optional[str]) -> str:
+        if name is None:
+            return self.port_names[0]
+        if name not in self.port_names:
+            raise IOError(f"Unknown port: {name}")
+        return name
+
+    def open_output(self, name: Optional[str] = None, **kwargs) -> MemoryOutputPort:
+        name = self._check_name(name)
+        port = MemoryOutputPort(name, self.coalesce, self.clock)
+        self.outputs[name] = port
+        return port
+
+    def open_input(
+        self,
+        name: Optional[str] = None,
+        callback: Optional[Callable[[mido.Message], None]] = None,
+        **kwargs,
+    ) -> MemoryInputPort:
+        name = self._check_name(name)
+        port = MemoryInputPort(name, callback)
+        self.inputs[name] = port
+        return port
+
+    def receive(
+        self, data: Union[mido.Message, Sequence[int]], name: Optional[str] = None
+    ) -> None:
+        """
+        Simulate the device sending a message, e.g. a knob turn.
+
+        Args:
+            data: A mido message or raw MIDI bytes.
+            name: Input port name. Defaults to the first port.
+        """
+        port = self.inputs.get(self._check_name(name))
+        if port is not None:
+            port.feed(data)
+
+
+class LoopbackBackend(MemoryBackend):
+    """Memory backend that echoes every write to the input port of the same name.
+
+    Writes are delivered synchronously, on the writing thread.
+    """
+
+    def open_output(self, name: Optional[str] = None, **kwargs) -> MemoryOutputPort:
+        name = self._check_name(name)
+        port = MemoryOutputPort(
+            name,
+            self.coalesce,
+            self.clock,
+            on_write=lambda data: self.receive(data, name),
+        )
+        self.outputs[name] = port
+        return port
+
+
+class VirtualPortBackend:
+    """Backend that loops writes back through a virtual rtmidi port.
+
+    The output is a virtual port created by this process and the input
+    connects to it, so every write goes through the OS MIDI stack. Needs
+    python-rtmidi and an OS MIDI service (ALSA sequencer on Linux).
+    """
+
+    def __init__(self, port_name: str = "Digitone (virtual loopback)"):
+        self.port_name = port_name
+        self._output = None
+
+    def get_input_names(self) -> List[str]:
+        return [self.port_name]
+
+    def get_output_names(self) -> List[str]:
+        return [self.port_name]
+
+    def open_output(self, name: Optional[str] = None, **kwargs):
+        self._output = mido.open_output(name or self.port_name, virtual=True)
+        return self._output
+
+    def open_input(
+        self,
+        name: Optional[str] = None,
+        callback: Optional[Callable[[mido.Message], None]] = None,
+        **kwargs,
+    ):
+        name = name or self.port_name
+        # The virtual port is listed under a client-qualified name
+        matches = [port for port in mido.get_input_names() if name in port]
+        if not matches:
+            raise IOError(f"Virtual port {name} not found, open the output first")
+        return mido.open_input(matches[0], callback=callback)
+
+
+BACKENDS = {
+    "mido": lambda: mido,
+    "memory": MemoryBackend,
+    "loopback": LoopbackBackend,
+    "virtual": VirtualPortBackend,
+}
+
+
+def get_backend(name: str):
+    """
+    Create a backend by name: 'mido' (real devices), 'memory', 'loopback' or
+    'virtual'.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    try:
+        factory = BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Invalid MIDI backend: {name}. Must be one of {', '.join(BACKENDS)}."
+        ) from None
+    return factory()
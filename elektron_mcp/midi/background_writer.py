@@ -0,0 +1,264 @@
+"""
+Background MIDI writer
+
+Queues CC and NRPN writes for a DigitoneMIDI interface and sends them from a
+dedicated worker thread, so callers return as soon as a write is queued.
+
+Pending writes are keyed by (channel, parameter). A newer value for a key that
+has not reached the wire yet replaces the older one, so bursts of changes to
+the same parameter only transmit the latest value.
+
+A parameter written both as CC and as NRPN has a key for each, since the
+writer does not know which CC controls which NRPN address. Each channel's
+pending writes are therefore kept in the order of their latest update: a
+newer value moves its key behind the other writes on the channel, so the
+newest write to a parameter always reaches the wire last, whichever way it
+was sent.
+"""
+
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from elektron_mcp.midi.digitone_midi import DigitoneMIDI, _check_cc, _check_nrpn
+
+logger = logging.getLogger(__name__)
+
+CC_KIND = "cc"
+NRPN_KIND = "nrpn"
+
+
+class BackgroundMidiWriter:
+    """Latest-value-wins write queue in front of a DigitoneMIDI interface.
+
+    Exposes the same send methods as DigitoneMIDI, so it can be handed to the
+    controllers in its place. The send methods return True once the write is
+    queued; transport errors are logged by the worker thread, and the failed
+    track's values dropped from the shadow state by DigitoneMIDI.
+    """
+
+    def __init__(
+        self,
+        midi: DigitoneMIDI,
+        max_pending: int = 1024,
+        enqueue_timeout: Optional[float] = 1.0,
+    ):
+        """
+        Start the writer thread.
+
+        Args:
+            midi: The DigitoneMIDI interface that performs the actual writes.
+            max_pending: Maximum number of distinct (channel, parameter) keys
+                waiting to be sent. Updates to a pending key never block.
+            enqueue_timeout: Seconds to wait for room in a full queue before
+                dropping the write. None waits forever.
+        """
+        self.midi = midi
+        self.max_pending = max_pending
+        self.enqueue_timeout = enqueue_timeout
+        # Pending writes in arrival order: (kind, channel, address) -> value
+        self._pending: Dict[Tuple, int] = {}
+        self._busy = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="digitone-midi-writer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        """Number of writes waiting to be sent."""
+        with self._condition:
+            return len(self._pending)
+
+    def _enqueue(self, items: Sequence[Tuple[Tuple, int]]) -> bool:
+        """
+        Queue (key, value) items, replacing pending values for the same key.
+
+        The items are queued together or not at all: a call waits until the
+        queue has room for every new key, and queues nothing if it times out
+        or the writer is closed meanwhile.
+        """
+        keys = {key for key, _ in items}
+        with self._condition:
+
+            def room() -> bool:
+                new_keys = sum(key not in self._pending for key in keys)
+                return len(self._pending) + new_keys <= self.max_pending
+
+            if self._closed:
+                logger.error("MIDI writer is closed")
+                return False
+            if len(keys) > self.max_pending:
+                logger.warning(f"MIDI write of {len(keys)} keys exceeds the queue size")
+                return False
+            has_room = self._condition.wait_for(
+                lambda: room() or self._closed, self.enqueue_timeout
+            )
+            if self._closed:
+                logger.error("MIDI writer is closed")
+                return False
+            if not has_room:
+                logger.warning(f"MIDI write queue full, dropping {len(keys)} writes")
+                return False
+            for key, value in items:
+                # Re-inserted, so the key moves behind older writes
+                self._pending.pop(key, None)
+                self._pending[key] = value
+            self._condition.notify_all()
+        return True
+
+    @staticmethod
+    def _check_channel(channel: int) -> bool:
+        if 1 <= channel <= 16:
+            return True
+        logger.error(f"Invalid channel: {channel}. Must be between 1-16.")
+        return False
+
+    @staticmethod
+    def _check_data(check, messages: Sequence[Tuple[int, ...]]) -> bool:
+        """
+        Return True if every message passes check (_check_cc or _check_nrpn).
+
+        Writes are merged with other callers' into one batch per channel, which
+        DigitoneMIDI rejects as a whole, so bad data is refused when queued.
+        """
+        try:
+            for message in messages:
+                check(*message)
+        except ValueError as e:
+            logger.error(f"Invalid MIDI write: {e}")
+            return False
+        return True
+
+    def send_cc(self, channel: int, cc: int, value: int) -> bool:
+        """Queue a Control Change message. See DigitoneMIDI.send_cc."""
+        if not self._check_channel(channel) or not self._check_data(
+            _check_cc, [(cc, value)]
+        ):
+            return False
+        return self._enqueue([((CC_KIND, channel, cc), value)])
+
+    def send_nrpn(self, channel: int, nrpn_msb: int, nrpn_lsb: int, value: int) -> bool:
+        """Queue an NRPN parameter change. See DigitoneMIDI.send_nrpn."""
+        if not self._check_channel(channel) or not self._check_data(
+            _check_nrpn, [(nrpn_msb, nrpn_lsb, value)]
+        ):
+            return False
+        return self._enqueue([((NRPN_KIND, channel, (nrpn_msb, nrpn_lsb)), value)])
+
+    def send_cc_batch(
+        self,
+        channel: int,
+        messages: Sequence[Tuple[int, int]],
+        lane: Optional[int] = None,
+    ) -> bool:
+        """
+        Queue several Control Change messages. See DigitoneMIDI.send_cc_batch.
+
+        The writer has a single queue, so lane is ignored.
+        """
+        if not self._check_channel(channel) or not self._check_data(
+            _check_cc, messages
+        ):
+            return False
+        return self._enqueue(
+            [((CC_KIND, channel, cc), value) for cc, value in messages]
+        )
+
+    def send_nrpn_batch(
+        self,
+        channel: int,
+        messages: Sequence[Tuple[int, int, int]],
+        lane: Optional[int] = None,
+    ) -> bool:
+        """
+        Queue several NRPN parameter changes. See DigitoneMIDI.send_nrpn_batch.
+
+        The writer has a single queue, so lane is ignored.
+        """
+        if not self._check_channel(channel) or not self._check_data(
+            _check_nrpn, messages
+        ):
+            return False
+        return self._enqueue(
+            [
+                ((NRPN_KIND, channel, (nrpn_msb, nrpn_lsb)), value)
+                for nrpn_msb, nrpn_lsb, value in messages
+            ]
+        )
+
+    def send_message(self, data: Sequence[int]) -> bool:
+        """
+        Send a raw MIDI message such as a note or clock. See DigitoneMIDI.send_message.
+
+        Raw messages are not parameter writes, so they are not queued or
+        coalesced: they are written right away, ahead of any pending writes.
+        """
+        return self.midi.send_message(data)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued write has been handed to the MIDI interface.
+
+        Returns:
+            bool: True if the queue drained before the timeout, False otherwise.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._busy, timeout
+            )
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Send the remaining queued writes and stop the worker thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                pending, self._pending = self._pending, {}
+                self._busy = True
+                # Wake producers blocked on a full queue
+                self._condition.notify_all()
+            try:
+                self._send(pending)
+            except Exception as e:
+                logger.error(f"MIDI writer failed to send {len(pending)} writes: {e}")
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _send(self, pending: Dict[Tuple, int]) -> None:
+        """
+        Send a drained set of writes in order, as one batch per run of writes
+        of the same kind on a channel.
+        """
+        # Runs of (kind, messages) by channel, in write order
+        runs: Dict[int, List[Tuple[str, List[Tuple[int, ...]]]]] = {}
+        for (kind, channel, address), value in pending.items():
+            channel_runs = runs.setdefault(channel, [])
+            if not channel_runs or channel_runs[-1][0] != kind:
+                channel_runs.append((kind, []))
+            if kind == NRPN_KIND:
+                channel_runs[-1][1].append((*address, value))
+            else:
+                channel_runs[-1][1].append((address, value))
+
+        for channel, channel_runs in runs.items():
+            for kind, messages in channel_runs:
+                if kind == NRPN_KIND:
+                    sent = self.midi.send_nrpn_batch(channel, messages)
+                else:
+                    sent = self.midi.send_cc_batch(channel, messages)
+                if not sent:
+                    logger.warning(
+                        f"Dropped {len(messages)} queued {kind} writes on channel {channel}"
+                    )
@@ -0,0 +1,172 @@
+"""
+Shared MIDI connection
+
+Opening a Digitone connection enumerates the MIDI ports through rtmidi, which
+can take hundreds of milliseconds, and an exclusive ALSA port cannot be opened
+twice. The process therefore shares one MidiConnection, created with
+shared_connection(): the server registers its tools with its device and the
+entry point reports on the same connection.
+
+The device exists right away, so tools, controllers and listeners can be wired
+to it, but its port is only opened by a background thread started with
+start(), letting the MCP handshake complete while the hardware is probed. A
+send made before the connection is ready waits for it (starting it if
+needed), up to the connection timeout. After a failed attempt, a later send
+tries again once retry_interval has passed, so a device plugged in after
+startup is picked up.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, List, Optional
+
+from elektron_mcp.midi.digitone_midi import DigitoneMIDI
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_RETRY_INTERVAL = 5.0
+
+
+class MidiConnection:
+    """A DigitoneMIDI whose port is opened lazily, on a background thread."""
+
+    def __init__(
+        self,
+        port_name: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL,
+        **midi_options,
+    ):
+        """
+        Create the device without opening any port.
+
+        Args:
+            port_name: MIDI port to open. If None, the first Digitone found.
+            timeout: Longest time a send waits for the connection, in seconds.
+            retry_interval: Seconds after a failed attempt before a send may
+                trigger another one.
+            **midi_options: Further DigitoneMIDI arguments, e.g. backend,
+                recorder or metrics.
+        """
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+        self.device = DigitoneMIDI(port_name, connect=False, **midi_options)
+        self.device.wait_for_connection = self._wait_for_send
+        self.error: Optional[str] = None
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._finished_at: Optional[float] = None
+        self._callbacks: List[Callable[["MidiConnection"], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def connected(self) -> bool:
+        return self.device.connected
+
+    @property
+    def connecting(self) -> bool:
+        """True while a connection attempt is running."""
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def start(self) -> bool:
+        """
+        Start connecting in the background, unless already connected or connecting.
+
+        A failed attempt is only repeated once retry_interval has passed.
+
+        Returns:
+            bool: True if a new attempt was started.
+        """
+        with self._lock:
+            if self.device.connected or self.connecting:
+                return False
+            if (
+                self._finished_at is not None
+                and time.monotonic() - self._finished_at < self.retry_interval
+            ):
+                return False
+            self._done.clear()
+            self._thread = threading.Thread(
+                target=self._connect, name="digitone-midi-connect", daemon=True
+            )
+            self._thread.start()
+            return True
+
+    def _connect(self) -> None:
+        device = self.device
+        try:
+            if device.port_name:
+                device.connect(device.port_name)
+            else:
+                device.auto_connect()
+            self.error = None if device.connected else "No Digitone device found"
+        except Exception as e:
+            logger.error(f"MIDI connection failed: {e}")
+            self.error = str(e)
+        with self._lock:
+            self._finished_at = time.monotonic()
+            callbacks = list(self._callbacks)
+            self._done.set()
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as e:
+                logger.error(f"MIDI connection callback failed: {e}")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Start connecting if needed and wait for the attempt to finish.
+
+        Args:
+            timeout: Seconds to wait. None waits until the attempt finishes.
+
+        Returns:
+            bool: True if the device is connected.
+        """
+        self.start()
+        self._done.wait(timeout)
+        return self.device.connected
+
+    def _wait_for_send(self) -> bool:
+        """Called by the device when a send finds no open port."""
+        return self.wait(self.timeout)
+
+    def add_done_callback(self, callback: Callable[["MidiConnection"], None]) -> None:
+        """
+        Call callback with this connection when an attempt finishes.
+
+        It is called right away, on the calling thread, if an attempt has
+        already finished, and otherwise on the connection thread.
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+            finished = self._done.is_set() and self._finished_at is not None
+        if finished:
+            callback(self)
+
+    def list_ports(self) -> List[str]:
+        """List the available MIDI ports."""
+        return self.device.list_ports()
+
+
+_shared: Optional[MidiConnection] = None
+_shared_lock = threading.Lock()
+
+
+def shared_connection(**options) -> MidiConnection:
+    """
+    Return the process-wide MIDI connection, creating it on the first call.
+
+    Args:
+        **options: MidiConnection arguments, only used by the first call.
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = MidiConnection(**options)
+        elif options:
+            logger.debug("MIDI connection already created, options ignored")
+        return _shared
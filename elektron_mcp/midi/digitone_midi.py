@@ -5,12 +5,27 @@ This module handles MIDI communication with Elektron Digitone devices.
 It provides functionality for connecting to Digitone over MIDI (USB),
 selecting channels, and sending control change (CC) messages, including
 the complete 14-bit NRPN sequence (CC 99, CC 98, CC 6, CC 38).
+
+Writes to a port are serialized by a lock shared by every DigitoneMIDI that has
+a port of that name open on the same backend, so the four CCs of an NRPN
+sequence reach the wire back to back even when tool calls run concurrently.
+The NRPN address last selected on each channel is shared the same way, so an
+instance never skips the CC 99/98 header after another one selected a
+different parameter. Different ports share nothing, and the shared state goes
+away when the last of its ports is closed.
 """
 
 import mido
-from typing import Optional, List
+import threading
+import time
+from typing import Callable, Dict, Optional, List, Sequence, Tuple
+from weakref import WeakKeyDictionary
 import logging
 
+from elektron_mcp.midi import tracing
+from elektron_mcp.midi.metrics import Metrics
+from elektron_mcp.midi.wire_log import WireRecorder
+
 logger = logging.getLogger(__name__)
 
 # MIDI Standard Control Change (CC) numbers for NRPN
@@ -19,21 +34,185 @@ NRPN_LSB_CC = 98  # CC for Non-Registered Parameter Number LSB
 DATA_ENTRY_MSB_CC = 6
 DATA_ENTRY_LSB_CC = 38
 
+CONTROL_CHANGE_STATUS = 0xB0
+CC_MESSAGE_SIZE = 3
+NRPN_MESSAGE_SIZE = 4 * CC_MESSAGE_SIZE
+
+# CCs that change which (N)RPN parameter a channel's data entry applies to
+PARAMETER_SELECT_CCS = frozenset((NRPN_MSB_CC, NRPN_LSB_CC, 100, 101))
+
+# rtmidi.MidiOut.send_message() rejects any write longer than 3 bytes that is
+# not SysEx, so rtmidi ports always get one write per message. Only ports that
+# set coalesces_writes (memory ports of elektron_mcp.midi.backends created with
+# coalesce=True) take a whole buffer in one write.
+
+
+class _PortState:
+    """Write lock and selected NRPN addresses of one output port."""
+
+    __slots__ = ("lock", "nrpn_address", "users")
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        # Last (nrpn_msb, nrpn_lsb) selected on each channel, None when unknown
+        self.nrpn_address: List[Optional[Tuple[int, int]]] = [None] * 16
+        # Open ports using the state
+        self.users = 0
+
+
+# Port states of each backend by output port name, while a port is open
+_port_states: "WeakKeyDictionary[object, Dict[str, _PortState]]" = WeakKeyDictionary()
+_port_states_guard = threading.Lock()
+
+
+def _acquire_port_state(backend, port) -> _PortState:
+    """
+    Return the state of a newly opened output port.
+
+    The state is shared with the other open ports of the same name on the same
+    backend. Ports without a name, and ports of backends that can't be weakly
+    referenced, get a state of their own. Release it with _release_port_state.
+    """
+    name = getattr(port, "name", None)
+    with _port_states_guard:
+        try:
+            states = _port_states.setdefault(backend, {})
+        except TypeError:
+            states = None
+        if states is None or not isinstance(name, str):
+            state = _PortState()
+        else:
+            state = states.get(name)
+            if state is None:
+                state = states[name] = _PortState()
+        state.users += 1
+        return state
+
+
+def _release_port_state(backend, port, state: _PortState) -> None:
+    """Forget the state of a closed output port once no open port uses it."""
+    with _port_states_guard:
+        state.users -= 1
+        if state.users > 0:
+            return
+        try:
+            states = _port_states.get(backend)
+        except TypeError:
+            return
+        name = getattr(port, "name", None)
+        if states is not None and states.get(name) is state:
+            del states[name]
+            if not states:
+                del _port_states[backend]
+
+
+def _check_cc(cc: int, value: int) -> None:
+    """Raise ValueError unless cc and value are 7-bit data bytes."""
+    if not (0 <= cc <= 127 and 0 <= value <= 127):
+        raise ValueError(f"CC data out of range: cc={cc}, value={value}")
+
+
+def _check_nrpn(nrpn_msb: int, nrpn_lsb: int, value: int) -> None:
+    """Raise ValueError unless the address is 7-bit and the value 14-bit."""
+    if not (0 <= nrpn_msb <= 127 and 0 <= nrpn_lsb <= 127):
+        raise ValueError(f"NRPN address out of range: {nrpn_msb}/{nrpn_lsb}")
+    if not 0 <= value <= 16383:
+        raise ValueError(f"NRPN value out of range: {value}")
+
+
+def _encode_cc(buffer: bytearray, offset: int, status: int, cc: int, value: int) -> int:
+    """Write one 3-byte CC message into buffer at offset and return the next offset."""
+    buffer[offset] = status
+    buffer[offset + 1] = cc & 0x7F
+    buffer[offset + 2] = value & 0x7F
+    return offset + CC_MESSAGE_SIZE
+
+
+def _encode_nrpn(
+    buffer: bytearray,
+    offset: int,
+    status: int,
+    nrpn_msb: int,
+    nrpn_lsb: int,
+    value: int,
+    select: bool = True,
+) -> int:
+    """
+    Write an NRPN sequence into buffer at offset and return the next offset.
+
+    When select is False the CC 99/98 address header is omitted and only the
+    data entry pair is written.
+    """
+    if select:
+        offset = _encode_cc(buffer, offset, status, NRPN_MSB_CC, nrpn_msb)
+        offset = _encode_cc(buffer, offset, status, NRPN_LSB_CC, nrpn_lsb)
+    offset = _encode_cc(buffer, offset, status, DATA_ENTRY_MSB_CC, value >> 7)
+    return _encode_cc(buffer, offset, status, DATA_ENTRY_LSB_CC, value)
+
 
 class DigitoneMIDI:
     """Interface for MIDI communication with Elektron Digitone."""
 
-    def __init__(self, port_name: Optional[str] = None):
+    def __init__(
+        self,
+        port_name: Optional[str] = None,
+        cache_nrpn_address: bool = True,
+        backend=None,
+        recorder: Optional[WireRecorder] = None,
+        metrics: Optional[Metrics] = None,
+        connect: bool = True,
+    ):
         """
         Initialize the Digitone MIDI interface.
 
         Args:
             port_name: Name of the MIDI port to use. If None, will attempt to auto-detect.
+            cache_nrpn_address: Skip the CC 99/98 address header when the previous
+                NRPN on the same channel already selected that parameter.
+            backend: Opens and lists the ports, see elektron_mcp.midi.backends.
+                Defaults to mido, i.e. real MIDI devices.
+            recorder: Records every message written or received, see
+                elektron_mcp.midi.wire_log. Can also be set later.
+            metrics: Counts messages, bytes and errors and times every send,
+                see elektron_mcp.midi.metrics. Can also be set later.
+            connect: Open the port now. False leaves that to a later connect()
+                or auto_connect() call, e.g. by elektron_mcp.midi.connection.
         """
+        self.backend = backend if backend is not None else mido
+        self.port_name = port_name
+        self.recorder = recorder
+        self.metrics = metrics
         self.input_port = None
         self.output_port = None
         self.connected = False
-
+        self.cache_nrpn_address = cache_nrpn_address
+        # Raw byte writer of the output port, when the backend exposes one
+        self._raw_send = None
+        self._coalesce_writes = False
+        # Reusable encode buffers for the raw send path
+        self._cc_buffer = bytearray(CC_MESSAGE_SIZE)
+        self._nrpn_buffer = bytearray(NRPN_MESSAGE_SIZE)
+        self._data_entry_view = memoryview(self._nrpn_buffer)[: 2 * CC_MESSAGE_SIZE]
+        # The buffer's four 3-byte CCs, for ports that take one message per write
+        self._nrpn_messages = tuple(
+            memoryview(self._nrpn_buffer)[offset : offset + CC_MESSAGE_SIZE]
+            for offset in range(0, NRPN_MESSAGE_SIZE, CC_MESSAGE_SIZE)
+        )
+        # Called with every mido.Message received on the input port
+        self._input_callbacks: List[Callable[[mido.Message], None]] = []
+        # Called with a channel, or None for all, whose parameter values on the
+        # device are no longer known
+        self._invalidation_callbacks: List[Callable[[Optional[int]], None]] = []
+        # Held for every write and NRPN address cache update, and the last
+        # (nrpn_msb, nrpn_lsb) selected on each channel, None when unknown.
+        # Both are shared with every instance on the same port, see _attach_output
+        self._use_port_state(_PortState())
+        # Called by a send while no port is open, to wait for a connection in
+        # progress. Returns whether the port is open then.
+        self.wait_for_connection: Optional[Callable[[], bool]] = None
+
+        if not connect:
+            return
         if port_name:
             self.connect(port_name)
         else:
@@ -41,8 +220,8 @@ class DigitoneMIDI:
 
     def list_ports(self) -> List[str]:
         """List available MIDI ports."""
-        inputs = mido.get_input_names()
-        outputs = mido.get_output_names()
+        inputs = self.backend.get_input_names()
+        outputs = self.backend.get_output_names()
         return list(set(inputs + outputs))
 
     def auto_connect(self) -> bool:
@@ -76,14 +255,18 @@ class DigitoneMIDI:
             self.disconnect()
 
             # Open new connections
-            self.output_port = mido.open_output(port_name)
+            self._attach_output(self.backend.open_output(port_name))
             try:
-                self.input_port = mido.open_input(port_name)
+                self.input_port = self.backend.open_input(
+                    port_name, callback=self._dispatch_input
+                )
             except (IOError, ValueError) as e:
                 logger.warning(f"Could not open input port {port_name}: {e}")
                 # Continue with just output port
 
             self.connected = True
+            # The device may have been edited, or reloaded, while unreachable
+            self._invalidate_values(None)
             logger.info(f"Connected to MIDI port: {port_name}")
             return True
         except (IOError, ValueError) as e:
@@ -97,11 +280,218 @@ class DigitoneMIDI:
             self.input_port.close()
             self.input_port = None
 
-        if self.output_port:
-            self.output_port.close()
-            self.output_port = None
+        # Let a sequence in progress finish before the port goes away
+        with self._port_lock:
+            if self.output_port:
+                self.output_port.close()
+                _release_port_state(self.backend, self.output_port, self._port_state)
+                self._use_port_state(_PortState())
+                self.output_port = None
+
+            self._raw_send = None
+            self._coalesce_writes = False
+            self.invalidate_nrpn_cache()
+            self.connected = False
+        self._invalidate_values(None)
+
+    def _use_port_state(self, state: _PortState) -> None:
+        """Use the write lock and NRPN address cache of a port state."""
+        self._port_state = state
+        self._port_lock = state.lock
+        self._nrpn_address = state.nrpn_address
+
+    def add_input_callback(self, callback: Callable[[mido.Message], None]) -> None:
+        """
+        Register a function called with every message received from the device.
+
+        Callbacks run on the MIDI backend's input thread and should return quickly.
 
-        self.connected = False
+        Args:
+            callback: Function taking a mido.Message.
+        """
+        self._input_callbacks.append(callback)
+
+    def remove_input_callback(self, callback: Callable[[mido.Message], None]) -> None:
+        """Unregister a function previously passed to add_input_callback."""
+        self._input_callbacks.remove(callback)
+
+    def _dispatch_input(self, msg: mido.Message) -> None:
+        """Hand an incoming message to every registered input callback."""
+        if self.recorder is not None:
+            self.recorder.record_incoming(msg.bytes())
+        for callback in tuple(self._input_callbacks):
+            try:
+                callback(msg)
+            except Exception as e:
+                logger.error(f"MIDI input callback failed on {msg}: {e}")
+
+    def add_invalidation_callback(
+        self, callback: Callable[[Optional[int]], None]
+    ) -> None:
+        """
+        Register a function called when parameter values sent to the device may
+        not hold anymore.
+
+        It is called with a channel (1-16) when a write to that channel fails,
+        possibly after a transport queued it and reported it as sent, and with
+        None, meaning every channel, when the port is opened or closed.
+        ShadowState uses it to forget the values it recorded.
+
+        Args:
+            callback: Function taking the channel, or None.
+        """
+        self._invalidation_callbacks.append(callback)
+
+    def _invalidate_values(self, channel: Optional[int]) -> None:
+        """Tell every invalidation callback that a channel's values are unknown."""
+        for callback in tuple(self._invalidation_callbacks):
+            try:
+                callback(channel)
+            except Exception as e:
+                logger.error(f"MIDI invalidation callback failed: {e}")
+
+    def invalidate_nrpn_cache(self, channel: Optional[int] = None) -> None:
+        """
+        Forget the NRPN address selected on a channel so the next send_nrpn
+        re-sends CC 99/98.
+
+        Call this when other traffic may have changed the device's selected
+        parameter, e.g. another controller merged into the same MIDI input.
+
+        Args:
+            channel: MIDI channel (1-16). If None, all channels are invalidated.
+        """
+        with self._port_lock:
+            if channel is None:
+                self._nrpn_address[:] = [None] * 16
+            elif 1 <= channel <= 16:
+                self._nrpn_address[channel - 1] = None
+
+    def _needs_nrpn_select(
+        self, channel_idx: int, nrpn_msb: int, nrpn_lsb: int
+    ) -> bool:
+        """Return True if the address header must be sent for this NRPN."""
+        if not self.cache_nrpn_address:
+            return True
+        return self._nrpn_address[channel_idx] != (nrpn_msb, nrpn_lsb)
+
+    def nrpn_size(self, channel: int, nrpn_msb: int, nrpn_lsb: int) -> int:
+        """
+        Number of bytes send_nrpn would currently put on the wire for this parameter.
+
+        Args:
+            channel: MIDI channel (1-16)
+            nrpn_msb: NRPN Parameter MSB (0-127)
+            nrpn_lsb: NRPN Parameter LSB (0-127)
+        """
+        if 1 <= channel <= 16 and not self._needs_nrpn_select(
+            channel - 1, nrpn_msb, nrpn_lsb
+        ):
+            return 2 * CC_MESSAGE_SIZE
+        return NRPN_MESSAGE_SIZE
+
+    def _attach_output(self, port) -> None:
+        """
+        Use port as the output port and detect whether it accepts raw bytes.
+
+        mido's rtmidi ports wrap an ``rtmidi.MidiOut`` that can be handed encoded
+        bytes directly, one message per call, and the in-memory ports of
+        elektron_mcp.midi.backends provide ``send_raw``. Other backends only
+        accept ``mido.Message`` objects.
+
+        Writes are serialized, and the NRPN address cache is shared, with every
+        other DigitoneMIDI with a port of the same name open on the same backend.
+        disconnect() releases the shared state.
+        """
+        self._use_port_state(_acquire_port_state(self.backend, port))
+        # Nothing is known about what the device has selected on a fresh port
+        self.invalidate_nrpn_cache()
+        self.output_port = port
+        self._raw_send = getattr(port, "send_raw", None)
+        if self._raw_send is not None:
+            self._coalesce_writes = getattr(port, "coalesces_writes", False)
+            return
+        rt = getattr(port, "_rt", None)
+        self._raw_send = getattr(rt, "send_message", None)
+        self._coalesce_writes = False
+
+    def _write(self, data: bytearray) -> None:
+        """
+        Write a buffer of encoded 3-byte CC messages to the output port.
+
+        Must be called with the port lock held. The buffer goes out in a single
+        write when the port sets ``coalesces_writes``, otherwise (rtmidi) one raw
+        write per message, and through ``mido.Message`` objects as a last resort.
+        """
+        if self._raw_send is None:
+            for msg in mido.parse_all(data):
+                self.output_port.send(msg)
+        elif self._coalesce_writes or len(data) == CC_MESSAGE_SIZE:
+            self._raw_send(data)
+        else:
+            raw_send = self._raw_send
+            for offset in range(0, len(data), CC_MESSAGE_SIZE):
+                raw_send(data[offset : offset + CC_MESSAGE_SIZE])
+        if self.recorder is not None:
+            self.recorder.record_outgoing(data)
+
+    def _timer_start(self) -> int:
+        """Return the start time of a send timed by metrics or a trace, else 0."""
+        if self.metrics is None and tracing.recording() is None:
+            return 0
+        return time.perf_counter_ns()
+
+    def _sent(
+        self, operation: str, message_type: str, messages: int, size: int, start: int
+    ) -> None:
+        """Record a successful send in the metrics and the current trace."""
+        if self.metrics is not None:
+            self.metrics.sent(operation, message_type, messages, size, start)
+        tracer = tracing.recording()
+        if tracer is not None:
+            tracer.complete(
+                operation, "midi", start, {"messages": messages, "bytes": size}
+            )
+
+    def _failed(self, operation: str, channel: Optional[int]) -> None:
+        """
+        Count a failed send, if metrics are enabled, and forget the values of
+        the channel it may have left half-written.
+
+        Args:
+            operation: The send method, e.g. 'send_nrpn'.
+            channel: Channel (1-16) written to, None if no parameter was affected.
+        """
+        if self.metrics is not None:
+            self.metrics.inc("midi_errors_total", operation)
+        if channel is not None and 1 <= channel <= 16:
+            self._invalidate_values(channel)
+
+    def _not_ready(self, channel: Optional[int]) -> bool:
+        """
+        Report a send made while no port is open and return False.
+
+        The values a queued write to the channel was reported to set are
+        forgotten, since they never reached the device.
+        """
+        logger.error("Not connected to any MIDI port")
+        if channel is not None and 1 <= channel <= 16:
+            self._invalidate_values(channel)
+        return False
+
+    def _ready(self) -> bool:
+        """Return True if the output port is open, waiting for a pending connection."""
+        if self.connected and self.output_port:
+            return True
+        waiter = self.wait_for_connection
+        return waiter is not None and waiter() and bool(self.output_port)
+
+    def _channel_status(self, channel: int) -> Optional[int]:
+        """Return the CC status byte for a 1-indexed channel, or None if it is invalid."""
+        if 1 <= channel <= 16:
+            return CONTROL_CHANGE_STATUS | (channel - 1)
+        logger.error(f"Invalid channel: {channel}. Must be between 1-16.")
+        return None
 
     def send_cc(self, channel: int, cc: int, value: int) -> bool:
         """
@@ -115,9 +505,8 @@ class DigitoneMIDI:
         Returns:
             bool: True if message sent successfully, False otherwise.
         """
-        if not self.connected or not self.output_port:
-            logger.error("Not connected to any MIDI port")
-            return False
+        if not self._ready():
+            return self._not_ready(channel)
 
         # Convert 1-indexed channel to 0-indexed
         if 1 <= channel <= 16:
@@ -126,16 +515,81 @@ class DigitoneMIDI:
             logger.error(f"Invalid channel: {channel}. Must be between 1-16.")
             return False
 
+        # Rejected before the try: nothing reaches the wire, so the channel's
+        # values still hold
         try:
-            # Create and send the CC message
-            msg = mido.Message(
-                "control_change", channel=channel, control=cc, value=value
-            )
-            self.output_port.send(msg)
-            logger.debug(f"Sent CC: channel={channel+1}, cc={cc}, value={value}")
+            _check_cc(cc, value)
+        except ValueError as e:
+            logger.error(f"Error sending CC message: {e}")
+            self._failed("send_cc", None)
+            return False
+
+        start = self._timer_start()
+        try:
+            with self._port_lock:
+                if self._raw_send is not None:
+                    # Encode straight into the reusable buffer, no mido.Message needed
+                    buffer = self._cc_buffer
+                    _encode_cc(buffer, 0, CONTROL_CHANGE_STATUS | channel, cc, value)
+                    self._raw_send(buffer)
+                    if self.recorder is not None:
+                        self.recorder.record_outgoing(buffer)
+                else:
+                    # Create and send the CC message
+                    msg = mido.Message(
+                        "control_change", channel=channel, control=cc, value=value
+                    )
+                    self.output_port.send(msg)
+                    if self.recorder is not None:
+                        self.recorder.record_outgoing(msg.bytes())
+                if cc in PARAMETER_SELECT_CCS:
+                    self._nrpn_address[channel] = None
+            if start:
+                self._sent("send_cc", "cc", 1, CC_MESSAGE_SIZE, start)
+            logger.debug("Sent CC: channel=%d, cc=%d, value=%d", channel + 1, cc, value)
             return True
         except Exception as e:
             logger.error(f"Error sending CC message: {e}")
+            self._failed("send_cc", channel + 1)
+            return False
+
+    def send_message(self, data: Sequence[int]) -> bool:
+        """
+        Send one complete MIDI message given as raw bytes, e.g. a note or clock message.
+
+        Args:
+            data: The message bytes, starting with the status byte.
+
+        Returns:
+            bool: True if message sent successfully, False otherwise.
+        """
+        # Only Control Change messages set parameter values
+        channel = None
+        if len(data) and (data[0] & 0xF0) == CONTROL_CHANGE_STATUS:
+            channel = (data[0] & 0x0F) + 1
+        if not self._ready():
+            return self._not_ready(channel)
+
+        start = self._timer_start()
+        try:
+            with self._port_lock:
+                if self._raw_send is not None:
+                    self._raw_send(data)
+                else:
+                    self.output_port.send(mido.Message.from_bytes(data))
+                if self.recorder is not None:
+                    self.recorder.record_outgoing(data)
+                if (data[0] & 0xF0) == CONTROL_CHANGE_STATUS and (
+                    data[1] in PARAMETER_SELECT_CCS
+                ):
+                    self._nrpn_address[data[0] & 0x0F] = None
+            if start:
+                self._sent("send_message", "raw", 1, len(data), start)
+            logger.debug("Sent message: %s", bytes(data).hex(" "))
+            return True
+        except Exception as e:
+            logger.error(f"Error sending MIDI message: {e}")
+            self._failed("send_message", channel)
             return False
 
     def send_nrpn(self, channel: int, nrpn_msb: int, nrpn_lsb: int, value: int) -> bool:
@@ -149,6 +603,8 @@ class DigitoneMIDI:
           4. CC 38 (Data Entry LSB)
 
         Elektron expects the complete 14-bit sequence even if you only need 7-bit resolution.
+        CC 99/98 are skipped when the channel already has this parameter selected
+        (see cache_nrpn_address).
 
         Args:
             channel: MIDI channel (1-16)
@@ -159,9 +615,8 @@ class DigitoneMIDI:
         Returns:
             bool: True if all messages sent successfully, False otherwise.
         """
-        if not self.connected or not self.output_port:
-            logger.error("Not connected to any MIDI port")
-            return False
+        if not self._ready():
+            return self._not_ready(channel)
 
         # Convert 1-indexed channel to 0-indexed
         if 1 <= channel <= 16:
@@ -170,8 +625,81 @@ class DigitoneMIDI:
             logger.error(f"Invalid channel: {channel}. Must be between 1-16.")
             return False
 
+        # Rejected before the try: nothing reaches the wire, so the channel's
+        # values and selected address still hold
+        try:
+            _check_nrpn(nrpn_msb, nrpn_lsb, value)
+        except ValueError as e:
+            logger.error(f"Error sending NRPN message: {e}")
+            self._failed("send_nrpn", None)
+            return False
+
+        start = self._timer_start()
         try:
-            # MSB/LSB for the parameter ID
+            # The address check, the four CCs and the cache update are one unit
+            with self._port_lock:
+                # MSB/LSB for the parameter ID, unless already selected on this channel
+                select = self._needs_nrpn_select(channel_idx, nrpn_msb, nrpn_lsb)
+                if select:
+                    self._nrpn_address[channel_idx] = None
+
+                if self._raw_send is not None:
+                    self._send_raw_nrpn(channel_idx, nrpn_msb, nrpn_lsb, value, select)
+                else:
+                    self._send_mido_nrpn(channel_idx, nrpn_msb, nrpn_lsb, value, select)
+
+                if select:
+                    self._nrpn_address[channel_idx] = (nrpn_msb, nrpn_lsb)
+
+            if start:
+                size = NRPN_MESSAGE_SIZE if select else 2 * CC_MESSAGE_SIZE
+                self._sent("send_nrpn", "nrpn", 1, size, start)
+
+            logger.debug(
+                "Sent NRPN: channel=%d, NRPN=%d/%d, value=%d",
+                channel,
+                nrpn_msb,
+                nrpn_lsb,
+                value,
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error sending NRPN message: {e}")
+            self._failed("send_nrpn", channel)
+            return False
+
+    def _send_raw_nrpn(
+        self,
+        channel_idx: int,
+        nrpn_msb: int,
+        nrpn_lsb: int,
+        value: int,
+        select: bool,
+    ) -> None:
+        """Encode an NRPN sequence into the reusable buffer and write it raw."""
+        status = CONTROL_CHANGE_STATUS | channel_idx
+        _encode_nrpn(self._nrpn_buffer, 0, status, nrpn_msb, nrpn_lsb, value, select)
+        data = self._nrpn_buffer if select else self._data_entry_view
+        if self._coalesce_writes:
+            self._raw_send(data)
+        else:
+            # One CC per write, sliced from the buffer without copying
+            raw_send = self._raw_send
+            for message in self._nrpn_messages[: 4 if select else 2]:
+                raw_send(message)
+        if self.recorder is not None:
+            self.recorder.record_outgoing(data)
+
+    def _send_mido_nrpn(
+        self,
+        channel_idx: int,
+        nrpn_msb: int,
+        nrpn_lsb: int,
+        value: int,
+        select: bool,
+    ) -> None:
+        """Send an NRPN sequence as individual mido messages (fallback path)."""
+        if select:
             self.output_port.send(
                 mido.Message(
                     "control_change",
@@ -189,35 +717,176 @@ class DigitoneMIDI:
                 )
             )
 
-            # If 'value' is only 0-127, just use DataEntry MSB as 'value' and LSB as 0
-            # If 'value' can be 0-16383, split it:
-            value_msb = (value >> 7) & 0x7F
-            value_lsb = value & 0x7F
-
-            # Data Entry MSB
-            self.output_port.send(
-                mido.Message(
-                    "control_change",
-                    channel=channel_idx,
-                    control=DATA_ENTRY_MSB_CC,
-                    value=value_msb,
-                )
+        # If 'value' is only 0-127, just use DataEntry MSB as 'value' and LSB as 0
+        # If 'value' can be 0-16383, split it:
+        value_msb = (value >> 7) & 0x7F
+        value_lsb = value & 0x7F
+
+        # Data Entry MSB
+        self.output_port.send(
+            mido.Message(
+                "control_change",
+                channel=channel_idx,
+                control=DATA_ENTRY_MSB_CC,
+                value=value_msb,
             )
-            # Data Entry LSB
-            self.output_port.send(
-                mido.Message(
-                    "control_change",
-                    channel=channel_idx,
-                    control=DATA_ENTRY_LSB_CC,
-                    value=value_lsb,
-                )
+        )
+        # Data Entry LSB
+        self.output_port.send(
+            mido.Message(
+                "control_change",
+                channel=channel_idx,
+                control=DATA_ENTRY_LSB_CC,
+                value=value_lsb,
             )
-
-            logger.debug(
-                f"Sent NRPN: channel={channel}, NRPN={nrpn_msb}/{nrpn_lsb}, "
-                f"valueMSB={value_msb}, valueLSB={value_lsb}"
+        )
+
+        if self.recorder is not None:
+            sequence = bytearray(NRPN_MESSAGE_SIZE)
+            end = _encode_nrpn(
+                sequence,
+                0,
+                CONTROL_CHANGE_STATUS | channel_idx,
+                nrpn_msb,
+                nrpn_lsb,
+                value,
+                select,
             )
+            self.recorder.record_outgoing(sequence[:end])
+
+    def send_cc_batch(
+        self,
+        channel: int,
+        messages: Sequence[Tuple[int, int]],
+        lane: Optional[int] = None,
+    ) -> bool:
+        """
+        Send several Control Change messages on one channel.
+
+        The whole batch is encoded into a single pre-sized buffer and written to
+        the port in as few writes as the backend allows.
+
+        Args:
+            channel: MIDI channel (1-16)
+            messages: Sequence of (cc, value) pairs, each 0-127
+            lane: Accepted for MidiScheduler compatibility. The device has no lanes.
+
+        Returns:
+            bool: True if the batch was sent successfully, False otherwise.
+        """
+        if not self._ready():
+            return self._not_ready(channel)
+
+        status = self._channel_status(channel)
+        if status is None:
+            return False
+
+        # The whole batch is rejected before anything is written
+        try:
+            for cc, value in messages:
+                _check_cc(cc, value)
+        except ValueError as e:
+            logger.error(f"Invalid CC batch: {e}")
+            self._failed("send_cc_batch", None)
+            return False
+
+        start = self._timer_start()
+        buffer = bytearray(len(messages) * CC_MESSAGE_SIZE)
+        offset = 0
+        selects_parameter = False
+        for cc, value in messages:
+            offset = _encode_cc(buffer, offset, status, cc, value)
+            selects_parameter = selects_parameter or cc in PARAMETER_SELECT_CCS
+
+        try:
+            with self._port_lock:
+                if selects_parameter:
+                    self._nrpn_address[channel - 1] = None
+                self._write(buffer)
+            if start:
+                self._sent("send_cc_batch", "cc", len(messages), len(buffer), start)
+            logger.debug(f"Sent CC batch: channel={channel}, count={len(messages)}")
             return True
         except Exception as e:
-            logger.error(f"Error sending NRPN message: {e}")
+            logger.error(f"Error sending CC batch: {e}")
+            self._failed("send_cc_batch", channel)
             return False
+
+    def send_nrpn_batch(
+        self,
+        channel: int,
+        messages: Sequence[Tuple[int, int, int]],
+        lane: Optional[int] = None,
+    ) -> bool:
+        """
+        Send several NRPN parameter changes on one channel.
+
+        Each (nrpn_msb, nrpn_lsb, value) entry is encoded as a CC 99/98/6/38
+        sequence, as in send_nrpn, into a single pre-sized buffer that is written
+        to the port in as few writes as the backend allows. Address headers are
+        skipped for consecutive entries on an already selected parameter.
+
+        rtmidi ports still take one write per 3-byte CC, so on real devices a
+        batch only saves the per-call checks and locking of repeated send_nrpn
+        calls, not the writes themselves.
+
+        Args:
+            channel: MIDI channel (1-16)
+            messages: Sequence of (nrpn_msb, nrpn_lsb, value) tuples
+            lane: Accepted for MidiScheduler compatibility. The device has no lanes.
+
+        Returns:
+            bool: True if the batch was sent successfully, False otherwise.
+        """
+        if not self._ready():
+            return self._not_ready(channel)
+
+        status = self._channel_status(channel)
+        if status is None:
+            return False
+
+        # The whole batch is rejected before anything is written or cached
+        try:
+            for nrpn_msb, nrpn_lsb, value in messages:
+                _check_nrpn(nrpn_msb, nrpn_lsb, value)
+        except ValueError as e:
+            logger.error(f"Invalid NRPN batch: {e}")
+            self._failed("send_nrpn_batch", None)
+            return False
+
+        channel_idx = channel - 1
+        start = self._timer_start()
+        try:
+            # Encoded under the lock: the headers skipped depend on the address cache
+            with self._port_lock:
+                buffer, address = self._encode_nrpn_batch(channel_idx, status, messages)
+                # Unknown until the write completes: a partial write may leave any
+                # address
+                self._nrpn_address[channel_idx] = None
+                self._write(buffer)
+                if messages:
+                    self._nrpn_address[channel_idx] = address
+            if start:
+                self._sent("send_nrpn_batch", "nrpn", len(messages), len(buffer), start)
+            logger.debug(f"Sent NRPN batch: channel={channel}, count={len(messages)}")
+            return True
+        except Exception as e:
+            logger.error(f"Error sending NRPN batch: {e}")
+            self._failed("send_nrpn_batch", channel)
+            return False
+
+    def _encode_nrpn_batch(
+        self, channel_idx: int, status: int, messages: Sequence[Tuple[int, int, int]]
+    ) -> Tuple[bytearray, Optional[Tuple[int, int]]]:
+        """Encode an NRPN batch and return it with the address it leaves selected."""
+        address = self._nrpn_address[channel_idx] if self.cache_nrpn_address else None
+        buffer = bytearray(len(messages) * NRPN_MESSAGE_SIZE)
+        offset = 0
+        for nrpn_msb, nrpn_lsb, value in messages:
+            select = not self.cache_nrpn_address or address != (nrpn_msb, nrpn_lsb)
+            offset = _encode_nrpn(
+                buffer, offset, status, nrpn_msb, nrpn_lsb, value, select
+            )
+            address = (nrpn_msb, nrpn_lsb)
+        del buffer[offset:]
+        return buffer, address
@@ -0,0 +1,304 @@
+"""
+MIDI metrics
+
+Counters and latency histograms for the MIDI transport and the controllers,
+to see how long a send takes and how much traffic an LLM session generates.
+
+DigitoneMIDI and the controllers only record when they are given a Metrics
+instance; without one the cost is a single ``is not None`` check per call.
+
+Latencies go into HDR-style histograms: values are bucketed exactly below 16
+and into 16 linear sub-buckets per power of two above, so every reported
+value is within 1/16 (6.25%) of the true one whatever its magnitude, and
+recording is a couple of integer operations.
+
+Snapshots can be read as a dict (served as the metrics://midi MCP resource)
+or in the Prometheus text format, optionally over a local HTTP endpoint.
+"""
+
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "elektron_mcp_"
+
+# Counter name: (label name, help text)
+COUNTERS: Dict[str, Tuple[str, str]] = {
+    "midi_messages_total": ("type", "MIDI messages written, by type"),
+    "midi_bytes_total": ("type", "MIDI bytes written, by message type"),
+    "midi_errors_total": ("operation", "Failed MIDI writes, by operation"),
+    "controller_sets_total": ("method", "Controller set calls that sent MIDI"),
+    "controller_skipped_total": ("method", "Parameter changes skipped as unchanged"),
+    "controller_cc_fallbacks_total": ("method", "NRPN sends retried as CC"),
+    "controller_errors_total": ("method", "Controller set calls that failed"),
+}
+
+# Histogram name: (label name, help text)
+HISTOGRAMS: Dict[str, Tuple[str, str]] = {
+    "midi_send_seconds": ("operation", "DigitoneMIDI send latency"),
+    "controller_set_seconds": ("method", "Controller set latency, sends included"),
+}
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+
+def bucket_index(value: int) -> int:
+    """Return the histogram bucket of a non-negative integer value."""
+    if value < SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return shift * SUB_BUCKETS + (value >> shift)
+
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    """Return the lowest and highest value of a histogram bucket."""
+    if index < SUB_BUCKETS:
+        return index, index
+    shift, mantissa = divmod(index, SUB_BUCKETS)
+    shift -= 1
+    mantissa += SUB_BUCKETS
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class Histogram:
+    """HDR-style histogram of non-negative integers, e.g. nanoseconds."""
+
+    def __init__(self):
+        self.counts: List[int] = []
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max = 0
+        self._lock = threading.Lock()
+
+    def record(self, value: int) -> None:
+        """Add one value. Negative values count as 0."""
+        value = max(value, 0)
+        index = bucket_index(value)
+        with self._lock:
+            counts = self.counts
+            if index >= len(counts):
+                counts.extend([0] * (index + 1 - len(counts)))
+            counts[index] += 1
+            self.count += 1
+            self.total += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if value > self.max:
+                self.max = value
+
+    def percentile(self, quantile: float) -> int:
+        """
+        Return the value below which the given fraction of values fall.
+
+        Args:
+            quantile: Fraction between 0 and 1, e.g. 0.99.
+
+        Returns:
+            The highest value of the bucket holding the quantile, capped at the
+            largest recorded value. 0 when nothing was recorded.
+        """
+        with self._lock:
+            if not self.count:
+                return 0
+            rank = max(1, round(quantile * self.count))
+            seen = 0
+            for index, count in enumerate(self.counts):
+                seen += count
+                if seen >= rank:
+                    return min(bucket_bounds(index)[1], self.max)
+            return self.max
+
+    def snapshot(self) -> dict:
+        """Count, sum, min, max and the QUANTILES of the recorded values."""
+        summary = {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min or 0,
+            "max": self.max,
+        }
+        for quantile in QUANTILES:
+            summary[f"p{quantile * 100:g}"] = self.percentile(quantile)
+        return summary
+
+
+class Metrics:
+    """Named counters and latency histograms, each with one label. Thread-safe."""
+
+    def __init__(self):
+        self.started = time.time()
+        self._counters: Dict[Tuple[str, str], int] = {}
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, label: str = "", amount: int = 1) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name: Counter name, see COUNTERS.
+            label: Value of the counter's label, e.g. 'nrpn'.
+            amount: Increment.
+        """
+        key = (name, label)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, label: str, elapsed_ns: int) -> None:
+        """
+        Record a latency.
+
+        Args:
+            name: Histogram name, see HISTOGRAMS.
+            label: Value of the histogram's label, e.g. 'send_nrpn'.
+            elapsed_ns: Duration in nanoseconds.
+        """
+        key = (name, label)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram())
+        histogram.record(elapsed_ns)
+
+    def sent(
+        self,
+        operation: str,
+        message_type: str,
+        messages: int,
+        size: int,
+        start_ns: int,
+    ) -> None:
+        """
+        Record a successful DigitoneMIDI write.
+
+        Args:
+            operation: The send method, e.g. 'send_nrpn_batch'.
+            message_type: 'cc', 'nrpn' or 'raw'.
+            messages: Messages of that type written.
+            size: Bytes written.
+            start_ns: time.perf_counter_ns() when the call started.
+        """
+        elapsed = time.perf_counter_ns() - start_ns
+        with self._lock:
+            counters = self._counters
+            key = ("midi_messages_total", message_type)
+            counters[key] = counters.get(key, 0) + messages
+            key = ("midi_bytes_total", message_type)
+            counters[key] = counters.get(key, 0) + size
+        self.observe("midi_send_seconds", operation, elapsed)
+
+    def counter(self, name: str, label: str = "") -> int:
+        """Return the current value of a counter."""
+        with self._lock:
+            return self._counters.get((name, label), 0)
+
+    def histogram(self, name: str, label: str) -> Histogram:
+        """Return a histogram, empty if nothing was recorded in it yet."""
+        with self._lock:
+            return self._histograms.get((name, label)) or Histogram()
+
+    def reset(self) -> None:
+        """Forget every recorded value."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self.started = time.time()
+
+    def snapshot(self) -> dict:
+        """
+        Return every counter and histogram summary.
+
+        Counters are keyed by name and label value. Histogram summaries are in
+        nanoseconds. 'uptime_seconds' allows turning counts into rates.
+        """
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items())
+        result: dict = {
+            "uptime_seconds": time.time() - self.started,
+            "counters": {},
+            "histograms": {},
+        }
+        for (name, label), value in counters:
+            result["counters"].setdefault(name, {})[label] = value
+        for (name, label), histogram in histograms:
+            result["histograms"].setdefault(name, {})[label] = histogram.snapshot()
+        return result
+
+    def prometheus(self) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        return "".join(_prometheus_lines(self.snapshot()))
+
+
+def _prometheus_lines(snapshot: dict) -> Iterator[str]:
+    for name, values in snapshot["counters"].items():
+        label_name, help_text = COUNTERS.get(name, ("label", name))
+        yield f"# HELP {PREFIX}{name} {help_text}\n"
+        yield f"# TYPE {PREFIX}{name} counter\n"
+        for label, value in values.items():
+            yield f'{PREFIX}{name}{{{label_name}="{label}"}} {value}\n'
+    # Histograms are exported as summaries: their quantiles are exact enough
+    # and need no fixed bucket layout
+    for name, values in snapshot["histograms"].items():
+        label_name, help_text = HISTOGRAMS.get(name, ("label", name))
+        yield f"# HELP {PREFIX}{name} {help_text}\n"
+        yield f"# TYPE {PREFIX}{name} summary\n"
+        for label, summary in values.items():
+            for quantile in QUANTILES:
+                seconds = summary[f"p{quantile * 100:g}"] / 1e9
+                yield (
+                    f'{PREFIX}{name}{{{label_name}="{label}",'
+                    f'quantile="{quantile:g}"}} {seconds:.9f}\n'
+                )
+            yield f'{PREFIX}{name}_sum{{{label_name}="{label}"}} '
+            yield f"{summary['sum'] / 1e9:.9f}\n"
+            yield f'{PREFIX}{name}_count{{{label_name}="{label}"}} '
+            yield f"{summary['count']}\n"
+    yield f"# TYPE {PREFIX}uptime_seconds gauge\n"
+    yield f"{PREFIX}uptime_seconds {snapshot['uptime_seconds']:.3f}\n"
+
+
+def serve_prometheus(
+    metrics: Metrics, port: int, host: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """
+    Serve the metrics at http://host:port/metrics from a daemon thread.
+
+    Args:
+        metrics: The metrics to expose.
+        port: TCP port, 0 for any free port (see server.server_address).
+        host: Interface to listen on. Only the local machine by default.
+
+    Returns:
+        The running server; call shutdown() to stop it.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(f"Metrics endpoint: {format % args}")
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    thread = threading.Thread(
+        target=server.serve_forever, name="metrics-http", daemon=True
+    )
+    thread.start()
+    logger.info(f"Serving metrics on http://{host}:{server.server_address[1]}/metrics")
+    return server
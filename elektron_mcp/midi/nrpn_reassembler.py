@@ -0,0 +1,66 @@
+"""
+NRPN reassembly for incoming MIDI
+
+Rebuilds complete NRPN parameter changes from the CC 99, CC 98, CC 6 and CC 38
+messages a device transmits, tracking the partial state of each channel.
+"""
+
+from typing import List, Optional, Tuple
+
+from elektron_mcp.midi.digitone_midi import (
+    DATA_ENTRY_LSB_CC,
+    DATA_ENTRY_MSB_CC,
+    NRPN_LSB_CC,
+    NRPN_MSB_CC,
+    PARAMETER_SELECT_CCS,
+)
+
+
+class NrpnReassembler:
+    """Per-channel state machine turning CC 99/98/6/38 sequences into NRPN changes."""
+
+    def __init__(self):
+        self._nrpn_msb: List[Optional[int]] = [None] * 16
+        self._nrpn_lsb: List[Optional[int]] = [None] * 16
+        self._data_msb: List[Optional[int]] = [None] * 16
+
+    def reset(self) -> None:
+        """Forget every partially received sequence."""
+        self.__init__()
+
+    def feed(
+        self, channel_idx: int, cc: int, value: int
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Process one incoming CC.
+
+        Args:
+            channel_idx: 0-indexed MIDI channel (0-15).
+            cc: Control Change number.
+            value: Control Change value.
+
+        Returns:
+            (nrpn_msb, nrpn_lsb, value) once a data entry LSB completes an NRPN,
+            with the value decoded the same way send_nrpn encodes it, else None.
+        """
+        if cc == DATA_ENTRY_LSB_CC:
+            nrpn_msb = self._nrpn_msb[channel_idx]
+            nrpn_lsb = self._nrpn_lsb[channel_idx]
+            data_msb = self._data_msb[channel_idx]
+            if nrpn_msb is None or nrpn_lsb is None or data_msb is None:
+                return None
+            return nrpn_msb, nrpn_lsb, (data_msb << 7) | value
+        if cc == DATA_ENTRY_MSB_CC:
+            self._data_msb[channel_idx] = value
+        elif cc == NRPN_MSB_CC:
+            self._nrpn_msb[channel_idx] = value
+            self._data_msb[channel_idx] = None
+        elif cc == NRPN_LSB_CC:
+            self._nrpn_lsb[channel_idx] = value
+            self._data_msb[channel_idx] = None
+        elif cc in PARAMETER_SELECT_CCS:
+            # An RPN selection deselects the NRPN
+            self._nrpn_msb[channel_idx] = None
+            self._nrpn_lsb[channel_idx] = None
+            self._data_msb[channel_idx] = None
+        return None
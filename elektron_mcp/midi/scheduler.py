@@ -0,0 +1,308 @@
+"""
+Bandwidth-aware MIDI output scheduler
+
+Paces the writes going to one DigitoneMIDI port with a token bucket so that a
+burst of parameter changes cannot overrun a slow link such as 5-pin DIN MIDI
+(31.25 kbaud, 10 bits per byte, so 3125 bytes per second).
+
+Writes are queued in priority lanes. Notes and clock go first, then parameter
+changes, then bulk restores, so a patch restore never delays timing-critical
+messages by more than the one write already being sent.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from elektron_mcp.midi.digitone_midi import (
+    CC_MESSAGE_SIZE,
+    NRPN_LSB_CC,
+    NRPN_MESSAGE_SIZE,
+    NRPN_MSB_CC,
+    DigitoneMIDI,
+)
+
+logger = logging.getLogger(__name__)
+
+# 31250 baud with 1 start bit, 8 data bits and 1 stop bit per byte
+DIN_BYTES_PER_SECOND = 3125
+
+
+class Lane(IntEnum):
+    """Priority lanes, lowest value is sent first."""
+
+    REALTIME = 0  # Notes and clock
+    PARAMETER = 1  # Parameter changes
+    BULK = 2  # Bulk restores such as full patches
+
+
+class _Write:
+    """One queued write: a DigitoneMIDI send method and its arguments."""
+
+    __slots__ = ("send", "args", "size")
+
+    def __init__(self, send: Callable[..., bool], args: Tuple, size: int):
+        self.send = send
+        self.args = args
+        # Upper bound of the bytes on the wire, used for queue accounting
+        self.size = size
+
+
+class MidiScheduler:
+    """Token-bucket scheduler for the output of a single MIDI port.
+
+    Exposes the same send methods as DigitoneMIDI, with an extra lane argument,
+    so it can be handed to the controllers in its place. The send methods return
+    True once the write is queued; transport errors are logged by the worker.
+    """
+
+    def __init__(
+        self,
+        midi: DigitoneMIDI,
+        bytes_per_second: float = DIN_BYTES_PER_SECOND,
+        burst_bytes: Optional[int] = None,
+        max_queue: int = 4096,
+        autostart: bool = True,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            midi: The DigitoneMIDI interface of the port being paced.
+            bytes_per_second: Sustained byte budget of the port.
+            burst_bytes: Bucket size, i.e. how many bytes may go out back to back.
+                Defaults to 20 ms worth of budget, but at least one NRPN sequence.
+            max_queue: Maximum number of writes waiting in each lane.
+            autostart: Start the worker thread immediately. Otherwise call start().
+        """
+        if bytes_per_second <= 0:
+            raise ValueError("bytes_per_second must be positive")
+        self.midi = midi
+        self.bytes_per_second = float(bytes_per_second)
+        self.burst_bytes = burst_bytes or max(
+            NRPN_MESSAGE_SIZE, int(self.bytes_per_second / 50)
+        )
+        self.max_queue = max_queue
+        self._lanes: List[Deque[_Write]] = [deque() for _ in Lane]
+        self._pending_bytes = 0
+        self._busy = False
+        self._closed = False
+        self._tokens = float(self.burst_bytes)
+        self._last_refill = time.monotonic()
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="digitone-midi-scheduler", daemon=True
+        )
+        if autostart:
+            self.start()
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        self._thread.start()
+
+    def queue_depth(self) -> Dict[str, int]:
+        """Number of writes waiting in each lane."""
+        with self._condition:
+            return {lane.name.lower(): len(self._lanes[lane]) for lane in Lane}
+
+    def estimated_drain_time(self) -> float:
+        """Estimated seconds until every queued write has been sent."""
+        with self._condition:
+            self._refill()
+            backlog = self._queued_wire_bytes() - self._tokens
+            return max(0.0, backlog / self.bytes_per_second)
+
+    def stats(self) -> Dict[str, object]:
+        """Queue depth per lane, queued wire bytes and estimated drain time."""
+        with self._condition:
+            pending_bytes = self._queued_wire_bytes()
+        return {
+            "queue_depth": self.queue_depth(),
+            "pending_bytes": pending_bytes,
+            "estimated_drain_time": self.estimated_drain_time(),
+        }
+
+    def _enqueue(self, lane: Lane, writes: Sequence[_Write]) -> bool:
+        with self._condition:
+            if self._closed:
+                logger.error("MIDI scheduler is closed")
+                return False
+            queue = self._lanes[lane]
+            if len(queue) + len(writes) > self.max_queue:
+                logger.warning(
+                    f"MIDI {lane.name.lower()} lane full, dropping {len(writes)} writes"
+                )
+                return False
+            queue.extend(writes)
+            self._pending_bytes += sum(write.size for write in writes)
+            self._condition.notify_all()
+        return True
+
+    def send_message(self, data: Sequence[int], lane: Lane = Lane.REALTIME) -> bool:
+        """Queue a raw MIDI message such as a note or clock. See DigitoneMIDI.send_message."""
+        return self._enqueue(
+            lane, [_Write(self.midi.send_message, (bytes(data),), len(data))]
+        )
+
+    def send_cc(
+        self, channel: int, cc: int, value: int, lane: Lane = Lane.PARAMETER
+    ) -> bool:
+        """Queue a Control Change message. See DigitoneMIDI.send_cc."""
+        return self._enqueue(
+            lane, [_Write(self.midi.send_cc, (channel, cc, value), CC_MESSAGE_SIZE)]
+        )
+
+    def send_nrpn(
+        self,
+        channel: int,
+        nrpn_msb: int,
+        nrpn_lsb: int,
+        value: int,
+        lane: Lane = Lane.PARAMETER,
+    ) -> bool:
+        """Queue an NRPN parameter change. See DigitoneMIDI.send_nrpn."""
+        write = _Write(
+            self.midi.send_nrpn, (channel, nrpn_msb, nrpn_lsb, value), NRPN_MESSAGE_SIZE
+        )
+        return self._enqueue(lane, [write])
+
+    def send_cc_batch(
+        self,
+        channel: int,
+        messages: Sequence[Tuple[int, int]],
+        lane: Lane = Lane.PARAMETER,
+    ) -> bool:
+        """Queue several Control Change messages. See DigitoneMIDI.send_cc_batch."""
+        writes = [
+            _Write(self.midi.send_cc, (channel, cc, value), CC_MESSAGE_SIZE)
+            for cc, value in messages
+        ]
+        return self._enqueue(lane, writes)
+
+    def send_nrpn_batch(
+        self,
+        channel: int,
+        messages: Sequence[Tuple[int, int, int]],
+        lane: Lane = Lane.PARAMETER,
+    ) -> bool:
+        """Queue several NRPN parameter changes. See DigitoneMIDI.send_nrpn_batch."""
+        writes = [
+            _Write(
+                self.midi.send_nrpn,
+                (channel, nrpn_msb, nrpn_lsb, value),
+                NRPN_MESSAGE_SIZE,
+            )
+            for nrpn_msb, nrpn_lsb, value in messages
+        ]
+        return self._enqueue(lane, writes)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued write has been sent.
+
+        Returns:
+            bool: True if the queue drained before the timeout, False otherwise.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending_bytes and not self._busy, timeout
+            )
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Send the remaining queued writes and stop the worker thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill, up to the bucket size."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.burst_bytes),
+            self._tokens + (now - self._last_refill) * self.bytes_per_second,
+        )
+        self._last_refill = now
+
+    def _wire_size(self, write: _Write) -> int:
+        """Bytes the write will actually use, which is less for a cached NRPN address."""
+        if write.send == self.midi.send_nrpn:
+            return self.midi.nrpn_size(*write.args[:3])
+        return write.size
+
+    def _queued_wire_bytes(self) -> int:
+        """
+        Bytes the queued writes will put on the wire, in the order they will go out.
+
+        Replays the NRPN address cache over the queue, so repeated writes to the
+        selected parameter count 6 bytes instead of 12. Must hold the condition.
+        """
+        selected: Dict[int, Tuple[int, int]] = {}
+        total = 0
+        for queue in self._lanes:
+            for write in queue:
+                if write.send == self.midi.send_nrpn:
+                    channel, nrpn_msb, nrpn_lsb = write.args[:3]
+                    address = (nrpn_msb, nrpn_lsb)
+                    if channel not in selected:
+                        total += self.midi.nrpn_size(channel, nrpn_msb, nrpn_lsb)
+                    elif self.midi.cache_nrpn_address and selected[channel] == address:
+                        total += 2 * CC_MESSAGE_SIZE
+                    else:
+                        total += NRPN_MESSAGE_SIZE
+                    selected[channel] = address
+                    continue
+                if write.send == self.midi.send_cc and write.args[1] in (
+                    NRPN_MSB_CC,
+                    NRPN_LSB_CC,
+                ):
+                    # A raw CC 99/98 changes the selection, see DigitoneMIDI.send_cc
+                    selected.pop(write.args[0], None)
+                total += write.size
+        return total
+
+    def _next_write(self) -> Optional[_Write]:
+        """Wait for tokens and pop the highest priority write, or None once closed."""
+        with self._condition:
+            while True:
+                queue = next((queue for queue in self._lanes if queue), None)
+                if queue is None:
+                    if self._closed:
+                        return None
+                    self._condition.wait()
+                    continue
+
+                write = queue[0]
+                size = self._wire_size(write)
+                self._refill()
+                # Writes larger than the bucket go out once it is full
+                if self._tokens >= min(size, self.burst_bytes):
+                    queue.popleft()
+                    self._tokens -= size
+                    self._pending_bytes -= write.size
+                    self._busy = True
+                    return write
+
+                # New writes wake the worker early, so a higher lane can jump ahead
+                self._condition.wait(
+                    (min(size, self.burst_bytes) - self._tokens) / self.bytes_per_second
+                )
+
+    def _run(self) -> None:
+        while True:
+            write = self._next_write()
+            if write is None:
+                return
+            try:
+                if not write.send(*write.args):
+                    logger.warning(f"Scheduled MIDI write failed: {write.args}")
+            except Exception as e:
+                logger.error(f"Scheduled MIDI write raised: {e}")
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
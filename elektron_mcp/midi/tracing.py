@@ -0,0 +1,234 @@
+"""
+Span tracing
+
+Follows a tool call from FastMCP dispatch through the controller lookup and
+the controller call down to each port write, and exports the spans in the
+Chrome trace-event format, which opens in Perfetto (ui.perfetto.dev) or
+chrome://tracing.
+
+Tracing is off until a Tracer is installed with set_tracer(). The first span
+of a trace (normally the tool call) decides whether the trace is sampled,
+with the tracer's sample rate, and the spans nested in it follow that
+decision, so a low rate keeps the overhead negligible in production. The
+decision lives in a context variable: it follows asyncio tasks, and calls
+handed to the AsyncDigitoneMIDI I/O thread carry it along.
+
+When tracing is off, span() returns a shared no-op span.
+"""
+
+import contextvars
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Union
+
+# Whether the current trace is sampled, None outside any trace
+_sampled: contextvars.ContextVar[Optional[bool]] = contextvars.ContextVar(
+    "elektron_mcp_trace_sampled", default=None
+)
+
+
+class Tracer:
+    """Collects sampled spans as Chrome trace events. Thread-safe."""
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        max_events: int = 100_000,
+        clock: Callable[[], int] = time.perf_counter_ns,
+    ):
+        """
+        Args:
+            sample_rate: Fraction of traces recorded, between 0 and 1.
+            max_events: Events kept; the oldest are dropped beyond that.
+            clock: Nanosecond clock of the span timestamps.
+        """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(f"Invalid sample rate: {sample_rate}. Must be 0-1.")
+        self.sample_rate = sample_rate
+        self.clock = clock
+        self.events: Deque[dict] = deque(maxlen=max_events)
+        self._pid = os.getpid()
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def sample(self) -> bool:
+        """Decide whether a new trace is recorded."""
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def complete(
+        self, name: str, category: str, start_ns: int, args: Optional[dict] = None
+    ) -> None:
+        """
+        Record a span that started at start_ns and ends now.
+
+        Args:
+            name: Span name, e.g. 'send_nrpn'.
+            category: Span category, e.g. 'midi'.
+            start_ns: Start time, from the tracer's clock.
+            args: Extra details shown with the span.
+        """
+        end_ns = self.clock()
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start_ns / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": self._pid,
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            if thread.ident not in self._thread_names:
+                self._thread_names[thread.ident] = thread.name
+            self.events.append(event)
+
+    def clear(self) -> None:
+        """Drop every recorded event."""
+        with self._lock:
+            self.events.clear()
+
+    def trace(self) -> dict:
+        """Return the recorded events as a Chrome trace-event JSON object."""
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._thread_names)
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self._pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in threads.items()
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def export(self, path: Union[str, os.PathLike]) -> None:
+        """Write the recorded events to a Chrome trace JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.trace(), f)
+
+
+class Span:
+    """A span being timed, used as a context manager."""
+
+    __slots__ = ("tracer", "name", "category", "args", "root", "start", "token")
+
+    def __init__(
+        self, tracer: Tracer, name: str, category: str, args: dict, root: bool
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        # The first span of a sampled trace marks the context as sampled
+        self.root = root
+        self.start = 0
+        self.token: Optional[contextvars.Token] = None
+
+    def set(self, key: str, value) -> None:
+        """Attach a detail to the span."""
+        self.args[key] = value
+
+    def __enter__(self) -> "Span":
+        if self.root:
+            self.token = _sampled.set(True)
+        self.start = self.tracer.clock()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.args["error"] = f"{exc_type.__name__}: {exc}"
+        self.tracer.complete(self.name, self.category, self.start, self.args)
+        if self.token is not None:
+            _sampled.reset(self.token)
+
+
+class _RootDecision:
+    """First span of a trace that was not sampled: only records the decision."""
+
+    __slots__ = ("token",)
+
+    def set(self, key: str, value) -> None:
+        pass
+
+    def __enter__(self) -> "_RootDecision":
+        self.token = _sampled.set(False)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _sampled.reset(self.token)
+
+
+class _NullSpan:
+    """Span that records nothing."""
+
+    __slots__ = ()
+
+    def set(self, key: str, value) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+_tracer: Optional[Tracer] = None
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """Install the process-wide tracer, or turn tracing off with None."""
+    global _tracer
+    _tracer = tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Return the process-wide tracer, if tracing is on."""
+    return _tracer
+
+
+def recording() -> Optional[Tracer]:
+    """Return the tracer if the current trace is sampled, else None."""
+    tracer = _tracer
+    if tracer is None or not _sampled.get():
+        return None
+    return tracer
+
+
+def span(name: str, category: str = "app", **args):
+    """
+    Time a block as a span of the current trace.
+
+    Outside any trace the span starts one and decides whether it is sampled.
+
+    Args:
+        name: Span name, e.g. 'tool:set_param'.
+        category: Span category, e.g. 'mcp', 'controller' or 'midi'.
+        **args: Details shown with the span.
+
+    Returns:
+        A context manager; its set() method adds details while the span runs.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return NULL_SPAN
+    sampled = _sampled.get()
+    if sampled is None:
+        if not tracer.sample():
+            return _RootDecision()
+        return Span(tracer, name, category, args, root=True)
+    if not sampled:
+        return NULL_SPAN
+    return Span(tracer, name, category, args, root=False)
@@ -0,0 +1,266 @@
+"""
+MIDI wire log
+
+Records every message DigitoneMIDI writes or receives, with its
+time.perf_counter_ns() timestamp, to a compact append-only binary log, and
+replays a log to a port at the original or an accelerated speed. A recorded
+session can then be used to reproduce a glitch, or as a benchmark fixture.
+
+File format (little endian):
+
+    b"EMWL" magic, 1 byte version
+    records: uint64 timestamp_ns, uint8 kind, uint16 length, length data bytes
+
+Every recorder appends a SESSION record first, whose data is the wall-clock
+time.time_ns() of the recording. perf_counter_ns() values are only comparable
+within a process, so replay restarts its timing at each session.
+
+Usage:
+    python -m elektron_mcp.midi.wire_log info session.emwl
+    python -m elektron_mcp.midi.wire_log replay session.emwl --port NAME --speed 4
+"""
+
+import argparse
+import logging
+import os
+import struct
+import threading
+import time
+from typing import BinaryIO, Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+import mido
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"EMWL"
+VERSION = 1
+HEADER = MAGIC + bytes([VERSION])
+RECORD = struct.Struct("<QBH")
+WALL_CLOCK = struct.Struct("<Q")
+
+OUTGOING = 0
+INCOMING = 1
+SESSION = 2
+KIND_NAMES = {OUTGOING: "out", INCOMING: "in", SESSION: "session"}
+
+
+class WireEvent(NamedTuple):
+    timestamp_ns: int
+    kind: int  # OUTGOING, INCOMING or SESSION
+    data: bytes
+
+
+class WireRecorder:
+    """Appends timestamped MIDI traffic to a wire log file. Thread-safe."""
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        clock: Callable[[], int] = time.perf_counter_ns,
+    ):
+        """
+        Open (or create) the log and start a new session in it.
+
+        Args:
+            path: Log file. An existing log is appended to.
+            clock: Nanosecond timestamp source.
+        """
+        self.path = os.fspath(path)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._file: Optional[BinaryIO] = open(self.path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(HEADER)
+        self._append(SESSION, WALL_CLOCK.pack(time.time_ns()))
+
+    def _append(self, kind: int, data: bytes) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(RECORD.pack(self._clock(), kind, len(data)))
+            self._file.write(data)
+
+    def record_outgoing(self, data) -> None:
+        """Record bytes written to the device."""
+        self._append(OUTGOING, bytes(data))
+
+    def record_incoming(self, data) -> None:
+        """Record bytes received from the device."""
+        self._append(INCOMING, bytes(data))
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "WireRecorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_wire_log(path: Union[str, os.PathLike]) -> Iterator[WireEvent]:
+    """
+    Read the events of a wire log in file order.
+
+    A record cut short by a crash ends the log without an error.
+
+    Raises:
+        ValueError: If the file is not a wire log.
+    """
+    with open(path, "rb") as f:
+        header = f.read(len(HEADER))
+        if header[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a MIDI wire log: {path}")
+        if header[len(MAGIC) :] != bytes([VERSION]):
+            raise ValueError(f"Unsupported wire log version in {path}")
+        while True:
+            head = f.read(RECORD.size)
+            if len(head) < RECORD.size:
+                return
+            timestamp_ns, kind, length = RECORD.unpack(head)
+            data = f.read(length)
+            if len(data) < length:
+                logger.warning(f"Wire log {path} ends in a truncated record")
+                return
+            yield WireEvent(timestamp_ns, kind, data)
+
+
+class ReplayStats(NamedTuple):
+    messages: int  # Writes replayed
+    bytes: int
+    duration_ns: int
+    max_lag_ns: int  # Largest delay behind the scheduled send time
+
+
+def port_writer(port) -> Callable[[bytes], None]:
+    """
+    Return a function writing raw bytes to an output port.
+
+    Accepts the in-memory ports of elektron_mcp.midi.backends, mido rtmidi
+    ports (written raw) and any other mido output port (written message by
+    message). A record may hold several messages, e.g. an NRPN sequence, so
+    it is split into one raw write per message unless the port sets
+    ``coalesces_writes``: rtmidi rejects longer writes that are not SysEx.
+    """
+    raw_send = getattr(port, "send_raw", None)
+    if raw_send is not None and getattr(port, "coalesces_writes", False):
+        return raw_send
+    if raw_send is None:
+        raw_send = getattr(getattr(port, "_rt", None), "send_message", None)
+    if raw_send is not None:
+
+        def send_raw(data: bytes) -> None:
+            for msg in mido.parse_all(data):
+                raw_send(msg.bytes())
+
+        return send_raw
+
+    def send(data: bytes) -> None:
+        for msg in mido.parse_all(data):
+            port.send(msg)
+
+    return send
+
+
+def replay(
+    events: Iterable[WireEvent],
+    write: Callable[[bytes], None],
+    speed: Optional[float] = 1.0,
+    kind: int = OUTGOING,
+    clock: Callable[[], int] = time.perf_counter_ns,
+    sleep: Callable[[float], None] = time.sleep,
+) -> ReplayStats:
+    """
+    Send recorded events of one kind, keeping their relative timing.
+
+    Args:
+        events: Events, e.g. from read_wire_log().
+        write: Writes raw bytes, e.g. port_writer(port).
+        speed: Playback speed factor, 2.0 being twice as fast. None or 0 sends
+            everything as fast as possible.
+        kind: Which events to send, OUTGOING by default.
+        clock: Nanosecond clock used for scheduling.
+        sleep: Sleep function taking seconds.
+
+    Returns:
+        Counts and timing of the replay.
+    """
+    messages = sent_bytes = max_lag = 0
+    started = clock()
+    # (recorded time, replay time) of the current session's first event
+    origin: Optional[tuple] = None
+    for event in events:
+        if event.kind == SESSION:
+            origin = None
+            continue
+        if event.kind != kind:
+            continue
+        now = clock()
+        if origin is None:
+            origin = (event.timestamp_ns, now)
+        elif speed:
+            due = origin[1] + (event.timestamp_ns - origin[0]) / speed
+            if due > now:
+                sleep((due - now) / 1e9)
+                now = clock()
+            max_lag = max(max_lag, int(now - due))
+        write(event.data)
+        messages += 1
+        sent_bytes += len(event.data)
+    return ReplayStats(messages, sent_bytes, clock() - started, max_lag)
+
+
+def _info(path: str) -> None:
+    sessions = counts = 0
+    totals = {OUTGOING: [0, 0], INCOMING: [0, 0]}
+    first = last = None
+    for event in read_wire_log(path):
+        if event.kind == SESSION:
+            sessions += 1
+            continue
+        counts += 1
+        totals[event.kind][0] += 1
+        totals[event.kind][1] += len(event.data)
+        first = event.timestamp_ns if first is None else first
+        last = event.timestamp_ns
+    print(f"{path}: {sessions} session(s), {counts} events")
+    for kind, (events, size) in totals.items():
+        print(f"  {KIND_NAMES[kind]:<4}{events:>10} events{size:>12,} bytes")
+    if first is not None and sessions == 1:
+        print(f"  span {(last - first) / 1e9:.3f} s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Inspect or replay a MIDI wire log.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    info = commands.add_parser("info", help="Summarize a log")
+    info.add_argument("path")
+    play = commands.add_parser("replay", help="Send a log's outgoing messages")
+    play.add_argument("path")
+    play.add_argument("--port", required=True, help="MIDI output port name")
+    play.add_argument(
+        "--speed", type=float, default=1.0, help="Speed factor, 0 for no waiting"
+    )
+    args = parser.parse_args()
+
+    if args.command == "info":
+        _info(args.path)
+        return
+    with mido.open_output(args.port) as port:
+        stats = replay(read_wire_log(args.path), port_writer(port), args.speed)
+    print(
+        f"Replayed {stats.messages} writes ({stats.bytes:,} bytes) in "
+        f"{stats.duration_ns / 1e9:.3f} s, max lag {stats.max_lag_ns / 1e6:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""
+Display tables for the generated per-parameter tools.
+
+Ranges, defaults and option lists come from the parameter config. These tables
+only hold what the config does not know: the tool name, a one-line summary, a
+label for the value, and notes on how the device displays a value. Sections
+without a table get tools named after their parameters (see generated_tools).
+"""
+
+from typing import Dict, NamedTuple, Tuple
+
+
+class ToolSpec(NamedTuple):
+    name: str  # Tool name, e.g. 'set_wavetone_osc1_pitch'
+    parameter: str  # Parameter name in the section, e.g. 'TUN1'
+    summary: str
+    label: str  # What the value is, e.g. 'Pitch'
+    # Extra lines documenting the value, after the range and options
+    notes: Tuple[str, ...] = ()
+    # Whether display values between the end points are linearly mapped
+    linear: bool = False
+    unit: str = ""
+    # Replace the display range and default derived from the config, e.g.
+    # 'continuous' and '0 (Lowpass)'
+    display_range: str = ""
+    default: str = ""
+
+
+WAVEFORM_NOTES = (
+    "- 0   = Sine",
+    "- 40  = Triangle",
+    "- 80  = Saw",
+    "- 3   = Square",
+    "Values between these points represent transitions between waveforms.",
+)
+
+FILTER_TYPE_NOTES = (
+    "- 0   = Lowpass",
+    "- 64  = EQ",
+    "- 127 = Highpass",
+    "Values between these points represent transitions between filter types.",
+)
+
+WAVETABLE_SUMMARY = (
+    "Select the wavetable for oscillator {n}'s WAVE parameter. Options include "
+    "PRIM (basic waves like Sin, Tri, Saw, Square) and HARM (a range of "
+    "harmonic combinations)."
+)
+
+
+def _oscillator_specs(n: int, word: str) -> Tuple[ToolSpec, ...]:
+    prefix = f"set_wavetone_osc{n}"
+    return (
+        ToolSpec(
+            f"{prefix}_pitch",
+            f"TUN{n}",
+            f"Set the pitch of oscillator {word}.",
+            "Pitch",
+            linear=True,
+        ),
+        ToolSpec(
+            f"{prefix}_waveform",
+            f"WAV{n}",
+            f"Set the waveform of oscillator {word}.",
+            "Waveform",
+            WAVEFORM_NOTES,
+        ),
+        ToolSpec(
+            f"{prefix}_phase_distortion",
+            f"PD{n}",
+            f"Set the phase distortion of oscillator {word}.",
+            "Phase distortion",
+            linear=True,
+            unit="%",
+        ),
+        ToolSpec(
+            f"{prefix}_level",
+            f"LEV{n}",
+            f"Set the level of oscillator {word}.",
+            "Level",
+        ),
+        ToolSpec(
+            f"{prefix}_offset",
+            f"OFS{n}",
+            f"Set the offset of oscillator {word}.",
+            "Offset",
+            linear=True,
+        ),
+        ToolSpec(
+            f"{prefix}_wavetable",
+            f"TBL{n}",
+            WAVETABLE_SUMMARY.format(n=n),
+            "Wavetable",
+        ),
+    )
+
+
+WAVETONE_SPECS = (
+    *_oscillator_specs(1, "one"),
+    *_oscillator_specs(2, "two"),
+    ToolSpec(
+        "set_wavetone_mod_type",
+        "MOD",
+        "Select how the two oscillators interact. The options are OFF, RING MOD "
+        "(Oscillator 2 modulates Oscillator 1), RING MOD FIXED (Oscillator 2 "
+        "modulates Oscillator 1, but its pitch doesn't track note values), and "
+        "HARD SYNC (Oscillator 1's phase resets with each new cycle of "
+        "Oscillator 2).",
+        "Modulation type",
+    ),
+    ToolSpec(
+        "set_wavetone_reset_mode",
+        "RSET",
+        "Set if and how the oscillators' wave phases reset when a note is "
+        "played. Options are OFF (no reset), ON (reset to the start of the "
+        "waveform), and RAND (reset to a random position).",
+        "Reset mode",
+    ),
+    ToolSpec("set_wavetone_drift", "DRIF", "Set the drift amount.", "Drift"),
+    ToolSpec("set_wavetone_attack", "ATK", "Set the attack time.", "Attack time"),
+    ToolSpec("set_wavetone_hold", "HOLD", "Set the hold time.", "Hold time"),
+    ToolSpec("set_wavetone_decay", "DEC", "Set the decay time.", "Decay time"),
+    ToolSpec("set_wavetone_noise_level", "NLEV", "Set the noise level.", "Noise level"),
+    ToolSpec(
+        "set_wavetone_noise_base",
+        "BASE",
+        "Set the noise base frequency.",
+        "Noise base frequency",
+    ),
+    ToolSpec("set_wavetone_noise_width", "WDTH", "Set the noise width.", "Noise width"),
+    ToolSpec("set_wavetone_noise_type", "TYPE", "Set the noise type.", "Noise type"),
+    ToolSpec(
+        "set_wavetone_noise_character",
+        "CHAR",
+        "Set the noise character.",
+        "Noise character",
+    ),
+)
+
+MULTI_MODE_FILTER_SPECS = (
+    ToolSpec(
+        "set_multimode_filter_attack",
+        "ATK",
+        "Set the attack time of the multi-mode filter envelope.",
+        "Attack time",
+    ),
+    ToolSpec(
+        "set_multimode_filter_decay",
+        "DEC",
+        "Set the decay time of the multi-mode filter envelope.",
+        "Decay time",
+    ),
+    ToolSpec(
+        "set_multimode_filter_sustain",
+        "SUS",
+        "Set the sustain level of the multi-mode filter envelope.",
+        "Sustain level",
+    ),
+    ToolSpec(
+        "set_multimode_filter_release",
+        "REL",
+        "Set the release time of the multi-mode filter envelope.",
+        "Release time",
+    ),
+    ToolSpec(
+        "set_multimode_filter_frequency",
+        "FREQ",
+        "Set the cutoff frequency of the multi-mode filter.",
+        "Cutoff frequency",
+    ),
+    ToolSpec(
+        "set_multimode_filter_resonance",
+        "RESO",
+        "Set the resonance of the multi-mode filter.",
+        "Resonance",
+    ),
+    ToolSpec(
+        "set_multimode_filter_type",
+        "TYPE",
+        "Set the type of the multi-mode filter.",
+        "Filter type",
+        FILTER_TYPE_NOTES,
+        display_range="continuous",
+        default="0 (Lowpass)",
+    ),
+    ToolSpec(
+        "set_multimode_filter_envelope_depth",
+        "ENV.Depth",
+        "Set the envelope depth of the multi-mode filter.",
+        "Envelope depth",
+        linear=True,
+    ),
+)
+
+AMP_SPECS = (
+    ToolSpec(
+        "set_amp_attack",
+        "ATK",
+        "Set the attack time of the amplitude envelope.",
+        "Attack time",
+    ),
+    ToolSpec(
+        "set_amp_hold",
+        "HOLD",
+        "Set the hold time of the amplitude envelope.",
+        "Hold time",
+    ),
+    ToolSpec(
+        "set_amp_decay",
+        "DEC",
+        "Set the decay time of the amplitude envelope.",
+        "Decay time",
+    ),
+    ToolSpec(
+        "set_amp_sustain",
+        "SUS",
+        "Set the sustain level of the amplitude envelope.",
+        "Sustain level",
+    ),
+    ToolSpec(
+        "set_amp_release",
+        "REL",
+        "Set the release time of the amplitude envelope.",
+        "Release time",
+    ),
+    ToolSpec(
+        "set_amp_envelope_reset",
+        "Env. RSET",
+        "Set the envelope reset mode.",
+        "Envelope reset mode",
+    ),
+    ToolSpec(
+        "set_amp_envelope_mode", "MODE", "Set the envelope mode.", "Envelope mode"
+    ),
+    ToolSpec(
+        "set_amp_pan",
+        "PAN",
+        "Set the stereo panning position.",
+        "Pan position",
+        linear=True,
+    ),
+    ToolSpec("set_amp_volume", "VOL", "Set the overall volume level.", "Volume level"),
+)
+
+FX_SPECS = (
+    ToolSpec(
+        "set_fx_bit_reduction", "BR", "Set the bit reduction amount.", "Bit reduction"
+    ),
+    ToolSpec("set_fx_overdrive", "OVER", "Set the overdrive amount.", "Overdrive"),
+    ToolSpec(
+        "set_fx_sample_rate_reduction",
+        "SRR",
+        "Set the sample rate reduction amount.",
+        "Sample rate reduction",
+    ),
+    ToolSpec(
+        "set_fx_sample_rate_routing",
+        "SR.RT(pre/post)",
+        "Set the sample rate reduction routing.",
+        "Sample rate routing",
+    ),
+    ToolSpec(
+        "set_fx_overdrive_routing",
+        "OD.RT(pre/post)",
+        "Set the overdrive routing.",
+        "Overdrive routing",
+    ),
+    ToolSpec("set_fx_delay", "DEL", "Set the delay send amount.", "Delay send"),
+    ToolSpec("set_fx_reverb", "REV", "Set the reverb send amount.", "Reverb send"),
+    ToolSpec("set_fx_chorus", "CHR", "Set the chorus send amount.", "Chorus send"),
+)
+
+
+def lfo_specs(n: int) -> Tuple[ToolSpec, ...]:
+    """Tool specs of LFO n."""
+    prefix, lfo = f"set_lfo{n}", f"LFO{n}"
+    return (
+        ToolSpec(f"{prefix}_speed", "SPD", f"Set the speed of {lfo}.", "Speed"),
+        ToolSpec(
+            f"{prefix}_multiplier",
+            "MULT",
+            f"Set the multiplier of {lfo}.",
+            "Multiplier",
+        ),
+        ToolSpec(f"{prefix}_fade", "FADE", f"Set the fade in/out of {lfo}.", "Fade"),
+        ToolSpec(
+            f"{prefix}_destination",
+            "DEST",
+            f"Set the destination of {lfo}.",
+            "Destination",
+        ),
+        ToolSpec(
+            f"{prefix}_waveform", "WAVE", f"Set the waveform of {lfo}.", "Waveform"
+        ),
+        ToolSpec(
+            f"{prefix}_start_phase",
+            "SPH",
+            f"Set the start phase of {lfo}.",
+            "Start phase",
+        ),
+        ToolSpec(
+            f"{prefix}_trigger_mode",
+            "MODE",
+            f"Set the trigger mode of {lfo}.",
+            "Trigger mode",
+        ),
+        ToolSpec(f"{prefix}_depth", "DEP", f"Set the depth of {lfo}.", "Depth"),
+    )
+
+
+# Tool specs by section name (see sections.SECTIONS)
+TOOL_TABLES: Dict[str, Tuple[ToolSpec, ...]] = {
+    "wavetone": WAVETONE_SPECS,
+    "multi_mode_filter": MULTI_MODE_FILTER_SPECS,
+    "amp": AMP_SPECS,
+    "fx": FX_SPECS,
+    "lfo1": lfo_specs(1),
+    "lfo2": lfo_specs(2),
+    "lfo3": lfo_specs(3),
+}
@@ -0,0 +1,247 @@
+"""
+Per-parameter tools generated from the parameter config.
+
+Each enabled section gets one set_* tool per parameter. Ranges, defaults and
+options are read from the config and display notes from display_tables.
+FastMCP takes a tool's description when the tool is added, so registering a
+section builds it (or loads it from the config cache); sections that are not
+enabled are never built.
+"""
+
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from elektron_mcp.digitone.config.parameter_table import ControllerKey
+from elektron_mcp.digitone.models.models import DigitoneParams
+from elektron_mcp.digitone.utils.parameter_utils import iter_group_parameters
+from elektron_mcp.midi.async_midi import run_midi_call
+from elektron_mcp.tools.display_tables import TOOL_TABLES, ToolSpec
+from elektron_mcp.tools.sections import (
+    SECTIONS,
+    get_section,
+    parameter_key,
+    section_controller,
+)
+
+# Sections registered unless configured otherwise: the ones that had
+# hand-written tools
+DEFAULT_SECTIONS = ("wavetone", "multi_mode_filter", "amp", "fx", "lfo1", "lfo2")
+ALL_SECTIONS = "all"
+
+
+def parse_sections(value: Optional[str]) -> Tuple[str, ...]:
+    """
+    Parse a comma-separated list of section names.
+
+    Args:
+        value: e.g. 'wavetone,amp', 'all' for every section, or None/empty for
+            DEFAULT_SECTIONS.
+
+    Raises:
+        ValueError: If a section does not exist.
+    """
+    if not value:
+        return DEFAULT_SECTIONS
+    if value.strip() == ALL_SECTIONS:
+        return tuple(SECTIONS)
+    sections = tuple(name.strip() for name in value.split(",") if name.strip())
+    for section in sections:
+        get_section(section)
+    return sections
+
+
+def _slug(name: str) -> str:
+    return "_".join("".join(c if c.isalnum() else " " for c in name).lower().split())
+
+
+def tool_specs(section: str) -> Tuple[ToolSpec, ...]:
+    """
+    Tool specs of a section: its display table, or specs derived from the
+    parameter names if it has none.
+
+    Raises:
+        ValueError: If the section does not exist.
+    """
+    entry = get_section(section)
+    table = TOOL_TABLES.get(section)
+    if table is not None:
+        return table
+    return tuple(
+        ToolSpec(
+            f"set_{section}_{_slug(name)}",
+            name,
+            f"Set {name} ({entry.description}).",
+            name,
+        )
+        for _, _, name, _ in iter_group_parameters(entry.config())
+    )
+
+
+def _format(value, signed: bool = False, unit: str = "") -> str:
+    text = f"{value:g}" if isinstance(value, float) else str(value)
+    if signed and isinstance(value, (int, float)) and value > 0:
+        text = f"+{text}"
+    return f"{text}{unit}"
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _value_lines(spec: ToolSpec, param: DigitoneParams) -> List[str]:
+    low, high = sorted((int(param.min_midi_value), int(param.max_midi_value)))
+    options = param.options
+    if isinstance(options, dict):
+        # Named values such as 'none' may lie outside the range
+        low, high = min(low, *options.values()), max(high, *options.values())
+
+    lines = [f"{spec.label} value ranging from {low} to {high}."]
+    default = param.default_value
+    display_min, display_max = param.min_value, param.max_value
+
+    if isinstance(options, dict):
+        for name, value in sorted(options.items(), key=lambda item: item[1]):
+            marker = " (default)" if name == default else ""
+            lines.append(f"- {value} = {name}{marker}")
+    elif options:
+        for value, name in enumerate(options):
+            lines.append(f'- {value} = "{name}"')
+    elif _is_number(display_min) and _is_number(display_max):
+        signed = display_min < 0
+        if (display_min, display_max) != (low, high):
+            lines.append(f"- {low} maps to {_format(display_min, signed, spec.unit)}")
+            center = _center(display_min, display_max, spec.linear)
+            if center is not None and high - low > 1:
+                middle = (low + high + 1) // 2
+                lines.append(f"- {middle} maps to {_format(center, unit=spec.unit)}")
+            lines.append(f"- {high} maps to {_format(display_max, signed, spec.unit)}")
+            if spec.linear:
+                lines.append("Values in between are linearly mapped.")
+
+    lines.extend(spec.notes)
+
+    if spec.display_range:
+        lines.append(f"Display range: {spec.display_range}.")
+    elif options and not isinstance(options, dict):
+        lines.append("Display range: discrete options.")
+    elif not options and _is_number(display_min) and _is_number(display_max):
+        signed = display_min < 0
+        lines.append(
+            f"Display range: {_format(display_min, signed, spec.unit)} to "
+            f"{_format(display_max, signed, spec.unit)}."
+        )
+
+    if spec.default:
+        lines.append(f"Default is {spec.default}.")
+    elif options and not isinstance(options, dict) and default in options:
+        lines.append(f'Default is "{default}" ({options.index(default)}).')
+    elif (
+        options
+        and not isinstance(options, dict)
+        and isinstance(default, int)
+        and 0 <= default < len(options)
+    ):
+        # Some defaults are given as the option's index
+        lines.append(f'Default is "{options[default]}" ({default}).')
+    elif _is_number(default):
+        bipolar = _is_number(display_min) and display_min < 0 and default == 0
+        center = " (center)" if bipolar and not options else ""
+        lines.append(f"Default is {_format(default, unit=spec.unit)}{center}.")
+    return lines
+
+
+def _center(display_min, display_max, linear: bool):
+    """
+    Display value of the middle MIDI value: 0 for bipolar ranges such as
+    -64 to +63, the midpoint for other linear ranges, else None.
+    """
+    if display_min < 0 < display_max:
+        return 0
+    if linear:
+        middle = (display_min + display_max) / 2
+        return int(middle) if middle == int(middle) else middle
+    return None
+
+
+def _section_parameters(section: str) -> Dict[ControllerKey, DigitoneParams]:
+    return {
+        key: param
+        for key, _, _, param in iter_group_parameters(get_section(section).config())
+    }
+
+
+def render_description(
+    section: str,
+    spec: ToolSpec,
+    parameters: Optional[Dict[ControllerKey, DigitoneParams]] = None,
+) -> str:
+    """
+    Render the description of a generated tool from its spec and the config.
+
+    Args:
+        section: Section name, see sections.SECTIONS.
+        spec: The tool's spec.
+        parameters: The section's parameters by controller key, when already
+            looked up for several tools.
+
+    Raises:
+        ValueError: If the section or parameter does not exist.
+    """
+    key = parameter_key(section, spec.parameter)
+    if parameters is None:
+        parameters = _section_parameters(section)
+    param = parameters[key]
+
+    value_lines = _value_lines(spec, param)
+    args = [f"    value (int): {value_lines[0]}"]
+    args.extend(f"        {line}" for line in value_lines[1:])
+    args.append(
+        f"    track (int): The track number to set the {spec.label.lower()} for. 1-16"
+    )
+    return "\n".join([spec.summary, "", "Args:", *args])
+
+
+def _make_setter(
+    midi, section: str, key: ControllerKey
+) -> Callable[..., Awaitable[bool]]:
+    if isinstance(key, tuple):
+        page, name = key
+
+        async def set_value(value: int, track: int) -> bool:
+            controller = section_controller(section, midi, track, write=True)
+            return await run_midi_call(
+                midi, controller.set_parameter, page, name, value
+            )
+
+    else:
+
+        async def set_value(value: int, track: int) -> bool:
+            controller = section_controller(section, midi, track, write=True)
+            return await run_midi_call(
+                midi, controller.set_direct_parameter, key, value
+            )
+
+    return set_value
+
+
+def register_section_tools(mcp, midi, sections: Iterable[str] = DEFAULT_SECTIONS):
+    """
+    Register one set_* tool per parameter of each section with the MCP server.
+
+    Args:
+        mcp: The MCP server instance
+        midi: The MIDI interface
+        sections: Section names, see sections.SECTIONS.
+
+    Raises:
+        ValueError: If a section or a parameter in its display table does not exist.
+    """
+    for section in sections:
+        parameters = _section_parameters(section)
+        for spec in tool_specs(section):
+            setter = _make_setter(midi, section, parameter_key(section, spec.parameter))
+            setter.__name__ = spec.name
+            mcp.add_tool(
+                setter,
+                name=spec.name,
+                description=render_description(section, spec, parameters),
+            )
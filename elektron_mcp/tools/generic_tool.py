@@ -0,0 +1,87 @@
+"""
+Generic tools addressing any Digitone parameter by section and name.
+
+A handful of tools replaces one tool per parameter, which keeps the tool list
+small. Valid names and ranges are served by describe_section and by the
+digitone://sections resources instead of tool docstrings.
+"""
+
+from typing import Optional
+
+from elektron_mcp.midi.async_midi import run_midi_call
+from elektron_mcp.tools.sections import (
+    describe_section as describe,
+    parameter_key,
+    section_controller,
+    section_json,
+    sections_json,
+)
+
+
+def register_generic_tools(mcp, midi):
+    """
+    Register the generic tools and parameter resources with the MCP server.
+
+    Args:
+        mcp: The MCP server instance
+        midi: The MIDI interface
+    """
+
+    @mcp.resource("digitone://sections", mime_type="application/json")
+    def sections() -> str:
+        """Parameter sections that set_param and get_param accept."""
+        return sections_json()
+
+    @mcp.resource("digitone://sections/{section}", mime_type="application/json")
+    def section(section: str) -> str:
+        """Parameter names, MIDI ranges, defaults and options of a section."""
+        return section_json(section)
+
+    @mcp.tool()
+    def describe_section(section: str):
+        """
+        List the parameters of a section with their MIDI ranges, defaults and options.
+
+        Args:
+            section (str): Section name, see the digitone://sections resource,
+                e.g. 'wavetone', 'fmtone', 'multi_mode_filter', 'amp', 'fx', 'lfo1'.
+        """
+        return describe(section)
+
+    def set_one(section: str, parameter: str, value: int, track: int):
+        key = parameter_key(section, parameter)
+        result = section_controller(section, midi, track, write=True).set_parameters(
+            {key: value}
+        )[key]
+        if isinstance(result, str):
+            raise ValueError(result)
+        return result
+
+    @mcp.tool()
+    async def set_param(section: str, parameter: str, value: int, track: int):
+        """
+        Set one parameter.
+
+        Args:
+            section (str): Section name, e.g. 'wavetone' or 'amp'.
+            parameter (str): Parameter name from describe_section, e.g. 'TUN1'.
+            value (int): Raw MIDI value within the parameter's min-max range.
+            track (int): The track number to set it on. 1-16
+        """
+        return await run_midi_call(midi, set_one, section, parameter, value, track)
+
+    @mcp.tool()
+    def get_param(section: str, parameter: str, track: int) -> Optional[int]:
+        """
+        Get the last value set for a parameter, or null if it is not known.
+
+        Args:
+            section (str): Section name, e.g. 'wavetone' or 'amp'.
+            parameter (str): Parameter name from describe_section, e.g. 'TUN1'.
+            track (int): The track number to read it from. 1-16
+        """
+        key = parameter_key(section, parameter)
+        controller = section_controller(section, midi, track)
+        if isinstance(key, tuple):
+            return controller.get_parameter(*key)
+        return controller.get_direct_parameter(key)
@@ -0,0 +1,30 @@
+"""
+MIDI metrics resources.
+
+Serve the counters and latency histograms of elektron_mcp.midi.metrics to
+MCP clients, as JSON and in the Prometheus text format.
+"""
+
+import json
+
+from elektron_mcp.midi.metrics import Metrics
+
+
+def register_metrics_resources(mcp, metrics: Metrics):
+    """
+    Register the metrics resources with the MCP server.
+
+    Args:
+        mcp: The MCP server instance
+        metrics: The metrics the MIDI interface records into
+    """
+
+    @mcp.resource("metrics://midi", mime_type="application/json")
+    def midi_metrics() -> str:
+        """MIDI message, byte and error counts, and send latency percentiles in ns."""
+        return json.dumps(metrics.snapshot())
+
+    @mcp.resource("metrics://midi/prometheus", mime_type="text/plain")
+    def midi_metrics_prometheus() -> str:
+        """The MIDI metrics in the Prometheus text exposition format."""
+        return metrics.prometheus()
@@ -0,0 +1,93 @@
+"""
+Patch tool for setting many parameters on the Digitone in one call.
+"""
+
+from typing import Dict, List, Tuple
+
+from pydantic import BaseModel
+
+from elektron_mcp.midi.async_midi import run_midi_call
+from elektron_mcp.midi.scheduler import Lane
+from elektron_mcp.tools.sections import parameter_key, section_controller
+
+
+class PatchEntry(BaseModel):
+    section: str
+    parameter: str
+    value: int
+    track: int
+
+
+def apply_patch_entries(midi, entries: List[PatchEntry]) -> Dict[str, object]:
+    """
+    Validate a list of parameter changes and send them one batch per section and track.
+
+    Values are sent as CC messages. The batches go in the bulk lane of a
+    MidiScheduler, behind notes, clock and single parameter changes.
+
+    Returns:
+        {"applied": count, "errors": {"section.parameter@track": message}}. A
+        parameter that already held its value counts as applied.
+    """
+    errors: Dict[str, str] = {}
+    batches: Dict[Tuple[str, int], Dict] = {}
+    labels: Dict[Tuple[str, int, object], str] = {}
+
+    for entry in entries:
+        label = f"{entry.section}.{entry.parameter}@{entry.track}"
+        if not 1 <= entry.track <= 16:
+            errors[label] = f"Invalid track: {entry.track}. Must be between 1-16."
+            continue
+        try:
+            key = parameter_key(entry.section, entry.parameter)
+        except ValueError as e:
+            errors[label] = str(e)
+            continue
+        # A later entry for the same parameter replaces the earlier one
+        batches.setdefault((entry.section, entry.track), {})[key] = entry.value
+        labels[(entry.section, entry.track, key)] = label
+
+    applied = 0
+    for (section, track), values in batches.items():
+        controller = section_controller(section, midi, track, write=True)
+        results = controller.set_parameters(values, lane=Lane.BULK)
+        for key, result in results.items():
+            if result is True:
+                applied += 1
+            else:
+                label = labels[(section, track, key)]
+                errors[label] = result or "Failed to send"
+
+    return {"applied": applied, "errors": errors}
+
+
+def register_patch_tools(mcp, midi):
+    """
+    Register the patch tools with the MCP server.
+
+    Args:
+        mcp: The MCP server instance
+        midi: The MIDI interface
+    """
+
+    @mcp.tool()
+    async def apply_patch(entries: List[PatchEntry]):
+        """
+        Set many parameters in one call, e.g. a whole sound.
+
+        Args:
+            entries (list): Parameter changes, each with:
+                - section (str): One of wavetone, fmtone, fmdrum, swarmer,
+                  multi_mode_filter, lowpass_4_filter, legacy_lp_hp_filter,
+                  comb_minus_filter, comb_plus_filter, equalizer_filter,
+                  base_width_filter, amp, fx, lfo1, lfo2, lfo3.
+                - parameter (str): Parameter name as shown on the device, e.g.
+                  'TUN1' (wavetone), 'FREQ' (multi_mode_filter), 'ATK' (amp).
+                - value (int): Raw MIDI value, within the parameter's range.
+                - track (int): The track number to set it on. 1-16
+
+        Returns:
+            The number of applied changes and an error message for each entry
+            that could not be applied, keyed by 'section.parameter@track'.
+        """
+        return await run_midi_call(midi, apply_patch_entries, midi, entries)
@@ -0,0 +1,45 @@
+"""
+Tool registration for the MCP server.
+
+Two tool sets are available:
+
+- full: one tool per parameter of the enabled sections, generated from the
+  parameter config, plus apply_patch.
+- compact: the generic set_param, get_param, describe_section and apply_patch
+  tools, with parameter names and ranges served as digitone://sections
+  resources. The tool list stays small however many sections are exposed.
+"""
+
+from typing import Iterable
+
+from elektron_mcp.tools.generated_tools import DEFAULT_SECTIONS, register_section_tools
+from elektron_mcp.tools.generic_tool import register_generic_tools
+from elektron_mcp.tools.patch_tool import register_patch_tools
+
+FULL_MODE = "full"
+COMPACT_MODE = "compact"
+TOOL_MODES = (FULL_MODE, COMPACT_MODE)
+
+
+def register_tools(
+    mcp, midi, mode: str = FULL_MODE, sections: Iterable[str] = DEFAULT_SECTIONS
+):
+    """
+    Register the tools of a mode with the MCP server.
+
+    Args:
+        mcp: The MCP server instance
+        midi: The MIDI interface
+        mode: 'full' or 'compact'.
+        sections: Sections that get per-parameter tools in full mode.
+
+    Raises:
+        ValueError: If the mode or a section is unknown.
+    """
+    if mode == FULL_MODE:
+        register_section_tools(mcp, midi, sections)
+    elif mode == COMPACT_MODE:
+        register_generic_tools(mcp, midi)
+    else:
+        raise ValueError(f"Invalid tool mode: {mode}. Must be one of {TOOL_MODES}.")
+    register_patch_tools(mcp, midi)
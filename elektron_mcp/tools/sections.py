@@ -0,0 +1,243 @@
+"""
+Parameter sections exposed by the generic tools.
+
+Maps the section names used in tool arguments (e.g. 'wavetone', 'amp') to the
+controller class and parameter config behind them, and parameter names to the
+keys the controllers use, so tools can address any parameter by
+(section, parameter, track).
+"""
+
+import json
+from functools import cache
+from typing import Callable, Dict, NamedTuple, Type
+
+from elektron_mcp.digitone.config.config import digitone_config, parameter_table
+from elektron_mcp.digitone.config.parameter_table import ControllerKey
+from elektron_mcp.digitone.models.descriptor import ParameterDescriptor
+from elektron_mcp.digitone.services.amp_fx_controller import AmpController, FXController
+from elektron_mcp.digitone.services.base_synth_controller import BaseSynthController
+from elektron_mcp.digitone.services.controller_registry import controller_registry
+from elektron_mcp.digitone.services.filter_controller import (
+    BaseWidthFilterController,
+    CombMinusFilterController,
+    CombPlusFilterController,
+    EqualizerFilterController,
+    LegacyLpHpFilterController,
+    Lowpass4FilterController,
+    MultiModeFilterController,
+)
+from elektron_mcp.digitone.services.fm_drum_controller import FMDrumController
+from elektron_mcp.digitone.services.fm_tone_controller import FMToneController
+from elektron_mcp.digitone.services.lfo_controller import (
+    LFO1Controller,
+    LFO2Controller,
+    LFO3Controller,
+)
+from elektron_mcp.digitone.services.swarmer_controller import SwarmerController
+from elektron_mcp.digitone.services.wavetone_controller import WavetoneController
+from elektron_mcp.digitone.utils.parameter_utils import iter_group_parameters
+from elektron_mcp.midi.tracing import span
+
+
+class Section(NamedTuple):
+    controller_class: Type[BaseSynthController]
+    # Returns the parameter config; the section is only built when first used
+    config: Callable[[], dict]
+    description: str
+    # Synth engine sections are the track's machine: using one records it
+    machine: bool = False
+
+
+SECTIONS: Dict[str, Section] = {
+    "wavetone": Section(
+        WavetoneController,
+        lambda: digitone_config.wavetone.pages,
+        "Wavetone oscillators and noise",
+        machine=True,
+    ),
+    "fmtone": Section(
+        FMToneController,
+        lambda: digitone_config.fmtone.pages,
+        "FM Tone operators, envelopes and harmonics",
+        machine=True,
+    ),
+    "fmdrum": Section(
+        FMDrumController,
+        lambda: digitone_config.fmdrum.pages,
+        "FM Drum body, operators, transient and noise",
+        machine=True,
+    ),
+    "swarmer": Section(
+        SwarmerController,
+        lambda: digitone_config.swarmer.pages,
+        "Swarmer oscillator swarm",
+        machine=True,
+    ),
+    "multi_mode_filter": Section(
+        MultiModeFilterController,
+        lambda: digitone_config.multi_mode_filter.parameters,
+        "Multi-mode filter and its envelope",
+    ),
+    "lowpass_4_filter": Section(
+        Lowpass4FilterController,
+        lambda: digitone_config.lowpass_4_filter.parameters,
+        "Lowpass 4 filter and its envelope",
+    ),
+    "legacy_lp_hp_filter": Section(
+        LegacyLpHpFilterController,
+        lambda: digitone_config.legacy_lp_hp_filter.parameters,
+        "Legacy lowpass/highpass filter and its envelope",
+    ),
+    "comb_minus_filter": Section(
+        CombMinusFilterController,
+        lambda: digitone_config.comb_minus_filter.parameters,
+        "Comb- filter and its envelope",
+    ),
+    "comb_plus_filter": Section(
+        CombPlusFilterController,
+        lambda: digitone_config.comb_plus_filter.parameters,
+        "Comb+ filter and its envelope",
+    ),
+    "equalizer_filter": Section(
+        EqualizerFilterController,
+        lambda: digitone_config.equalizer_filter.parameters,
+        "Equalizer filter",
+    ),
+    "base_width_filter": Section(
+        BaseWidthFilterController,
+        lambda: digitone_config.base_width_filter.parameters,
+        "Base-width filter",
+    ),
+    "amp": Section(
+        AmpController,
+        lambda: digitone_config.amp_page.parameters,
+        "Amplitude envelope, pan and volume",
+    ),
+    "fx": Section(
+        FXController,
+        lambda: digitone_config.fx_page.parameters,
+        "Effect sends, bit reduction, sample rate reduction and overdrive",
+    ),
+    "lfo1": Section(
+        LFO1Controller,
+        lambda: digitone_config.lfo.lfo_groups["lfo_1"],
+        "LFO 1",
+    ),
+    "lfo2": Section(
+        LFO2Controller,
+        lambda: digitone_config.lfo.lfo_groups["lfo_2"],
+        "LFO 2",
+    ),
+    "lfo3": Section(
+        LFO3Controller,
+        lambda: digitone_config.lfo.lfo_groups["lfo_3"],
+        "LFO 3",
+    ),
+}
+
+
+def get_section(section: str) -> Section:
+    """
+    Raises:
+        ValueError: If the section does not exist.
+    """
+    try:
+        return SECTIONS[section]
+    except KeyError:
+        raise ValueError(
+            f"Invalid section: {section}. Must be one of {', '.join(SECTIONS)}."
+        ) from None
+
+
+@cache
+def section_parameters(section: str) -> Dict[str, ControllerKey]:
+    """Controller keys of a section's parameters by parameter name."""
+    parameters = parameter_table.group(get_section(section).config())
+    return {key[1] if isinstance(key, tuple) else key: key for key in parameters}
+
+
+def parameter_key(section: str, parameter: str) -> ControllerKey:
+    """
+    Return the controller key of a parameter.
+
+    Raises:
+        ValueError: If the section or parameter does not exist.
+    """
+    key = section_parameters(section).get(parameter)
+    if key is None:
+        raise ValueError(f"Invalid parameter: {parameter} in {section}")
+    return key
+
+
+def parameter_descriptor(section: str, parameter: str) -> ParameterDescriptor:
+    """Return the compiled descriptor of a parameter. See parameter_key."""
+    config = get_section(section).config()
+    return parameter_table.group(config)[parameter_key(section, parameter)]
+
+
+def section_controller(
+    section: str, midi, track: int, write: bool = False
+) -> BaseSynthController:
+    """
+    Return the cached controller of a section on a track.
+
+    Writing to a synth engine section records it as the track's machine, so
+    switching engines drops the track's cached controllers and shadow values.
+    Reads leave the machine alone.
+
+    Args:
+        section: Section name, see SECTIONS.
+        midi: The MIDI interface the tool writes to.
+        track: Track/MIDI channel (1-16).
+        write: The controller is about to send values.
+    """
+    with span("section_controller", "controller", section=section, track=track):
+        entry = get_section(section)
+        if write and entry.machine and 1 <= track <= 16:
+            controller_registry.set_machine(midi, track, section)
+        return controller_registry.get(
+            entry.controller_class, entry.config(), midi, track
+        )
+
+
+@cache
+def describe_section(section: str) -> Dict[str, object]:
+    """
+    Names, MIDI ranges, defaults and options of every parameter in a section.
+
+    Raises:
+        ValueError: If the section does not exist.
+    """
+    entry = get_section(section)
+    parameters = []
+    for key, page, name, param in iter_group_parameters(entry.config()):
+        description = {"name": name}
+        if isinstance(key, tuple):
+            description["page"] = page
+        description.update(
+            min=param.min_midi_value,
+            max=param.max_midi_value,
+            default=param.default_value,
+            display_min=param.min_value,
+            display_max=param.max_value,
+        )
+        if param.options:
+            description["options"] = param.options
+        parameters.append(description)
+    return {
+        "section": section,
+        "description": entry.description,
+        "parameters": parameters,
+    }
+
+
+@cache
+def sections_json() -> str:
+    """JSON list of the sections and their descriptions."""
+    return json.dumps({name: entry.description for name, entry in SECTIONS.items()})
+
+
+@cache
+def section_json(section: str) -> str:
+    """describe_section() as JSON, rendered once per section."""
+    return json.dumps(describe_section(section))
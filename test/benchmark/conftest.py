@@ -0,0 +1,181 @@
+"""
+Benchmark fixtures
+
+Each benchmark times a callable with the bench fixture, which records the
+result under a name. Results are printed at the end of the run, written as
+JSON with --benchmark-json, and compared with an earlier run given by
+--benchmark-baseline: a result more than --benchmark-threshold slower fails
+its test.
+
+The benchmarks are skipped unless one of those options, or a -m expression
+naming the benchmark marker, is given, so a plain pytest run stays fast and
+timing noise never fails it.
+"""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, Optional
+
+import pytest
+
+RESULTS_VERSION = 1
+
+
+class Bench:
+    """Times callables and checks them against a baseline."""
+
+    def __init__(self, baseline: Dict[str, dict], threshold: float):
+        self.baseline = baseline
+        self.threshold = threshold
+        self.results: Dict[str, dict] = {}
+
+    def throughput(
+        self,
+        name: str,
+        func: Callable[[], object],
+        number: int = 1000,
+        repeat: int = 5,
+        bytes_per_op: Optional[float] = None,
+    ) -> dict:
+        """
+        Time number calls of func, repeat times, and record the median per call.
+
+        Args:
+            name: Result name, e.g. 'send_cc'.
+            func: The operation, called without arguments.
+            number: Calls per timing.
+            repeat: Number of timings; the median is reported.
+            bytes_per_op: MIDI bytes one call puts on the wire, if any.
+        """
+        func()  # Warm up caches and lazy initialization
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            for _ in range(number):
+                func()
+            samples.append((time.perf_counter_ns() - start) / number)
+        ns_per_op = statistics.median(samples)
+        result = {
+            "ns_per_op": ns_per_op,
+            "min_ns_per_op": min(samples),
+            "ops_per_sec": 1e9 / ns_per_op if ns_per_op else None,
+            "number": number,
+            "repeat": repeat,
+        }
+        if bytes_per_op is not None:
+            result["bytes_per_op"] = bytes_per_op
+        return self.record(name, result)
+
+    def latency(self, name: str, func: Callable[[], object], count: int = 2000) -> dict:
+        """
+        Time count single calls of func and record latency percentiles.
+
+        The p50 is reported as ns_per_op and used for the regression check.
+        """
+        func()
+        samples = []
+        for _ in range(count):
+            start = time.perf_counter_ns()
+            func()
+            samples.append(time.perf_counter_ns() - start)
+        samples.sort()
+        result = {
+            "ns_per_op": samples[count // 2],
+            "p90_ns": samples[int(count * 0.9)],
+            "p99_ns": samples[int(count * 0.99)],
+            "max_ns": samples[-1],
+            "count": count,
+        }
+        return self.record(name, result)
+
+    def record(self, name: str, result: dict) -> dict:
+        """Record a result and fail if it regressed against the baseline."""
+        self.results[name] = result
+        baseline = self.baseline.get(name)
+        if baseline is not None:
+            limit = baseline["ns_per_op"] * (1 + self.threshold)
+            if result["ns_per_op"] > limit:
+                pytest.fail(
+                    f"{name} regressed: {result['ns_per_op']:,.0f} ns/op against "
+                    f"a baseline of {baseline['ns_per_op']:,.0f} ns/op "
+                    f"(threshold {self.threshold:.0%})"
+                )
+        return result
+
+
+bench_key = pytest.StashKey[Bench]()
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: timing benchmark, see conftest")
+
+
+def _benchmarks_requested(config) -> bool:
+    return bool(
+        config.getoption("benchmark_json")
+        or config.getoption("benchmark_baseline")
+        or "benchmark" in (config.getoption("markexpr") or "")
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if _benchmarks_requested(config):
+        return
+    skip = pytest.mark.skip(
+        reason="benchmark: run with --benchmark-json, --benchmark-baseline or "
+        "-m benchmark"
+    )
+    for item in items:
+        if item.get_closest_marker("benchmark") is not None:
+            item.add_marker(skip)
+
+
+def _load_baseline(path: Optional[str]) -> Dict[str, dict]:
+    if not path:
+        return {}
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+@pytest.fixture(scope="session")
+def bench(pytestconfig) -> Bench:
+    bench = Bench(
+        _load_baseline(pytestconfig.getoption("benchmark_baseline")),
+        pytestconfig.getoption("benchmark_threshold"),
+    )
+    pytestconfig.stash[bench_key] = bench
+    return bench
+
+
+def pytest_sessionfinish(session):
+    bench = session.config.stash.get(bench_key, None)
+    path = session.config.getoption("benchmark_json")
+    if bench is None or not path:
+        return
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "version": RESULTS_VERSION,
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "results": bench.results,
+            },
+            f,
+            indent=2,
+        )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    bench = config.stash.get(bench_key, None)
+    if bench is None or not bench.results:
+        return
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(f"{'name':<36}{'ns/op':>14}{'ops/s':>14}")
+    for name, result in bench.results.items():
+        ops = 1e9 / result["ns_per_op"] if result["ns_per_op"] else 0
+        terminalreporter.write_line(
+            f"{name:<36}{result['ns_per_op']:>14,.0f}{ops:>14,.0f}"
+        )
@@ -0,0 +1,285 @@
+"""
+Transport, controller, tool and config benchmarks against the in-memory backend,
+plus a comparison of the mido.Message and raw rtmidi write paths.
+
+They are skipped by a plain pytest run. Run them with:
+    pytest test/benchmark --benchmark-json results.json
+and check a later run for regressions with:
+    pytest test/benchmark --benchmark-baseline results.json
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+from itertools import cycle
+from pathlib import Path
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from elektron_mcp.digitone.config.config import build_digitone_config, digitone_config
+from elektron_mcp.digitone.services.wavetone_controller import WavetoneController
+from elektron_mcp.midi.backends import DEFAULT_PORT_NAME, MemoryBackend
+from elektron_mcp.midi.digitone_midi import DigitoneMIDI
+from elektron_mcp.tools.patch_tool import (
+    PatchEntry,
+    apply_patch_entries,
+    register_patch_tools,
+)
+
+pytestmark = pytest.mark.benchmark
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# A sound touching the engine, filter, amp, fx and LFO sections
+PATCH = [
+    ("wavetone", "TUN1", 64),
+    ("wavetone", "WAV1", 40),
+    ("wavetone", "PD1", 64),
+    ("wavetone", "LEV1", 100),
+    ("wavetone", "TUN2", 70),
+    ("wavetone", "WAV2", 80),
+    ("wavetone", "LEV2", 90),
+    ("wavetone", "NLEV", 10),
+    ("multi_mode_filter", "FREQ", 90),
+    ("multi_mode_filter", "RESO", 30),
+    ("multi_mode_filter", "ATK", 5),
+    ("multi_mode_filter", "DEC", 60),
+    ("amp", "ATK", 2),
+    ("amp", "DEC", 50),
+    ("amp", "VOL", 100),
+    ("fx", "DEL", 20),
+    ("fx", "REV", 40),
+    ("lfo1", "SPD", 48),
+    ("lfo1", "DEP", 30),
+    ("lfo1", "WAVE", 1),
+]
+
+
+@pytest.fixture
+def memory():
+    backend = MemoryBackend()
+    midi = DigitoneMIDI(backend=backend)
+    assert midi.connected
+    return midi, backend.outputs[DEFAULT_PORT_NAME]
+
+
+def patches(track: int = 1):
+    """Two variants of PATCH, so alternate applications are never skipped."""
+    return cycle(
+        [
+            [
+                PatchEntry(section=s, parameter=p, value=v, track=track)
+                for s, p, v in PATCH
+            ],
+            [
+                PatchEntry(section=s, parameter=p, value=v - 1, track=track)
+                for s, p, v in PATCH
+            ],
+        ]
+    )
+
+
+def test_send_cc(bench, memory):
+    midi, port = memory
+    values = cycle(range(128))
+
+    bench.throughput("send_cc", lambda: midi.send_cc(1, 40, next(values)), 5000)
+
+    assert port.bytes_sent == 3 * len(port.records)
+
+
+def test_send_cc_latency(bench, memory):
+    midi, _ = memory
+    values = cycle(range(128))
+
+    result = bench.latency("send_cc_latency", lambda: midi.send_cc(1, 40, next(values)))
+
+    assert result["p99_ns"] >= result["ns_per_op"]
+
+
+def test_send_nrpn_selected_address(bench, memory):
+    midi, port = memory
+    values = cycle(range(128))
+
+    bench.throughput(
+        "send_nrpn_selected_address",
+        lambda: midi.send_nrpn(1, 73, 1, next(values)),
+        5000,
+        bytes_per_op=6,
+    )
+
+    assert [record.data[1] for record in port.records[-2:]] == [6, 38]
+
+
+def test_send_nrpn_new_address(bench, memory):
+    midi, port = memory
+    addresses = cycle([(73, 1), (73, 2)])
+
+    bench.throughput(
+        "send_nrpn_new_address",
+        lambda: midi.send_nrpn(1, *next(addresses), 64),
+        5000,
+        bytes_per_op=12,
+    )
+
+    assert [record.data[1] for record in port.records[-4:]] == [99, 98, 6, 38]
+
+
+def test_send_nrpn_batch(bench, memory):
+    midi, port = memory
+    batches = cycle([[(73, lsb, value) for lsb in range(1, 17)] for value in (10, 20)])
+
+    bench.throughput(
+        "send_nrpn_batch_16", lambda: midi.send_nrpn_batch(1, next(batches)), 1000
+    )
+
+    assert port.bytes_sent == 3 * len(port.records)
+    assert port.records[-1].data[1] == 38
+
+
+class NullRtMidiOut:
+    """Discards writes like an rtmidi.MidiOut talking to nothing."""
+
+    def send_message(self, message):
+        # rtmidi only takes one message per call, unless it is SysEx
+        if len(message) > 3 and message[0] != 0xF0:
+            raise ValueError("'message' longer than 3 bytes")
+
+
+class NullRtMidiPort:
+    """mido rtmidi output port, written raw by DigitoneMIDI."""
+
+    name = "Digitone (null rtmidi)"
+
+    def __init__(self):
+        self._rt = NullRtMidiOut()
+
+    def close(self):
+        pass
+
+
+class NullMidoPort:
+    """Output port that only accepts mido.Message objects."""
+
+    name = "Digitone (null mido)"
+
+    def send(self, msg):
+        pass
+
+    def close(self):
+        pass
+
+
+class NullBackend:
+    """Opens one kind of null output port, and no input port."""
+
+    def __init__(self, port_class):
+        self.port_class = port_class
+
+    def get_input_names(self):
+        return []
+
+    def get_output_names(self):
+        return [self.port_class.name]
+
+    def open_output(self, name=None, **kwargs):
+        return self.port_class()
+
+    def open_input(self, name=None, **kwargs):
+        raise IOError("No input port")
+
+
+SENDS = {
+    "send_cc": (lambda midi, value: midi.send_cc(1, 40, value)),
+    "send_nrpn_new_address": (lambda midi, value: midi.send_nrpn(1, value, 1, value)),
+}
+
+
+@pytest.mark.parametrize("send", SENDS)
+@pytest.mark.parametrize("port_class", [NullMidoPort, NullRtMidiPort])
+def test_write_paths(bench, send, port_class):
+    midi = DigitoneMIDI(port_class.name, backend=NullBackend(port_class))
+    assert midi.connected
+    values = cycle(range(128))
+    path = "raw" if port_class is NullRtMidiPort else "mido"
+
+    bench.throughput(
+        f"{send}_{path}_port",
+        lambda: SENDS[send](midi, next(values)),
+        5000,
+    )
+
+
+def test_controller_setter(bench, memory):
+    midi, port = memory
+    controller = WavetoneController(digitone_config.wavetone.pages, midi, 1)
+    values = cycle([63, 64])
+
+    bench.throughput(
+        "controller_set_osc1_pitch",
+        lambda: controller.set_osc1_pitch(next(values)),
+        5000,
+        bytes_per_op=3,
+    )
+
+    assert port.records[-1].data[1] == 40
+
+
+def test_apply_patch_entries(bench, memory):
+    midi, port = memory
+    variants = patches()
+
+    bench.throughput(
+        "apply_patch_20_params",
+        lambda: apply_patch_entries(midi, next(variants)),
+        200,
+    )
+
+    assert apply_patch_entries(midi, next(variants))["applied"] == len(PATCH)
+
+
+def test_apply_patch_tool_call(bench, memory):
+    midi, _ = memory
+    mcp = FastMCP("benchmark")
+    register_patch_tools(mcp, midi)
+    loop = asyncio.new_event_loop()
+    variants = cycle(
+        [
+            {"entries": [entry.model_dump() for entry in variant]}
+            for variant, _ in zip(patches(), range(2))
+        ]
+    )
+
+    try:
+        bench.throughput(
+            "apply_patch_tool_call",
+            lambda: loop.run_until_complete(
+                mcp.call_tool("apply_patch", next(variants))
+            ),
+            100,
+        )
+    finally:
+        loop.close()
+
+
+def test_config_build(bench):
+    bench.throughput("config_build", build_digitone_config, number=1, repeat=3)
+
+
+def test_config_import(bench):
+    env = {**os.environ, "ELEKTRON_MCP_CONFIG_CACHE": "0", "PYTHONPATH": str(ROOT)}
+    command = [
+        sys.executable,
+        "-c",
+        "from elektron_mcp.digitone.config.config import digitone_config as c; "
+        "c.wavetone, c.multi_mode_filter, c.amp_page, c.fx_page, c.lfo",
+    ]
+
+    bench.throughput(
+        "config_import_subprocess",
+        lambda: subprocess.run(command, env=env, cwd=ROOT, check=True),
+        number=1,
+        repeat=3,
+    )
@@ -1,9 +1,37 @@
 import logging
+import os
+from unittest.mock import MagicMock
+
 import pytest
 import colorlog
 
 
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark", "transport benchmarks (test/benchmark)")
+    group.addoption(
+        "--benchmark-json",
+        metavar="PATH",
+        help="Write the benchmark results to PATH as JSON.",
+    )
+    group.addoption(
+        "--benchmark-baseline",
+        metavar="PATH",
+        help="Fail benchmarks more than --benchmark-threshold slower than the "
+        "results in PATH, written by an earlier --benchmark-json run.",
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=float(os.environ.get("ELEKTRON_MCP_BENCHMARK_THRESHOLD", "0.25")),
+        help="Allowed slowdown against the baseline, e.g. 0.25 for 25%% "
+        "(default: $ELEKTRON_MCP_BENCHMARK_THRESHOLD or 0.25).",
+    )
+
+
 def pytest_configure():
+    # Keep the suite from writing the config cache into the user cache dir
+    os.environ.setdefault("ELEKTRON_MCP_CONFIG_CACHE", "0")
+
     handler = colorlog.StreamHandler()
     handler.setFormatter(
         colorlog.ColoredFormatter(
@@ -23,3 +51,39 @@ def pytest_configure():
 @pytest.fixture(autouse=True)
 def setup_logging(caplog):
     caplog.set_level(logging.INFO)
+
+
+class FakeMCP:
+    """Collects the tools and resources registered on it, by name and URI."""
+
+    def __init__(self):
+        self.tools = {}
+        self.resources = {}
+
+    def tool(self):
+        def register(func):
+            self.tools[func.__name__] = func
+            return func
+
+        return register
+
+    def resource(self, uri, **kwargs):
+        def register(func):
+            self.resources[uri] = func
+            return func
+
+        return register
+
+
+@pytest.fixture
+def fake_mcp():
+    return FakeMCP()
+
+
+@pytest.fixture
+def mock_midi():
+    """MIDI interface mock whose batch sends succeed."""
+    midi = MagicMock()
+    midi.send_cc_batch.return_value = True
+    midi.send_nrpn_batch.return_value = True
+    return midi
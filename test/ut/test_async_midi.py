@@ -0,0 +1,167 @@
+import asyncio
+import threading
+
+import mido
+import pytest
+
+from elektron_mcp.digitone.services.shadow_state import ShadowState
+from elektron_mcp.midi.async_midi import AsyncDigitoneMIDI, run_midi_call
+from elektron_mcp.midi.backends import DEFAULT_PORT_NAME, MemoryBackend
+from elektron_mcp.midi.digitone_midi import DigitoneMIDI
+from elektron_mcp.tools.generic_tool import register_generic_tools
+
+
+class SlowMidi:
+    """Records writes with the thread they ran on, holding them until released."""
+
+    def __init__(self):
+        self.writes = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def send_cc(self, channel, cc, value):
+        self.started.set()
+        self.release.wait(5)
+        self.writes.append(("cc", channel, cc, value, threading.current_thread().name))
+        return True
+
+    def send_cc_batch(self, channel, messages):
+        for cc, value in messages:
+            self.send_cc(channel, cc, value)
+        return True
+
+    def send_nrpn_batch(self, channel, messages):
+        return False
+
+
+@pytest.fixture
+def transport():
+    midi = SlowMidi()
+    transport = AsyncDigitoneMIDI(midi)
+    yield midi, transport
+    midi.release.set()
+    transport.close(5)
+
+
+def test_sync_sends_are_queued_and_written_in_order(transport):
+    midi, transport = transport
+
+    assert transport.send_cc(1, 40, 1)
+    assert transport.send_cc_batch(1, [(41, 2), (42, 3)])
+    assert transport.flush(5)
+
+    assert [write[:4] for write in midi.writes] == [
+        ("cc", 1, 40, 1),
+        ("cc", 1, 41, 2),
+        ("cc", 1, 42, 3),
+    ]
+    assert {write[4] for write in midi.writes} == {"digitone-midi-io"}
+
+
+def test_async_sends_return_the_write_result(transport):
+    _, transport = transport
+
+    assert asyncio.run(transport.asend_cc(1, 40, 1)) is True
+    assert asyncio.run(transport.asend_nrpn_batch(1, [(73, 1, 0)])) is False
+
+
+def test_errors_propagate_to_awaiting_handlers(transport):
+    _, transport = transport
+
+    def fail():
+        raise ValueError("bad value")
+
+    with pytest.raises(ValueError, match="bad value"):
+        asyncio.run(transport.run(fail))
+    assert asyncio.run(transport.run(fail, wait=False)) is True
+
+
+def test_event_loop_keeps_running_while_the_port_is_busy(transport):
+    midi, transport = transport
+    midi.release.clear()
+
+    async def scenario():
+        write = asyncio.ensure_future(transport.asend_cc(1, 40, 1))
+        await asyncio.get_running_loop().run_in_executor(None, midi.started.wait, 5)
+        # Another client's request is served while the write is stuck
+        ticks = 0
+        for _ in range(5):
+            await asyncio.sleep(0)
+            ticks += 1
+        assert not write.done()
+        midi.release.set()
+        return ticks, await write
+
+    assert asyncio.run(scenario()) == (5, True)
+
+
+def test_tool_handlers_run_controller_calls_on_the_io_thread(transport, fake_mcp):
+    midi, transport = transport
+    register_generic_tools(fake_mcp, transport)
+
+    assert asyncio.run(fake_mcp.tools["set_param"]("wavetone", "TUN1", 70, 2))
+    assert midi.writes == [("cc", 2, 40, 70, "digitone-midi-io")]
+    assert fake_mcp.tools["get_param"]("wavetone", "TUN1", 2) == 70
+    assert asyncio.run(run_midi_call(midi, lambda: "inline")) == "inline"
+
+
+def test_shadow_state_is_shared_with_the_device(transport):
+    midi, transport = transport
+
+    assert ShadowState.for_device(transport) is ShadowState.for_device(midi)
+
+
+def test_closed_transport_rejects_writes():
+    transport = AsyncDigitoneMIDI(SlowMidi())
+    transport.close(5)
+
+    assert transport.send_cc(1, 40, 1) is False
+    with pytest.raises(RuntimeError, match="closed"):
+        asyncio.run(transport.asend_cc(1, 40, 1))
+    # Tool handlers get the documented False instead of an exception
+    assert asyncio.run(run_midi_call(transport, lambda: True)) is False
+
+
+def test_calls_racing_close_never_hang():
+    for _ in range(20):
+        transport = AsyncDigitoneMIDI(SlowMidi())
+        futures = []
+        submitter = threading.Thread(
+            target=lambda: futures.extend(
+                transport.submit(lambda: True) for _ in range(200)
+            )
+        )
+        submitter.start()
+        transport.close(5)
+        submitter.join(5)
+        # Every call either ran before close() or was rejected
+        for future in futures:
+            assert future.exception(timeout=5) is None or isinstance(
+                future.exception(), RuntimeError
+            )
+
+
+def test_waiting_for_the_connection_does_not_block_the_event_loop(fake_mcp):
+    device = DigitoneMIDI(connect=False, backend=MemoryBackend())
+    release = threading.Event()
+
+    def connect_when_released():
+        release.wait(5)
+        return device.connect(DEFAULT_PORT_NAME)
+
+    device.wait_for_connection = connect_when_released
+    register_generic_tools(fake_mcp, device)
+
+    async def scenario():
+        write = asyncio.ensure_future(fake_mcp.tools["set_param"]("amp", "VOL", 90, 1))
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+        assert not write.done()
+        release.set()
+        return await write
+
+    assert asyncio.run(scenario()) is True
+    assert device.output_port.messages() == [
+        mido.Message("control_change", channel=0, control=90, value=90)
+    ]
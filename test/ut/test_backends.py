@@ -0,0 +1,130 @@
+import mido
+import pytest
+
+from elektron_mcp.digitone.config.config import digitone_config
+from elektron_mcp.digitone.services.wavetone_controller import WavetoneController
+from elektron_mcp.midi.backends import (
+    DEFAULT_PORT_NAME,
+    LoopbackBackend,
+    MemoryBackend,
+    VirtualPortBackend,
+    get_backend,
+)
+from elektron_mcp.midi.digitone_midi import DigitoneMIDI
+
+
+def test_memory_backend_records_timestamped_writes():
+    ticks = iter(range(100, 10000, 100))
+    backend = MemoryBackend(clock=lambda: next(ticks))
+    midi = DigitoneMIDI(backend=backend)
+
+    assert midi.connected
+    assert midi.send_cc(1, 40, 64)
+    assert midi.send_nrpn(2, 73, 1, 5)
+
+    port = backend.outputs[DEFAULT_PORT_NAME]
+    # One write per message, like an rtmidi port
+    assert [record.timestamp_ns for record in port.records] == [
+        100,
+        200,
+        300,
+        400,
+        500,
+    ]
+    assert [record.data for record in port.records] == [
+        bytes([0xB0, 40, 64]),
+        bytes([0xB1, 99, 73]),
+        bytes([0xB1, 98, 1]),
+        bytes([0xB1, 6, 0]),
+        bytes([0xB1, 38, 5]),
+    ]
+    assert port.bytes_sent == 15
+
+
+def test_coalescing_memory_port_records_one_write_per_batch():
+    backend = MemoryBackend(coalesce=True)
+    midi = DigitoneMIDI(backend=backend)
+
+    midi.send_nrpn_batch(1, [(73, 1, 5), (73, 1, 6)])
+
+    port = backend.outputs[DEFAULT_PORT_NAME]
+    assert len(port.records) == 1
+    assert [msg.control for msg in port.messages()] == [99, 98, 6, 38, 6, 38]
+
+
+def test_controller_writes_reach_the_memory_port():
+    backend = MemoryBackend()
+    midi = DigitoneMIDI(backend=backend)
+    controller = WavetoneController(digitone_config.wavetone.pages, midi, 1)
+
+    assert controller.set_osc1_pitch(64)
+
+    cc = int(digitone_config.wavetone.pages["page_1"].parameters["TUN1"].midi.cc_msb)
+    assert backend.outputs[DEFAULT_PORT_NAME].messages() == [
+        mido.Message("control_change", channel=0, control=cc, value=64)
+    ]
+
+
+def test_memory_backend_feeds_input_callbacks():
+    backend = MemoryBackend()
+    midi = DigitoneMIDI(backend=backend)
+    received = []
+    midi.add_input_callback(received.append)
+
+    backend.receive(bytes([0xB0, 40, 1, 0xB0, 41, 2]))
+
+    assert [(msg.control, msg.value) for msg in received] == [(40, 1), (41, 2)]
+
+
+def test_loopback_backend_echoes_writes():
+    midi = DigitoneMIDI(backend=LoopbackBackend())
+    received = []
+    midi.add_input_callback(received.append)
+
+    midi.send_nrpn(3, 73, 1, 5)
+
+    assert [(msg.channel, msg.control) for msg in received] == [
+        (2, 99),
+        (2, 98),
+        (2, 6),
+        (2, 38),
+    ]
+
+
+def test_closed_memory_port_fails_writes():
+    backend = MemoryBackend()
+    midi = DigitoneMIDI(backend=backend)
+    port = backend.outputs[DEFAULT_PORT_NAME]
+
+    midi.disconnect()
+
+    assert port.closed
+    assert not midi.send_cc(1, 40, 1)
+
+
+def test_get_backend():
+    assert get_backend("mido") is mido
+    assert isinstance(get_backend("loopback"), LoopbackBackend)
+    with pytest.raises(ValueError, match="Invalid MIDI backend: tape"):
+        get_backend("tape")
+
+
+def test_virtual_port_backend_round_trip():
+    try:
+        midi = DigitoneMIDI(backend=VirtualPortBackend())
+    except ImportError as e:
+        pytest.skip(f"No OS MIDI support: {e}")
+    if not midi.connected or midi.input_port is None:
+        pytest.skip("Virtual MIDI ports are not available")
+
+    received = []
+    midi.add_input_callback(received.append)
+    try:
+        assert midi.send_cc(1, 40, 64)
+        for _ in range(100):
+            if received:
+                break
+            mido.ports.sleep()
+        assert [(msg.control, msg.value) for msg in received] == [(40, 64)]
+    finally:
+        midi.disconnect()
@@ -0,0 +1,141 @@
+import threading
+
+from elektron_mcp.midi.background_writer import BackgroundMidiWriter
+
+
+class BlockingMidi:
+    """Records batches and holds the first one until released."""
+
+    def __init__(self):
+        self.batches = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def send_nrpn_batch(self, channel, messages):
+        self.started.set()
+        self.release.wait(5)
+        self.batches.append(("nrpn", channel, list(messages)))
+        return True
+
+    def send_cc_batch(self, channel, messages):
+        self.batches.append(("cc", channel, list(messages)))
+        return True
+
+
+def test_newer_value_replaces_pending_value():
+    midi = BlockingMidi()
+    writer = BackgroundMidiWriter(midi)
+
+    writer.send_nrpn(1, 73, 1, 0)
+    assert midi.started.wait(5)
+
+    # The worker is busy with the first write, so these stay pending
+    for value in range(1, 50):
+        writer.send_nrpn(1, 74, 1, value)
+    writer.send_cc(2, 40, 1)
+    writer.send_cc(2, 40, 2)
+    assert writer.pending == 2
+
+    midi.release.set()
+    assert writer.flush(5)
+    writer.close(5)
+
+    assert midi.batches == [
+        ("nrpn", 1, [(73, 1, 0)]),
+        ("nrpn", 1, [(74, 1, 49)]),
+        ("cc", 2, [(40, 2)]),
+    ]
+
+
+def test_full_queue_drops_new_keys_after_timeout():
+    midi = BlockingMidi()
+    writer = BackgroundMidiWriter(midi, max_pending=1, enqueue_timeout=0.01)
+
+    writer.send_nrpn(1, 73, 1, 0)
+    assert midi.started.wait(5)
+
+    assert writer.send_nrpn(1, 74, 1, 1) is True
+    assert writer.send_nrpn(1, 74, 1, 2) is True
+    assert writer.send_nrpn(1, 75, 1, 1) is False
+
+    midi.release.set()
+    writer.close(5)
+
+    assert midi.batches[-1] == ("nrpn", 1, [(74, 1, 2)])
+
+
+def test_closed_writer_rejects_writes():
+    midi = BlockingMidi()
+    midi.release.set()
+    writer = BackgroundMidiWriter(midi)
+    writer.close(5)
+
+    assert writer.send_cc(1, 40, 1) is False
+    assert writer.send_nrpn(17, 73, 1, 1) is False
+
+
+def test_batches_are_queued_whole_or_not_at_all():
+    midi = BlockingMidi()
+    writer = BackgroundMidiWriter(midi, max_pending=2, enqueue_timeout=0.01)
+
+    writer.send_nrpn(1, 73, 1, 0)
+    assert midi.started.wait(5)
+
+    assert writer.send_cc(2, 40, 1) is True
+    # Room for one more key, not for two
+    assert writer.send_cc_batch(2, [(41, 1), (42, 1)]) is False
+    assert writer.pending == 1
+    assert writer.send_cc_batch(2, [(40, 2), (41, 1)]) is True
+
+    midi.release.set()
+    writer.close(5)
+
+    assert midi.batches[-1] == ("cc", 2, [(40, 2), (41, 1)])
+
+
+def test_invalid_data_is_rejected_when_queued():
+    midi = BlockingMidi()
+    writer = BackgroundMidiWriter(midi)
+
+    writer.send_nrpn(1, 73, 1, 0)
+    assert midi.started.wait(5)
+
+    assert writer.send_cc(2, 40, 1) is True
+    assert writer.send_cc(2, 41, -1) is False
+    assert writer.send_cc_batch(2, [(42, 1), (43, 128)]) is False
+    assert writer.send_nrpn(2, 73, 1, 16384) is False
+    assert writer.pending == 1
+
+    midi.release.set()
+    writer.close(5)
+
+    assert midi.batches[-1] == ("cc", 2, [(40, 1)])
+
+
+def test_raw_messages_are_written_directly():
+    midi = BlockingMidi()
+    midi.send_message = lambda data: midi.batches.append(("raw", bytes(data))) or True
+    writer = BackgroundMidiWriter(midi)
+
+    assert writer.send_message([0x90, 60, 100]) is True
+    assert midi.batches == [("raw", bytes([0x90, 60, 100]))]
+    midi.release.set()
+    writer.close(5)
+
+
+def test_latest_write_wins_across_cc_and_nrpn():
+    midi = BlockingMidi()
+    writer = BackgroundMidiWriter(midi)
+
+    writer.send_nrpn(2, 73, 1, 0)
+    assert midi.started.wait(5)
+
+    # CC 41 and NRPN 1/74 are the same parameter on the device
+    writer.send_cc(1, 41, 10)
+    writer.send_nrpn(1, 1, 74, 20)
+    writer.send_cc(1, 41, 30)
+
+    midi.release.set()
+    writer.close(5)
+
+    assert midi.batches[1:] == [("nrpn", 1, [(1, 74, 20)]), ("cc", 1, [(41, 30)])]
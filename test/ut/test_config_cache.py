@@ -0,0 +1,76 @@
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from elektron_mcp.digitone.config import config_cache
+from elektron_mcp.digitone.config.config import build_wavetone, digitone_config
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("ELEKTRON_MCP_CONFIG_CACHE", "1")
+    monkeypatch.setenv("ELEKTRON_MCP_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_cached_config_is_loaded_without_rebuilding(cache_dir):
+    build = MagicMock(side_effect=build_wavetone)
+    built = config_cache.load_or_build("wavetone", build)
+    assert (cache_dir / "digitone_wavetone.pickle").exists()
+
+    loaded = config_cache.load_or_build("wavetone", build)
+
+    build.assert_called_once()
+    assert loaded == built == digitone_config.wavetone
+
+
+def test_stale_cache_is_rebuilt(cache_dir, monkeypatch):
+    config_cache.load_or_build("wavetone", build_wavetone)
+    monkeypatch.setattr(config_cache, "config_hash", lambda: "changed")
+    build = MagicMock(side_effect=build_wavetone)
+
+    config_cache.load_or_build("wavetone", build)
+    config_cache.load_or_build("wavetone", build)
+
+    build.assert_called_once()
+
+
+def test_corrupt_cache_is_rebuilt(cache_dir):
+    config_cache.cache_path("wavetone").write_bytes(b"not a pickle")
+    build = MagicMock(side_effect=build_wavetone)
+
+    assert config_cache.load_or_build("wavetone", build) == digitone_config.wavetone
+    build.assert_called_once()
+
+
+def test_cache_can_be_disabled(cache_dir, monkeypatch):
+    monkeypatch.setenv("ELEKTRON_MCP_CONFIG_CACHE", "0")
+
+    config_cache.load_or_build("wavetone", build_wavetone)
+
+    assert not config_cache.cache_path("wavetone").exists()
+
+
+def test_hash_covers_the_data_modules():
+    names = {path.name for path in config_cache.source_files()}
+    assert {"wavetone.py", "lfo.py", "models.py"} <= names
+
+
+def test_hash_covers_the_section_builders():
+    names = {path.name for path in config_cache.source_files()}
+    assert {"config.py", "parameter_utils.py"} <= names
+    assert all(path.is_file() for path in config_cache.source_files())
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+def test_cache_writable_by_others_is_ignored(cache_dir):
+    config_cache.load_or_build("wavetone", build_wavetone)
+    path = config_cache.cache_path("wavetone")
+    path.chmod(0o666)
+    build = MagicMock(side_effect=build_wavetone)
+
+    assert config_cache.load_or_build("wavetone", build) == digitone_config.wavetone
+    build.assert_called_once()
+    # Replaced by a file of our own
+    assert not path.stat().st_mode & 0o022
@@ -0,0 +1,116 @@
+import threading
+
+from elektron_mcp.midi import connection as connection_module
+from elektron_mcp.midi.backends import DEFAULT_PORT_NAME, MemoryBackend
+from elektron_mcp.midi.connection import MidiConnection, shared_connection
+
+
+class SlowBackend(MemoryBackend):
+    """Memory backend whose port enumeration blocks until released."""
+
+    def __init__(self, port_names=(DEFAULT_PORT_NAME,)):
+        super().__init__(port_names)
+        self.release = threading.Event()
+        self.enumerations = 0
+
+    def get_output_names(self):
+        self.enumerations += 1
+        self.release.wait(5)
+        return super().get_output_names()
+
+
+def test_creating_a_connection_does_not_probe_ports():
+    backend = SlowBackend()
+    connection = MidiConnection(backend=backend)
+
+    assert not connection.connected
+    assert backend.enumerations == 0
+
+
+def test_start_connects_in_the_background():
+    backend = SlowBackend()
+    connection = MidiConnection(backend=backend)
+    outcomes = []
+    connection.add_done_callback(lambda c: outcomes.append(c.connected))
+
+    assert connection.start()
+    assert connection.connecting
+    assert not connection.start()  # Already connecting
+    assert outcomes == []
+
+    backend.release.set()
+    assert connection.wait(5)
+    assert outcomes == [True]
+    assert backend.enumerations == 1
+
+
+def test_first_send_waits_for_the_connection():
+    backend = MemoryBackend()
+    connection = MidiConnection(backend=backend)
+
+    assert connection.device.send_cc(1, 40, 64)
+
+    assert backend.outputs[DEFAULT_PORT_NAME].wire_bytes() == bytes([0xB0, 40, 64])
+
+
+def test_sends_give_up_after_the_timeout():
+    backend = SlowBackend()
+    connection = MidiConnection(backend=backend, timeout=0.01)
+    try:
+        assert not connection.device.send_cc(1, 40, 64)
+    finally:
+        backend.release.set()
+    assert connection.wait(5)
+    assert connection.device.send_cc(1, 40, 64)
+
+
+def test_failed_connections_are_retried_after_the_interval():
+    backend = MemoryBackend(port_names=["Other synth"])
+    connection = MidiConnection(backend=backend, retry_interval=0)
+
+    assert not connection.wait(5)
+    assert connection.error == "No Digitone device found"
+    assert not connection.device.send_cc(1, 40, 64)
+
+    backend.port_names.append(DEFAULT_PORT_NAME)
+    assert connection.device.send_cc(1, 40, 64)
+    assert connection.error is None
+
+
+def test_failed_connections_are_not_retried_within_the_interval():
+    backend = MemoryBackend(port_names=["Other synth"])
+    connection = MidiConnection(backend=backend, retry_interval=60)
+
+    assert not connection.wait(5)
+    backend.port_names.append(DEFAULT_PORT_NAME)
+
+    assert not connection.start()
+    assert not connection.device.send_cc(1, 40, 64)
+
+
+def test_explicit_port_name():
+    backend = MemoryBackend(port_names=["Other synth", DEFAULT_PORT_NAME])
+    connection = MidiConnection("Other synth", backend=backend)
+
+    assert connection.wait(5)
+    assert connection.device.output_port.name == "Other synth"
+
+
+def test_done_callbacks_added_late_run_immediately():
+    connection = MidiConnection(backend=MemoryBackend())
+    connection.wait(5)
+    outcomes = []
+
+    connection.add_done_callback(lambda c: outcomes.append(c.connected))
+
+    assert outcomes == [True]
+
+
+def test_shared_connection_is_created_once(monkeypatch):
+    monkeypatch.setattr(connection_module, "_shared", None)
+    backend = MemoryBackend()
+
+    first = shared_connection(backend=backend)
+
+    assert shared_connection() is first
+    assert first.device.backend is backend
@@ -0,0 +1,105 @@
+import gc
+import weakref
+from unittest.mock import MagicMock
+
+from elektron_mcp.digitone.config.config import digitone_config
+from elektron_mcp.digitone.services.amp_fx_controller import AmpController
+from elektron_mcp.digitone.services.controller_registry import (
+    ControllerRegistry,
+    controller_registry,
+)
+from elektron_mcp.digitone.services.shadow_state import ShadowState
+from elektron_mcp.digitone.services.wavetone_controller import WavetoneController
+from elektron_mcp.tools.sections import section_controller
+
+amp = digitone_config.amp_page.parameters
+wavetone = digitone_config.wavetone.pages
+
+
+def make_midi():
+    midi = MagicMock()
+    midi.send_cc.return_value = True
+    return midi
+
+
+def test_one_controller_per_engine_track_and_device():
+    registry = ControllerRegistry()
+    midi, other_midi = make_midi(), make_midi()
+
+    controller = registry.get(AmpController, amp, midi, 1)
+
+    assert registry.get(AmpController, amp, midi, 1) is controller
+    assert registry.get(AmpController, amp, midi, 2) is not controller
+    assert registry.get(AmpController, amp, other_midi, 1) is not controller
+    assert registry.get(WavetoneController, wavetone, midi, 1) is not controller
+    assert controller.midi_channel == 1
+
+
+def test_invalid_tracks_are_not_cached():
+    registry = ControllerRegistry()
+    midi = make_midi()
+
+    assert registry.get(AmpController, amp, midi, 17) is not registry.get(
+        AmpController, amp, midi, 17
+    )
+
+
+def test_machine_change_drops_the_track():
+    registry = ControllerRegistry()
+    midi = make_midi()
+    registry.set_machine(midi, 1, "wavetone")
+    controller = registry.get(WavetoneController, wavetone, midi, 1)
+    other_track = registry.get(WavetoneController, wavetone, midi, 2)
+    controller.set_osc1_pitch(64)
+
+    assert not registry.set_machine(midi, 1, "wavetone")
+    assert registry.get(WavetoneController, wavetone, midi, 1) is controller
+
+    assert registry.set_machine(midi, 1, "fmtone")
+    assert registry.machine(midi, 1) == "fmtone"
+    assert registry.get(WavetoneController, wavetone, midi, 1) is not controller
+    assert registry.get(WavetoneController, wavetone, midi, 2) is other_track
+    assert ShadowState.for_device(midi).snapshot(1) == {}
+
+
+def test_invalidate():
+    registry = ControllerRegistry()
+    midi = make_midi()
+    controller = registry.get(AmpController, amp, midi, 1)
+
+    registry.invalidate(midi)
+
+    assert registry.get(AmpController, amp, midi, 1) is not controller
+
+
+def test_engine_section_writes_record_the_track_machine():
+    midi = make_midi()
+    section_controller("wavetone", midi, 1, write=True).set_osc1_pitch(64)
+    assert controller_registry.machine(midi, 1) == "wavetone"
+
+    section_controller("amp", midi, 1, write=True)
+    assert controller_registry.machine(midi, 1) == "wavetone"
+    # Reading another engine's parameter does not change the machine
+    section_controller("fmtone", midi, 1).get_parameter("page_1", "ALGO")
+    assert controller_registry.machine(midi, 1) == "wavetone"
+    assert ShadowState.for_device(midi).get(1, 73, 1) is not None
+
+    section_controller("fmtone", midi, 1, write=True)
+    assert controller_registry.machine(midi, 1) == "fmtone"
+    assert ShadowState.for_device(midi).snapshot(1) == {}
+
+
+def test_cached_controllers_do_not_keep_the_device_alive():
+    registry = ControllerRegistry()
+    midi = make_midi()
+    # Child mocks reference their parent, a real device's metrics do not
+    midi.metrics = None
+    registry.get(AmpController, amp, midi, 1).set_volume(90)
+    assert midi.send_cc.called
+    device = weakref.ref(midi)
+
+    del midi
+    gc.collect()
+
+    assert device() is None
+    assert len(registry._controllers) == 0
@@ -0,0 +1,39 @@
+import pickle
+
+import pytest
+
+from elektron_mcp.digitone.config.config import digitone_config, parameter_table
+from elektron_mcp.digitone.models.descriptor import ParameterDescriptor
+
+
+def test_descriptor_is_built_from_the_validated_model():
+    param = digitone_config.wavetone.pages["page_1"].parameters["TUN1"]
+
+    descriptor = ParameterDescriptor.from_model(0, "wavetone", "page_1", "TUN1", param)
+
+    assert descriptor.cc == int(param.midi.cc_msb)
+    assert (descriptor.nrpn_msb, descriptor.nrpn_lsb) == (73, 1)
+    assert (descriptor.min_midi, descriptor.max_midi) == (
+        param.min_midi_value,
+        param.max_midi_value,
+    )
+
+
+def test_descriptor_is_frozen_and_has_no_dict():
+    descriptor = next(iter(parameter_table))
+
+    assert not hasattr(descriptor, "__dict__")
+    with pytest.raises(AttributeError):
+        descriptor.cc = 1
+    with pytest.raises(AttributeError):
+        del descriptor.cc
+
+
+def test_descriptor_equality_hash_and_pickle():
+    descriptor = ParameterDescriptor(3, "amp_page", None, "ATK", 84, 30, 1, 0, 127)
+    copy = pickle.loads(pickle.dumps(descriptor))
+
+    assert copy == descriptor
+    assert hash(copy) == hash(descriptor)
+    assert {descriptor: 1}[copy] == 1
+    assert "name='ATK'" in repr(descriptor)
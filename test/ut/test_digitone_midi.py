@@ -0,0 +1,358 @@
+import threading
+import time
+from unittest.mock import patch
+
+import mido
+import pytest
+
+from elektron_mcp.midi import digitone_midi
+from elektron_mcp.midi.backends import MemoryBackend
+from elektron_mcp.midi.digitone_midi import DigitoneMIDI
+
+
+class FakeRtMidiOut:
+    """Stands in for rtmidi.MidiOut and records every raw write."""
+
+    def __init__(self):
+        self.writes = []
+
+    def send_message(self, message):
+        message = bytes(message)
+        # Same check as python-rtmidi's MidiOut.send_message
+        if len(message) > 3 and message[0] != 0xF0:
+            raise ValueError(
+                "'message' longer than 3 bytes but does not start with 0xF0."
+            )
+        self.writes.append(message)
+
+
+class FakeRawPort:
+    """Output port exposing a raw rtmidi writer like mido's rtmidi backend."""
+
+    def __init__(self):
+        self._rt = FakeRtMidiOut()
+
+    def close(self):
+        pass
+
+
+class FakeMidoPort:
+    """Output port that only accepts mido.Message objects."""
+
+    def __init__(self):
+        self.messages = []
+
+    def send(self, msg):
+        self.messages.append(msg)
+
+    def close(self):
+        pass
+
+
+def make_midi(port):
+    with patch.object(DigitoneMIDI, "auto_connect", return_value=False):
+        midi = DigitoneMIDI()
+    midi._attach_output(port)
+    midi.connected = True
+    return midi
+
+
+def nrpn_bytes(channel, nrpn_msb, nrpn_lsb, value):
+    status = 0xB0 | (channel - 1)
+    cc_pairs = [
+        (99, nrpn_msb),
+        (98, nrpn_lsb),
+        (6, (value >> 7) & 0x7F),
+        (38, value & 0x7F),
+    ]
+    return b"".join(bytes([status, cc, data]) for cc, data in cc_pairs)
+
+
+def split_messages(data):
+    return [data[i : i + 3] for i in range(0, len(data), 3)]
+
+
+def test_send_nrpn_batch_writes_one_message_per_rtmidi_call():
+    port = FakeRawPort()
+    midi = make_midi(port)
+
+    assert midi.send_nrpn_batch(2, [(73, 1, 64), (74, 1, 300)]) is True
+
+    expected = nrpn_bytes(2, 73, 1, 64) + nrpn_bytes(2, 74, 1, 300)
+    assert port._rt.writes == split_messages(expected)
+
+
+def test_mido_fallback_writes_the_same_messages_as_the_raw_path():
+    raw_port, mido_port = FakeRawPort(), FakeMidoPort()
+    raw, fallback = make_midi(raw_port), make_midi(mido_port)
+
+    for midi in (raw, fallback):
+        assert midi.send_cc(3, 40, 5) is True
+        assert midi.send_nrpn(3, 73, 1, 300) is True
+        assert midi.send_nrpn(3, 73, 1, 301) is True
+        assert midi.send_cc_batch(3, [(41, 1), (42, 2)]) is True
+        assert midi.send_nrpn_batch(3, [(74, 1, 64), (75, 1, 16383)]) is True
+
+    assert [bytes(msg.bytes()) for msg in mido_port.messages] == raw_port._rt.writes
+
+
+def test_send_cc_batch_writes_one_message_per_rtmidi_call():
+    port = FakeRawPort()
+    midi = make_midi(port)
+
+    assert midi.send_cc_batch(1, [(40, 1), (41, 2)]) is True
+
+    assert port._rt.writes == [bytes([0xB0, 40, 1]), bytes([0xB0, 41, 2])]
+
+
+def test_send_cc_batch_falls_back_to_mido_messages():
+    port = FakeMidoPort()
+    midi = make_midi(port)
+
+    assert midi.send_cc_batch(16, [(40, 1), (41, 127)]) is True
+
+    assert port.messages == [
+        mido.Message("control_change", channel=15, control=40, value=1),
+        mido.Message("control_change", channel=15, control=41, value=127),
+    ]
+
+
+@pytest.mark.parametrize("channel", [0, 17])
+def test_batch_rejects_invalid_channel(channel):
+    port = FakeRawPort()
+    midi = make_midi(port)
+
+    assert midi.send_cc_batch(channel, [(40, 1)]) is False
+    assert midi.send_nrpn_batch(channel, [(73, 1, 1)]) is False
+    assert port._rt.writes == []
+
+
+def test_send_nrpn_skips_address_when_already_selected():
+    port = FakeMidoPort()
+    midi = make_midi(port)
+
+    assert midi.send_nrpn(1, 73, 1, 10) is True
+    assert midi.send_nrpn(1, 73, 1, 11) is True
+
+    controls = [msg.control for msg in port.messages]
+    assert controls == [99, 98, 6, 38, 6, 38]
+
+
+def test_nrpn_address_is_tracked_per_channel():
+    port = FakeMidoPort()
+    midi = make_midi(port)
+
+    midi.send_nrpn(1, 73, 1, 10)
+    midi.send_nrpn(2, 73, 1, 10)
+
+    controls = [msg.control for msg in port.messages]
+    assert controls == [99, 98, 6, 38, 99, 98, 6, 38]
+
+
+def test_send_nrpn_batch_skips_repeated_addresses():
+    port = FakeRawPort()
+    midi = make_midi(port)
+
+    midi.send_nrpn_batch(3, [(73, 1, 1), (73, 1, 2), (74, 1, 3)])
+    midi.send_nrpn_batch(3, [(74, 1, 4)])
+
+    status = 0xB0 | 2
+    assert port._rt.writes == split_messages(
+        nrpn_bytes(3, 73, 1, 1)
+        + bytes([status, 6, 0, status, 38, 2])
+        + nrpn_bytes(3, 74, 1, 3)
+        + bytes([status, 6, 0, status, 38, 4])
+    )
+
+
+def test_invalidate_nrpn_cache_resends_address():
+    port = FakeMidoPort()
+    midi = make_midi(port)
+
+    midi.send_nrpn(1, 73, 1, 10)
+    midi.invalidate_nrpn_cache(1)
+    midi.send_nrpn(1, 73, 1, 10)
+    midi.send_cc(1, 99, 0)
+    midi.send_nrpn(1, 73, 1, 10)
+
+    controls = [msg.control for msg in port.messages]
+    assert controls == [99, 98, 6, 38, 99, 98, 6, 38, 99, 99, 98, 6, 38]
+
+
+def test_nrpn_address_cache_can_be_disabled():
+    port = FakeMidoPort()
+    midi = make_midi(port)
+    midi.cache_nrpn_address = False
+
+    midi.send_nrpn(1, 73, 1, 10)
+    midi.send_nrpn(1, 73, 1, 10)
+
+    assert len(port.messages) == 8
+
+
+def test_send_cc_writes_raw_bytes():
+    port = FakeRawPort()
+    midi = make_midi(port)
+
+    assert midi.send_cc(10, 40, 64) is True
+
+    assert port._rt.writes == [bytes([0xB9, 40, 64])]
+
+
+def test_send_nrpn_writes_raw_bytes():
+    port = FakeRawPort()
+    midi = make_midi(port)
+
+    assert midi.send_nrpn(1, 73, 1, 200) is True
+    assert midi.send_nrpn(1, 73, 1, 201) is True
+
+    assert port._rt.writes == split_messages(
+        nrpn_bytes(1, 73, 1, 200) + bytes([0xB0, 6, 1, 0xB0, 38, 201 & 0x7F])
+    )
+
+
+def test_raw_path_rejects_out_of_range_data():
+    port = FakeRawPort()
+    midi = make_midi(port)
+
+    assert midi.send_cc(1, 40, 128) is False
+    assert midi.send_cc(1, 128, 0) is False
+    assert midi.send_nrpn(1, 128, 1, 0) is False
+    assert midi.send_nrpn(1, 73, 1, 16384) is False
+    assert port._rt.writes == []
+
+
+def test_batches_reject_out_of_range_data_before_writing():
+    port = FakeRawPort()
+    midi = make_midi(port)
+
+    assert midi.send_cc_batch(1, [(40, 1), (200, 5)]) is False
+    assert midi.send_cc_batch(1, [(40, 300)]) is False
+    assert midi.send_nrpn_batch(1, [(73, 1, 5), (200, 1, 5)]) is False
+    assert midi.send_nrpn_batch(1, [(73, 1, 16384)]) is False
+    assert port._rt.writes == []
+
+    # Nothing was cached: the next NRPN selects its address
+    assert midi.send_nrpn_batch(1, [(73, 1, 5)]) is True
+    assert [write[1] for write in port._rt.writes] == [99, 98, 6, 38]
+
+
+class YieldingRtMidiOut(FakeRtMidiOut):
+    """Records raw writes and yields to other threads after each one."""
+
+    def __init__(self, block=None):
+        super().__init__()
+        self.block = block
+
+    def send_message(self, message):
+        if self.block is not None:
+            self.block.wait(5)
+        super().send_message(message)
+        time.sleep(0)
+
+
+def make_named_midi(name, block=None):
+    port = FakeRawPort()
+    port.name = name
+    port._rt = YieldingRtMidiOut(block)
+    return make_midi(port), port._rt
+
+
+def decode_nrpns(writes):
+    """Replay the CC stream like the device does: (address, value) per CC 38."""
+    selected, data_msb, decoded = {}, {}, []
+    stream = b"".join(writes)
+    for offset in range(0, len(stream), 3):
+        status, cc, value = stream[offset : offset + 3]
+        channel = status & 0x0F
+        msb, lsb = selected.get(channel, (None, None))
+        if cc == 99:
+            selected[channel] = (value, lsb)
+        elif cc == 98:
+            selected[channel] = (msb, value)
+        elif cc == 6:
+            data_msb[channel] = value
+        elif cc == 38:
+            decoded.append((selected[channel], (data_msb[channel] << 7) | value))
+    return decoded
+
+
+def test_concurrent_nrpns_are_never_interleaved():
+    midi, rt = make_named_midi("stress")
+    threads, sends = 8, 150
+
+    def hammer(thread):
+        for i in range(sends):
+            value = thread * 1000 + i
+            if i % 3 == 0:
+                midi.send_nrpn_batch(1, [(thread, i % 4, value)])
+            else:
+                midi.send_nrpn(1, thread, i % 4, value)
+            midi.send_cc(1, 40, i % 128)
+
+    workers = [threading.Thread(target=hammer, args=(t,)) for t in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+
+    decoded = decode_nrpns(rt.writes)
+    assert len(decoded) == threads * sends
+    for (nrpn_msb, nrpn_lsb), value in decoded:
+        assert value // 1000 == nrpn_msb
+        assert value % 1000 % 4 == nrpn_lsb
+
+
+def test_ports_are_locked_independently():
+    block = threading.Event()
+    slow, _ = make_named_midi("port a", block=block)
+    fast, fast_rt = make_named_midi("port b")
+
+    writer = threading.Thread(target=slow.send_nrpn, args=(1, 73, 1, 0))
+    writer.start()
+    # The slow port is stuck mid-sequence; the other port still writes
+    assert fast.send_nrpn(1, 73, 1, 5)
+    assert decode_nrpns(fast_rt.writes) == [((73, 1), 5)]
+
+    block.set()
+    writer.join(5)
+    assert not writer.is_alive()
+
+    shared, _ = make_named_midi("port a")
+    assert shared._port_lock is slow._port_lock
+    assert fast._port_lock is not slow._port_lock
+
+
+def test_nrpn_address_cache_is_shared_by_instances_on_a_port():
+    backend = MemoryBackend()
+    first = DigitoneMIDI(backend=backend)
+    second = DigitoneMIDI(backend=backend)
+    port = first.output_port
+
+    first.send_nrpn(1, 73, 1, 10)
+    second.send_nrpn(1, 74, 1, 10)
+    port.clear()
+    first.send_nrpn(1, 73, 1, 11)
+
+    # The other instance selected 74/1, so the address must be sent again
+    assert port.wire_bytes() == nrpn_bytes(1, 73, 1, 11)
+
+
+def test_port_state_is_per_backend_and_released_on_disconnect():
+    backend = MemoryBackend()
+    first = DigitoneMIDI(backend=backend)
+    second = DigitoneMIDI(backend=backend)
+    other = DigitoneMIDI(backend=MemoryBackend())
+    port_states = digitone_midi._port_states
+
+    assert first._port_lock is second._port_lock
+    assert other._port_lock is not first._port_lock
+
+    first.disconnect()
+    assert first._port_lock is not second._port_lock
+    assert backend in port_states
+
+    second.disconnect()
+    other.disconnect()
+    assert backend not in port_states
+    assert other.backend not in port_states
@@ -0,0 +1,98 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from elektron_mcp.tools.generated_tools import (
+    DEFAULT_SECTIONS,
+    parse_sections,
+    register_section_tools,
+    tool_specs,
+)
+from elektron_mcp.tools.sections import SECTIONS
+
+
+def register(sections=DEFAULT_SECTIONS):
+    mcp, midi = FastMCP("test"), MagicMock()
+    midi.send_cc.return_value = True
+    register_section_tools(mcp, midi, sections)
+    tools = {tool.name: tool for tool in asyncio.run(mcp.list_tools())}
+    return mcp, midi, tools
+
+
+def test_default_sections_keep_the_tool_names():
+    _, _, tools = register()
+
+    assert len(tools) == 64
+    assert {
+        "set_wavetone_osc1_pitch",
+        "set_wavetone_noise_character",
+        "set_multimode_filter_envelope_depth",
+        "set_amp_envelope_reset",
+        "set_fx_sample_rate_routing",
+        "set_lfo1_destination",
+        "set_lfo2_depth",
+    } <= set(tools)
+    assert not any(name.startswith("set_lfo3") for name in tools)
+
+
+def test_descriptions_are_rendered_from_the_config():
+    _, _, tools = register()
+
+    pitch = tools["set_wavetone_osc1_pitch"].description
+    assert pitch.startswith("Set the pitch of oscillator one.")
+    assert "value (int): Pitch value ranging from 0 to 127." in pitch
+    assert "- 64 maps to 0\n" in pitch
+    assert "- 127 maps to +5" in pitch
+    assert "Default is 0 (center)." in pitch
+    assert "- 64 maps to 50%" in tools["set_wavetone_osc1_phase_distortion"].description
+
+    waveform = tools["set_lfo1_waveform"].description
+    assert '- 6 = "rand"' in waveform
+    assert 'Default is "sine" (1).' in waveform
+    assert "Display range: discrete options." in waveform
+
+    noise = tools["set_wavetone_noise_type"].description
+    assert '- 0 = "grain noise"' in noise
+    assert 'Default is "grain noise" (0).' in noise
+
+    filter_type = tools["set_multimode_filter_type"].description
+    assert "Display range: continuous." in filter_type
+    assert "Default is 0 (Lowpass)." in filter_type
+
+    dest = tools["set_lfo2_destination"].description
+    assert "ranging from 0 to 99." in dest
+    assert "- 0 = none (default)" in dest
+    assert "- 1 = lfo1_speed" in dest
+
+    assert "- 64  = EQ" in tools["set_multimode_filter_type"].description
+
+
+def test_tools_send_through_the_controllers():
+    mcp, midi, _ = register(["wavetone", "fmtone"])
+
+    assert asyncio.run(
+        mcp.call_tool("set_wavetone_osc1_pitch", {"value": 70, "track": 2})
+    )
+    midi.send_cc.assert_called_once_with(2, 40, 70)
+
+    asyncio.run(mcp.call_tool("set_fmtone_algo", {"value": 3, "track": 1}))
+    assert midi.send_cc.call_count == 2
+
+
+def test_every_section_can_be_exposed():
+    _, _, tools = register(SECTIONS)
+
+    assert len(tools) == sum(len(tool_specs(section)) for section in SECTIONS)
+    assert {"set_fmtone_algo", "set_lfo3_speed", "set_comb_plus_filter_freq"} <= set(
+        tools
+    )
+
+
+def test_parse_sections():
+    assert parse_sections(None) == DEFAULT_SECTIONS
+    assert parse_sections("all") == tuple(SECTIONS)
+    assert parse_sections(" fmtone, amp ") == ("fmtone", "amp")
+    with pytest.raises(ValueError, match="Invalid section: organ"):
+        parse_sections("wavetone,organ")
@@ -0,0 +1,69 @@
+import asyncio
+import json
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from elektron_mcp.tools.generic_tool import register_generic_tools
+from elektron_mcp.tools.registration import register_tools
+from elektron_mcp.tools.sections import SECTIONS, describe_section
+
+
+@pytest.fixture
+def tools(fake_mcp, mock_midi):
+    register_generic_tools(fake_mcp, mock_midi)
+    return fake_mcp, mock_midi
+
+
+def test_set_and_get_param(tools):
+    mcp, midi = tools
+
+    assert asyncio.run(mcp.tools["set_param"]("wavetone", "TUN1", 70, 2))
+    midi.send_cc_batch.assert_called_once_with(2, [(40, 70)])
+    assert mcp.tools["get_param"]("wavetone", "TUN1", 2) == 70
+    assert mcp.tools["get_param"]("amp", "ATK", 2) is None
+
+    assert asyncio.run(mcp.tools["set_param"]("lfo3", "SPD", 5, 1))
+    assert mcp.tools["get_param"]("lfo3", "SPD", 1) == 5
+
+
+def test_invalid_params_raise(tools):
+    mcp, _ = tools
+
+    with pytest.raises(ValueError, match="Invalid section: organ"):
+        asyncio.run(mcp.tools["set_param"]("organ", "TUN1", 1, 1))
+    with pytest.raises(ValueError, match="Invalid parameter: NOPE in amp"):
+        mcp.tools["get_param"]("amp", "NOPE", 1)
+    with pytest.raises(ValueError, match="Invalid value for ATK: 300"):
+        asyncio.run(mcp.tools["set_param"]("amp", "ATK", 300, 1))
+
+
+def test_sections_are_described_and_served_as_resources(tools):
+    mcp, _ = tools
+
+    sections = json.loads(mcp.resources["digitone://sections"]())
+    assert set(sections) == set(SECTIONS)
+
+    fmtone = json.loads(mcp.resources["digitone://sections/{section}"]("fmtone"))
+    assert fmtone == json.loads(json.dumps(mcp.tools["describe_section"]("fmtone")))
+    names = {param["name"] for param in fmtone["parameters"]}
+    assert {"ALGO", "A.atk"} <= names
+
+    dest = next(
+        p for p in describe_section("lfo1")["parameters"] if p["name"] == "DEST"
+    )
+    assert dest["options"]["none"] == 0
+    assert "page" not in dest
+
+
+def test_compact_mode_lists_fewer_tools(fake_mcp, mock_midi):
+    def tool_names(mode):
+        mcp = FastMCP("test")
+        register_tools(mcp, mock_midi, mode)
+        return {tool.name for tool in asyncio.run(mcp.list_tools())}
+
+    compact = tool_names("compact")
+    assert compact == {"set_param", "get_param", "describe_section", "apply_patch"}
+    assert len(tool_names("full")) > 10 * len(compact)
+    with pytest.raises(ValueError, match="Invalid tool mode"):
+        register_tools(fake_mcp, mock_midi, "tiny")
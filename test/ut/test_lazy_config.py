@@ -0,0 +1,45 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from elektron_mcp.digitone.config.config import (
+    SECTION_BUILDERS,
+    build_digitone_config,
+    build_wavetone,
+    digitone_config,
+)
+from elektron_mcp.digitone.config.lazy_config import LazyDigitoneConfig
+from elektron_mcp.digitone.config.parameter_table import ParameterTable
+
+
+def test_sections_are_built_on_first_access():
+    build = MagicMock(side_effect=build_wavetone)
+    config = LazyDigitoneConfig({"wavetone": build})
+    assert config.built_sections() == []
+
+    pages = config.wavetone.pages
+    assert config.wavetone.pages is pages
+
+    build.assert_called_once()
+    assert config.built_sections() == ["wavetone"]
+    with pytest.raises(AttributeError):
+        config.fmdrum
+
+
+def test_listeners_see_every_built_section():
+    config = LazyDigitoneConfig({"wavetone": build_wavetone})
+    config.wavetone
+    table = ParameterTable()
+    config.add_build_listener(table.add_section)
+
+    assert table.group(config.wavetone.pages)[("page_1", "TUN1")].id == 0
+
+
+def test_unknown_sections_are_rejected():
+    with pytest.raises(ValueError, match="nope"):
+        LazyDigitoneConfig({"nope": build_wavetone})
+
+
+def test_lazy_config_matches_the_eager_build():
+    assert set(SECTION_BUILDERS) == set(type(build_digitone_config()).model_fields)
+    assert digitone_config.to_config() == build_digitone_config()
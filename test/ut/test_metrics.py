@@ -0,0 +1,152 @@
+import asyncio
+import json
+import random
+import urllib.request
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from elektron_mcp.digitone.config.config import digitone_config
+from elektron_mcp.digitone.services.wavetone_controller import WavetoneController
+from elektron_mcp.midi.async_midi import AsyncDigitoneMIDI
+from elektron_mcp.midi.backends import MemoryBackend
+from elektron_mcp.midi.digitone_midi import DigitoneMIDI
+from elektron_mcp.midi.metrics import (
+    Histogram,
+    Metrics,
+    bucket_bounds,
+    bucket_index,
+    serve_prometheus,
+)
+from elektron_mcp.tools.metrics_resource import register_metrics_resources
+
+
+def test_buckets_are_contiguous_and_precise():
+    previous_high = -1
+    for index in range(bucket_index(1 << 40)):
+        low, high = bucket_bounds(index)
+        assert low == previous_high + 1
+        assert (high - low) <= low / 16
+        previous_high = high
+    for value in (0, 15, 16, 17, 1000, 123_456_789):
+        low, high = bucket_bounds(bucket_index(value))
+        assert low <= value <= high
+
+
+def test_histogram_percentiles_are_within_bucket_precision():
+    values = [random.randrange(1_000, 10_000_000) for _ in range(10_000)]
+    histogram = Histogram()
+    for value in values:
+        histogram.record(value)
+
+    values.sort()
+    for quantile in (0.5, 0.9, 0.99):
+        exact = values[round(quantile * len(values)) - 1]
+        assert histogram.percentile(quantile) == pytest.approx(exact, rel=1 / 16)
+    assert histogram.percentile(1.0) == values[-1]
+    assert histogram.snapshot()["count"] == len(values)
+
+
+def test_midi_sends_are_counted():
+    metrics = Metrics()
+    midi = DigitoneMIDI(backend=MemoryBackend(), metrics=metrics)
+
+    midi.send_cc(1, 40, 64)
+    midi.send_nrpn(1, 73, 1, 5)
+    midi.send_nrpn(1, 73, 1, 6)
+    midi.send_nrpn_batch(2, [(73, 1, 5), (73, 2, 5)])
+    midi.send_message([0x90, 60, 100])
+    midi.disconnect()
+    midi.connected = True
+    midi.output_port = object()  # Fails on write
+    midi.send_cc(1, 40, 1)
+
+    assert metrics.counter("midi_messages_total", "cc") == 1
+    assert metrics.counter("midi_bytes_total", "cc") == 3
+    assert metrics.counter("midi_messages_total", "nrpn") == 4
+    # Full sequence, cached address, then two full sequences in a batch
+    assert metrics.counter("midi_bytes_total", "nrpn") == 12 + 6 + 24
+    assert metrics.counter("midi_messages_total", "raw") == 1
+    assert metrics.counter("midi_errors_total", "send_cc") == 1
+    assert metrics.histogram("midi_send_seconds", "send_nrpn").count == 2
+    assert metrics.histogram("midi_send_seconds", "send_nrpn_batch").count == 1
+
+
+def test_controller_sets_are_counted_through_transports():
+    metrics = Metrics()
+    midi = AsyncDigitoneMIDI(DigitoneMIDI(backend=MemoryBackend(), metrics=metrics))
+    controller = WavetoneController(digitone_config.wavetone.pages, midi, 1)
+    try:
+        controller.set_osc1_pitch(64)
+        controller.set_osc1_pitch(64)
+        midi.flush()
+    finally:
+        midi.close()
+
+    assert controller.metrics is metrics
+    assert sum(metrics.snapshot()["counters"]["controller_sets_total"].values()) == 1
+    assert sum(metrics.snapshot()["counters"]["controller_skipped_total"].values()) == 1
+
+
+def test_nrpn_fallbacks_are_counted():
+    metrics = Metrics()
+    midi = DigitoneMIDI(backend=MemoryBackend(), metrics=metrics)
+    midi.send_nrpn = lambda *args: False
+    controller = WavetoneController(digitone_config.wavetone.pages, midi, 1)
+
+    assert controller.set_parameter_nrpn("page_1", "TUN1", 64)
+
+    assert metrics.counter("controller_cc_fallbacks_total", "set_parameter_nrpn") == 1
+    assert metrics.counter("controller_sets_total", "set_parameter_nrpn") == 1
+    assert metrics.counter("midi_messages_total", "cc") == 1
+
+
+def test_controllers_without_metrics_record_nothing():
+    midi = DigitoneMIDI(backend=MemoryBackend())
+    controller = WavetoneController(digitone_config.wavetone.pages, midi, 1)
+
+    assert controller.metrics is None
+    assert controller.set_osc1_pitch(64)
+
+
+def test_prometheus_text():
+    metrics = Metrics()
+    metrics.sent("send_cc", "cc", 2, 6, 0)
+    metrics.inc("midi_errors_total", "send_nrpn")
+
+    text = metrics.prometheus()
+
+    assert "# TYPE elektron_mcp_midi_messages_total counter" in text
+    assert 'elektron_mcp_midi_bytes_total{type="cc"} 6' in text
+    assert 'elektron_mcp_midi_errors_total{operation="send_nrpn"} 1' in text
+    assert "# TYPE elektron_mcp_midi_send_seconds summary" in text
+    assert 'elektron_mcp_midi_send_seconds{operation="send_cc",quantile="0.99"}' in text
+    assert 'elektron_mcp_midi_send_seconds_count{operation="send_cc"} 1' in text
+
+
+def test_prometheus_endpoint():
+    metrics = Metrics()
+    metrics.inc("midi_errors_total", "send_cc")
+    server = serve_prometheus(metrics, 0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert 'elektron_mcp_midi_errors_total{operation="send_cc"} 1' in body
+
+
+def test_metrics_resource():
+    metrics = Metrics()
+    metrics.sent("send_nrpn", "nrpn", 1, 12, 0)
+    mcp = FastMCP("test")
+    register_metrics_resources(mcp, metrics)
+
+    contents = asyncio.run(mcp.read_resource("metrics://midi"))
+    snapshot = json.loads(contents[0].content)
+
+    assert snapshot["counters"]["midi_bytes_total"] == {"nrpn": 12}
+    assert snapshot["histograms"]["midi_send_seconds"]["send_nrpn"]["count"] == 1
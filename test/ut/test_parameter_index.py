@@ -0,0 +1,48 @@
+from elektron_mcp.digitone.config.config import digitone_config, digitone_index
+from elektron_mcp.digitone.config.parameter_index import (
+    ParameterRef,
+    build_parameter_index,
+)
+from elektron_mcp.digitone.utils.parameter_utils import iter_parameters
+
+
+def test_every_parameter_is_indexed():
+    for engine, page, name, param in iter_parameters(digitone_config):
+        ref = ParameterRef(engine, page, name)
+        address = (param.midi.nrpn_msb, param.midi.nrpn_lsb)
+        assert ref in digitone_index.lookup_cc(int(param.midi.cc_msb))
+        assert ref in digitone_index.lookup_nrpn(*address)
+        assert digitone_index.cc_to_nrpn(int(param.midi.cc_msb)) == address
+
+
+def test_lookup_by_engine():
+    assert digitone_index.resolve_cc("wavetone", 40) == ParameterRef(
+        "wavetone", "page_1", "TUN1"
+    )
+    assert digitone_index.resolve_nrpn("amp_page", 30, 1) == ParameterRef(
+        "amp_page", None, "ATK"
+    )
+    assert digitone_index.resolve_nrpn("lfo", 42, 1) == ParameterRef(
+        "lfo", "lfo_1", "SPD"
+    )
+    assert digitone_index.resolve_cc("amp_page", 40) is None
+    assert digitone_index.lookup_cc(0) == ()
+
+
+def test_collisions_between_engines_are_flagged():
+    engines = {ref.engine for ref in digitone_index.cc_collisions[40]}
+    assert engines == {"fmdrum", "fmtone", "swarmer", "wavetone"}
+    assert (73, 1) in digitone_index.nrpn_collisions
+    # Amp parameters have CCs of their own
+    assert 84 not in digitone_index.cc_collisions
+
+
+def test_index_only_covers_the_given_config():
+    config = digitone_config.model_copy(
+        update={"fmdrum": digitone_config.fmdrum.model_copy(update={"pages": {}})}
+    )
+    index = build_parameter_index(config)
+
+    assert index.lookup_cc(40) == tuple(
+        ref for ref in digitone_index.lookup_cc(40) if ref.engine != "fmdrum"
+    )
@@ -0,0 +1,74 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from elektron_mcp.digitone.config.config import digitone_config, parameter_table
+from elektron_mcp.digitone.config.parameter_table import compile_parameter_table
+from elektron_mcp.digitone.services.base_synth_controller import BaseSynthController
+from elektron_mcp.digitone.services.shadow_state import ShadowState
+from elektron_mcp.digitone.utils.parameter_utils import iter_parameters
+
+
+def test_every_parameter_is_compiled():
+    params = list(iter_parameters(digitone_config))
+    assert len(parameter_table) == len(params)
+
+    for engine, page, name, param in params:
+        entry = parameter_table[parameter_table.id_of(engine, page, name)]
+        assert (entry.engine, entry.page, entry.name) == (engine, page, name)
+        assert entry.cc == int(param.midi.cc_msb)
+        assert (entry.nrpn_msb, entry.nrpn_lsb) == (
+            param.midi.nrpn_msb,
+            param.midi.nrpn_lsb,
+        )
+        assert (entry.min_midi, entry.max_midi) == (
+            param.min_midi_value,
+            param.max_midi_value,
+        )
+
+
+def test_ids_are_positions_in_the_table():
+    assert [entry.id for entry in parameter_table] == list(range(len(parameter_table)))
+
+
+def test_groups_are_keyed_like_the_controllers():
+    pages = parameter_table.group(digitone_config.wavetone.pages)
+    assert pages[("page_1", "TUN1")].cc == 40
+
+    fmtone = parameter_table.group(digitone_config.fmtone.pages)
+    assert ("page_2", "A.atk") in fmtone
+
+    amp = parameter_table.group(digitone_config.amp_page.parameters)
+    assert amp["ATK"].engine == "amp_page"
+
+
+def test_unknown_configs_are_compiled_on_the_fly():
+    table = compile_parameter_table(digitone_config)
+    pages = dict(digitone_config.wavetone.pages)
+
+    entry = table.group(pages)[("page_1", "TUN1")]
+    assert entry.id == -1
+    assert entry.cc == 40
+    # ...and never added to the table
+    assert len(table) == len(compile_parameter_table(digitone_config))
+    assert table.group(pages) is not table.group(pages)
+
+
+def test_controller_resolves_through_the_table():
+    midi = MagicMock()
+    midi.send_cc.return_value = True
+    midi.send_nrpn.return_value = True
+    controller = BaseSynthController(
+        digitone_config.wavetone.pages, midi, 1, shadow_state=ShadowState()
+    )
+
+    assert controller.set_parameter("page_1", "TUN1", 64)
+    midi.send_cc.assert_called_once_with(1, 40, 64)
+    assert controller.set_parameter_nrpn("page_1", "TUN1", 65)
+    midi.send_nrpn.assert_called_once_with(1, 73, 1, 65)
+    assert controller.get_parameter("page_1", "TUN1") == 65
+
+    with pytest.raises(ValueError, match="Invalid page: page_9"):
+        controller.set_parameter("page_9", "TUN1", 64)
+    with pytest.raises(ValueError, match="Invalid parameter: NOPE on page_1"):
+        controller.set_parameter("page_1", "NOPE", 64)
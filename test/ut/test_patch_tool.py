@@ -0,0 +1,67 @@
+import asyncio
+
+import mido
+
+from elektron_mcp.midi.backends import DEFAULT_PORT_NAME, MemoryBackend
+from elektron_mcp.midi.digitone_midi import DigitoneMIDI
+from elektron_mcp.midi.scheduler import Lane
+from elektron_mcp.tools.patch_tool import (
+    PatchEntry,
+    apply_patch_entries,
+    register_patch_tools,
+)
+
+
+def entry(section, parameter, value, track=1):
+    return PatchEntry(section=section, parameter=parameter, value=value, track=track)
+
+
+def test_patch_is_sent_as_one_batch_per_section_and_track(mock_midi):
+    result = apply_patch_entries(
+        mock_midi,
+        [
+            entry("wavetone", "TUN1", 64),
+            entry("wavetone", "LEV1", 100),
+            entry("amp", "ATK", 5),
+            entry("amp", "ATK", 6, track=2),
+        ],
+    )
+
+    assert result == {"applied": 4, "errors": {}}
+    assert mock_midi.send_cc_batch.call_count == 3
+    mock_midi.send_cc_batch.assert_any_call(1, [(84, 5)], lane=Lane.BULK)
+    mock_midi.send_cc_batch.assert_any_call(2, [(84, 6)], lane=Lane.BULK)
+
+
+def test_invalid_entries_are_reported(mock_midi):
+    result = apply_patch_entries(
+        mock_midi,
+        [
+            entry("wavetone", "TUN1", 1),
+            entry("organ", "TUN1", 1),
+            entry("amp", "NOPE", 1),
+            entry("amp", "ATK", 500),
+            entry("amp", "ATK", 1, track=17),
+        ],
+    )
+
+    assert result["applied"] == 1
+    errors = result["errors"]
+    assert errors["organ.TUN1@1"].startswith("Invalid section: organ")
+    assert errors["amp.NOPE@1"] == "Invalid parameter: NOPE in amp"
+    assert errors["amp.ATK@1"].startswith("Invalid value for ATK: 500")
+    assert errors["amp.ATK@17"].startswith("Invalid track: 17")
+
+
+def test_apply_patch_tool_writes_7_bit_values_as_cc(fake_mcp):
+    device = DigitoneMIDI(DEFAULT_PORT_NAME, backend=MemoryBackend())
+    register_patch_tools(fake_mcp, device)
+
+    result = asyncio.run(
+        fake_mcp.tools["apply_patch"]([entry("lfo1", "SPD", 10, track=3)])
+    )
+
+    assert result == {"applied": 1, "errors": {}}
+    assert device.output_port.messages() == [
+        mido.Message("control_change", channel=2, control=102, value=10)
+    ]
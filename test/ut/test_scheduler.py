@@ -0,0 +1,128 @@
+import time
+
+import pytest
+
+from elektron_mcp.digitone.config.config import digitone_config
+from elektron_mcp.midi.backends import DEFAULT_PORT_NAME, MemoryBackend
+from elektron_mcp.midi.digitone_midi import DigitoneMIDI
+from elektron_mcp.digitone.services.amp_fx_controller import AmpController
+from elektron_mcp.midi.scheduler import Lane, MidiScheduler
+from elektron_mcp.tools.patch_tool import PatchEntry, apply_patch_entries
+
+
+class RecordingMidi:
+    """Records the order of writes handed over by the scheduler."""
+
+    def __init__(self):
+        self.sent = []
+        self.cache_nrpn_address = True
+
+    def send_message(self, data):
+        self.sent.append(("message", tuple(data)))
+        return True
+
+    def send_cc(self, channel, cc, value):
+        self.sent.append(("cc", channel, cc, value))
+        return True
+
+    def send_nrpn(self, channel, nrpn_msb, nrpn_lsb, value):
+        self.sent.append(("nrpn", channel, nrpn_msb, nrpn_lsb, value))
+        return True
+
+    def nrpn_size(self, channel, nrpn_msb, nrpn_lsb):
+        return 12
+
+
+def test_higher_priority_lanes_are_sent_first():
+    midi = RecordingMidi()
+    scheduler = MidiScheduler(midi, bytes_per_second=100_000, autostart=False)
+
+    scheduler.send_nrpn_batch(1, [(73, 1, 1), (74, 1, 2)], lane=Lane.BULK)
+    scheduler.send_cc(1, 40, 3)
+    scheduler.send_message([0x90, 60, 100])
+    scheduler.start()
+
+    assert scheduler.flush(5)
+    scheduler.close(5)
+    assert midi.sent == [
+        ("message", (0x90, 60, 100)),
+        ("cc", 1, 40, 3),
+        ("nrpn", 1, 73, 1, 1),
+        ("nrpn", 1, 74, 1, 2),
+    ]
+
+
+def test_reports_queue_depth_and_drain_time():
+    midi = RecordingMidi()
+    scheduler = MidiScheduler(
+        midi, bytes_per_second=3125, burst_bytes=12, autostart=False
+    )
+
+    scheduler.send_nrpn_batch(1, [(73, 1, v) for v in range(10)], lane=Lane.BULK)
+    scheduler.send_cc(1, 40, 1)
+
+    assert scheduler.queue_depth() == {"realtime": 0, "parameter": 1, "bulk": 10}
+    stats = scheduler.stats()
+    # One full NRPN, then the cached address leaves 6 bytes per NRPN, then the CC
+    assert stats["pending_bytes"] == 12 + 9 * 6 + 3
+    # 69 queued bytes minus a full 12 byte bucket at 3125 bytes per second
+    assert stats["estimated_drain_time"] == pytest.approx(57 / 3125, abs=1e-3)
+    scheduler.close()
+
+
+def test_queued_bytes_follow_the_nrpn_address_cache():
+    device = DigitoneMIDI(DEFAULT_PORT_NAME, backend=MemoryBackend())
+    device.send_nrpn(1, 73, 1, 0)
+    scheduler = MidiScheduler(device, burst_bytes=12, autostart=False)
+
+    scheduler.send_nrpn_batch(1, [(73, 1, 1), (74, 1, 2), (74, 1, 3)])
+    scheduler.send_nrpn(2, 74, 1, 4)
+    scheduler.send_cc(2, 99, 0)
+    scheduler.send_nrpn(2, 74, 1, 5)
+    assert scheduler.stats()["pending_bytes"] == 6 + 12 + 6 + 12 + 3 + 12
+
+    device.cache_nrpn_address = False
+    assert scheduler.stats()["pending_bytes"] == 5 * 12 + 3
+    scheduler.close()
+
+
+def test_output_is_paced_to_the_byte_budget():
+    midi = RecordingMidi()
+    scheduler = MidiScheduler(midi, bytes_per_second=600, burst_bytes=12)
+
+    start = time.monotonic()
+    scheduler.send_cc_batch(1, [(40, v) for v in range(10)])
+    assert scheduler.flush(5)
+    elapsed = time.monotonic() - start
+    scheduler.close(5)
+
+    # 30 bytes with 12 available up front leaves 18 bytes at 600 bytes/s
+    assert len(midi.sent) == 10
+    assert elapsed >= 0.025
+
+
+def test_rejects_writes_beyond_lane_capacity():
+    scheduler = MidiScheduler(RecordingMidi(), max_queue=2, autostart=False)
+
+    assert scheduler.send_cc_batch(1, [(40, 1), (41, 1)]) is True
+    assert scheduler.send_cc(1, 42, 1) is False
+    assert scheduler.send_message([0xF8]) is True
+
+
+def test_patch_batches_go_in_the_bulk_lane():
+    scheduler = MidiScheduler(RecordingMidi(), autostart=False)
+    controller = AmpController(digitone_config.amp_page.parameters, scheduler, 1)
+
+    controller.set_parameters({"VOL": 100})
+    assert scheduler.queue_depth()["parameter"] == 1
+
+    result = apply_patch_entries(
+        scheduler,
+        [
+            PatchEntry(section="amp", parameter="ATK", value=10, track=2),
+            PatchEntry(section="amp", parameter="VOL", value=90, track=2),
+        ],
+    )
+    assert result == {"applied": 2, "errors": {}}
+    assert scheduler.queue_depth() == {"realtime": 0, "parameter": 1, "bulk": 2}
+    scheduler.close(0)
@@ -0,0 +1,78 @@
+from elektron_mcp.digitone.config.config import digitone_config
+from elektron_mcp.digitone.services.amp_fx_controller import AmpController
+from elektron_mcp.digitone.services.fm_tone_controller import FMToneController
+from elektron_mcp.digitone.services.lfo_controller import LFO1Controller
+from elektron_mcp.digitone.services.shadow_state import ShadowState
+from elektron_mcp.digitone.services.wavetone_controller import WavetoneController
+
+
+def test_valid_parameters_are_sent_as_one_batch(mock_midi):
+    controller = WavetoneController(
+        digitone_config.wavetone.pages, mock_midi, 3, shadow_state=ShadowState()
+    )
+
+    results = controller.set_parameters(
+        {("page_1", "TUN1"): 64, ("page_1", "WAV1"): 10}
+    )
+
+    assert results == {("page_1", "TUN1"): True, ("page_1", "WAV1"): True}
+    mock_midi.send_cc_batch.assert_called_once()
+    channel, messages = mock_midi.send_cc_batch.call_args.args
+    assert channel == 3
+    assert messages[0] == (40, 64)
+    assert controller.get_parameter("page_1", "TUN1") == 64
+
+
+def test_invalid_entries_are_reported_and_skipped(mock_midi):
+    controller = AmpController(
+        digitone_config.amp_page.parameters, mock_midi, 1, shadow_state=ShadowState()
+    )
+
+    results = controller.set_parameters({"ATK": 10, "NOPE": 1, "REL": 500})
+
+    assert results["ATK"] is True
+    assert results["NOPE"] == "Invalid parameter: NOPE"
+    assert results["REL"].startswith("Invalid value for REL: 500")
+    mock_midi.send_cc_batch.assert_called_once_with(1, [(84, 10)])
+
+
+def test_nrpn_batch_and_unchanged_values(mock_midi):
+    controller = FMToneController(
+        digitone_config.fmtone.pages, mock_midi, 1, shadow_state=ShadowState()
+    )
+    controller.set_parameters({("page_1", "ALGO"): 2}, use_nrpn=True)
+    mock_midi.send_nrpn_batch.assert_called_once_with(1, [(73, 1, 2)])
+
+    results = controller.set_parameters(
+        {("page_1", "ALGO"): 2, ("page_9", "ALGO"): 1}, use_nrpn=True
+    )
+
+    assert results == {
+        ("page_1", "ALGO"): True,
+        ("page_9", "ALGO"): "Invalid page: page_9",
+    }
+    mock_midi.send_nrpn_batch.assert_called_once()
+
+
+def test_option_values_outside_the_range_are_accepted(mock_midi):
+    controller = LFO1Controller(
+        digitone_config.lfo.lfo_groups["lfo_1"],
+        mock_midi,
+        1,
+        shadow_state=ShadowState(),
+    )
+
+    assert controller.set_parameters({"DEST": 0}) == {"DEST": True}
+
+
+def test_transport_failure_marks_every_sent_parameter(mock_midi):
+    mock_midi.send_cc_batch.side_effect = OSError("port closed")
+    controller = AmpController(
+        digitone_config.amp_page.parameters, mock_midi, 1, shadow_state=ShadowState()
+    )
+
+    assert controller.set_parameters({"ATK": 10, "HOLD": 20}) == {
+        "ATK": False,
+        "HOLD": False,
+    }
+    assert controller.get_direct_parameter("ATK") is None
@@ -0,0 +1,174 @@
+import pytest
+
+from elektron_mcp.digitone.config.config import digitone_config
+from elektron_mcp.digitone.services.amp_fx_controller import AmpController
+from elektron_mcp.digitone.services.shadow_state import ShadowState
+from elektron_mcp.digitone.services.wavetone_controller import WavetoneController
+from elektron_mcp.midi.backends import MemoryBackend
+from elektron_mcp.midi.background_writer import BackgroundMidiWriter
+from elektron_mcp.midi.digitone_midi import DigitoneMIDI
+
+
+class RecordingMidi:
+    """Records every CC/NRPN sent by the controllers."""
+
+    def __init__(self):
+        self.sent = []
+
+    def send_cc(self, channel, cc, value):
+        self.sent.append(("cc", channel, cc, value))
+        return True
+
+    def send_nrpn(self, channel, nrpn_msb, nrpn_lsb, value):
+        self.sent.append(("nrpn", channel, nrpn_msb, nrpn_lsb, value))
+        return True
+
+
+def test_shadow_state_tracks_values_per_track():
+    state = ShadowState()
+
+    assert state.get(1, 73, 1) is None
+    state.set(1, 73, 1, 64)
+    state.set(16, 73, 1, 10)
+    state.set(1, 74, 1, 0)
+
+    assert state.get(1, 73, 1) == 64
+    assert state.get(16, 73, 1) == 10
+    assert state.get(2, 73, 1) is None
+    assert state.snapshot(1) == {(73, 1): 64, (74, 1): 0}
+
+
+def test_shadow_state_invalidate():
+    state = ShadowState()
+    state.set(1, 73, 1, 64)
+    state.set(2, 73, 1, 64)
+
+    state.invalidate(1)
+    assert state.get(1, 73, 1) is None
+    assert state.get(2, 73, 1) == 64
+
+    state.invalidate()
+    assert state.snapshot(2) == {}
+
+
+def test_shadow_state_rejects_invalid_track():
+    with pytest.raises(ValueError):
+        ShadowState().set(17, 73, 1, 0)
+
+
+def test_controller_skips_unchanged_values():
+    midi = RecordingMidi()
+    controller = WavetoneController(digitone_config.wavetone.pages, midi, 1)
+
+    assert controller.set_osc1_pitch(64) is True
+    assert controller.set_osc1_pitch(64) is True
+    assert controller.set_osc1_pitch(65) is True
+
+    assert midi.sent == [("cc", 1, 40, 64), ("cc", 1, 40, 65)]
+    assert controller.get_parameter("page_1", "TUN1") == 65
+
+
+def test_shadow_state_is_shared_per_device():
+    midi = RecordingMidi()
+    AmpController(digitone_config.amp_page.parameters, midi, 3).set_volume(100)
+
+    controller = AmpController(digitone_config.amp_page.parameters, midi, 3)
+    assert controller.get_direct_parameter("VOL") == 100
+    assert controller.set_volume(100) is True
+    assert len(midi.sent) == 1
+
+    other_device = AmpController(
+        digitone_config.amp_page.parameters, RecordingMidi(), 3
+    )
+    assert other_device.get_direct_parameter("VOL") is None
+
+
+def test_failed_send_is_not_recorded():
+    midi = RecordingMidi()
+    midi.send_cc = lambda channel, cc, value: False
+    controller = AmpController(digitone_config.amp_page.parameters, midi, 1)
+
+    assert controller.set_volume(90) is False
+    assert controller.get_direct_parameter("VOL") is None
+
+
+def test_failed_queued_send_is_forgotten():
+    midi = DigitoneMIDI("Digitone", backend=MemoryBackend(["Digitone"]))
+    writer = BackgroundMidiWriter(midi)
+    controller = AmpController(digitone_config.amp_page.parameters, writer, 1)
+
+    def dead_port(data):
+        raise OSError("device unplugged")
+
+    send_raw = midi._raw_send
+    midi._raw_send = dead_port
+    try:
+        # Queued, so reported as sent before the write fails
+        assert controller.set_volume(90) is True
+        assert writer.flush(timeout=1.0)
+        assert controller.get_direct_parameter("VOL") is None
+
+        midi._raw_send = send_raw
+        assert controller.set_volume(90) is True
+        assert writer.flush(timeout=1.0)
+        assert midi.output_port.bytes_sent == 3
+    finally:
+        writer.close()
+
+
+def test_reconnect_forgets_values():
+    backend = MemoryBackend(["Digitone"])
+    midi = DigitoneMIDI("Digitone", backend=backend)
+    controller = AmpController(digitone_config.amp_page.parameters, midi, 1)
+    assert controller.set_volume(90) is True
+
+    midi.disconnect()
+    assert controller.get_direct_parameter("VOL") is None
+    controller.set_volume(90)
+    assert midi.connect("Digitone") is True
+    assert controller.get_direct_parameter("VOL") is None
+
+    assert controller.set_volume(90) is True
+    assert midi.output_port.bytes_sent == 3
+
+
+def test_nrpn_and_cc_values_are_not_interchangeable():
+    midi = RecordingMidi()
+    controller = AmpController(digitone_config.amp_page.parameters, midi, 1)
+
+    assert controller.set_direct_parameter_nrpn("VOL", 64) is True
+    # NRPN 64 is data entry MSB 0 / LSB 64, not what CC 64 sets
+    assert controller.set_direct_parameter("VOL", 64) is True
+    assert controller.set_direct_parameter("VOL", 64) is True
+    assert controller.set_direct_parameter_nrpn("VOL", 64) is True
+
+    assert [sent[0] for sent in midi.sent] == ["nrpn", "cc", "nrpn"]
+    assert controller.get_direct_parameter("VOL") == 64
+
+
+def test_out_of_range_values_are_rejected_before_the_shadow_check():
+    midi = RecordingMidi()
+    controller = AmpController(digitone_config.amp_page.parameters, midi, 2)
+    # Leaves the VOL slot allocated but unknown on every other track
+    assert controller.set_volume(90) is True
+
+    other_track = AmpController(digitone_config.amp_page.parameters, midi, 1)
+    assert other_track.set_direct_parameter("VOL", -1) is False
+    assert other_track.set_direct_parameter_nrpn("VOL", -1) is False
+    assert other_track.set_parameters({"VOL": -1}) != {"VOL": True}
+    assert ShadowState.for_device(midi).matches(1, 39, 1, -1) is False
+    assert len(midi.sent) == 1
+
+
+def test_rejected_sends_keep_the_shadow_values():
+    midi = DigitoneMIDI("Digitone", backend=MemoryBackend(["Digitone"]))
+    controller = AmpController(digitone_config.amp_page.parameters, midi, 1)
+    assert controller.set_volume(90) is True
+
+    # Out of range: rejected before anything is written
+    assert midi.send_cc(1, 90, 128) is False
+    assert midi.send_nrpn(1, 39, 1, 16384) is False
+    assert midi.send_nrpn(1, 128, 1, 0) is False
+
+    assert controller.get_direct_parameter("VOL") == 90
+    assert midi.output_port.bytes_sent == 3
@@ -0,0 +1,97 @@
+from unittest.mock import patch
+
+import mido
+
+from elektron_mcp.digitone.config.config import digitone_config, digitone_index
+from elektron_mcp.digitone.services.shadow_state import ShadowState
+from elektron_mcp.digitone.services.state_listener import StateListener
+from elektron_mcp.digitone.services.wavetone_controller import WavetoneController
+from elektron_mcp.midi.digitone_midi import DigitoneMIDI
+from elektron_mcp.midi.nrpn_reassembler import NrpnReassembler
+
+
+def make_midi():
+    with patch.object(DigitoneMIDI, "auto_connect", return_value=False):
+        return DigitoneMIDI()
+
+
+def cc(channel, control, value):
+    return mido.Message(
+        "control_change", channel=channel - 1, control=control, value=value
+    )
+
+
+def test_reassembler_emits_on_data_entry_lsb():
+    reassembler = NrpnReassembler()
+
+    assert reassembler.feed(0, 99, 73) is None
+    assert reassembler.feed(0, 98, 1) is None
+    assert reassembler.feed(0, 6, 1) is None
+    assert reassembler.feed(0, 38, 5) == (73, 1, 133)
+    # Data entry for the same parameter without re-selecting it
+    assert reassembler.feed(0, 6, 0) is None
+    assert reassembler.feed(0, 38, 7) == (73, 1, 7)
+    # Other channels keep their own state
+    assert reassembler.feed(1, 38, 7) is None
+
+
+def test_reassembler_drops_incomplete_sequences():
+    reassembler = NrpnReassembler()
+
+    reassembler.feed(0, 99, 73)
+    assert reassembler.feed(0, 38, 5) is None
+    reassembler.feed(0, 98, 1)
+    reassembler.feed(0, 101, 0)
+    reassembler.feed(0, 6, 1)
+    assert reassembler.feed(0, 38, 5) is None
+
+
+def test_incoming_nrpn_and_cc_update_shadow_state():
+    midi = make_midi()
+    changes = []
+    StateListener(
+        midi, digitone_index, on_change=lambda *change: changes.append(change)
+    )
+
+    for msg in [cc(2, 99, 73), cc(2, 98, 1), cc(2, 6, 90), cc(2, 38, 5)]:
+        midi._dispatch_input(msg)
+    midi._dispatch_input(cc(2, 41, 12))
+    midi._dispatch_input(mido.Message("note_on", channel=1, note=60))
+
+    state = ShadowState.for_device(midi)
+    assert state.get(2, 73, 1) == 90
+    assert state.get(2, 74, 1) == 12
+    assert changes == [(2, 73, 1, 90), (2, 74, 1, 12)]
+
+
+def test_incoming_nrpn_values_stay_on_the_parameter_scale():
+    midi = make_midi()
+    StateListener(midi, digitone_index)
+    controller = WavetoneController(digitone_config.wavetone.pages, midi, 1)
+
+    for msg in [cc(1, 99, 73), cc(1, 98, 1), cc(1, 6, 127), cc(1, 38, 127)]:
+        midi._dispatch_input(msg)
+
+    entry = controller._entry("page_1", "TUN1")
+    assert controller.get_parameter("page_1", "TUN1") == 127
+    assert entry.accepts(controller.get_parameter("page_1", "TUN1"))
+
+
+def test_panel_change_is_visible_to_controllers():
+    midi = make_midi()
+    StateListener(midi, digitone_index)
+
+    midi._dispatch_input(cc(1, 40, 70))
+
+    controller = WavetoneController(digitone_config.wavetone.pages, midi, 1)
+    assert controller.get_parameter("page_1", "TUN1") == 70
+
+
+def test_closed_listener_stops_updating():
+    midi = make_midi()
+    listener = StateListener(midi, digitone_index)
+    listener.close()
+
+    midi._dispatch_input(cc(1, 40, 70))
+
+    assert ShadowState.for_device(midi).get(1, 73, 1) is None
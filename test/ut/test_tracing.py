@@ -0,0 +1,149 @@
+import asyncio
+import json
+
+import pytest
+
+from elektron_mcp.mcp_server.traced_mcp import TracedFastMCP
+from elektron_mcp.midi import tracing
+from elektron_mcp.midi.async_midi import AsyncDigitoneMIDI
+from elektron_mcp.midi.backends import MemoryBackend
+from elektron_mcp.midi.digitone_midi import DigitoneMIDI
+from elektron_mcp.midi.tracing import NULL_SPAN, Tracer, set_tracer, span
+from elektron_mcp.tools.generic_tool import register_generic_tools
+
+
+@pytest.fixture
+def tracer():
+    tracer = Tracer()
+    set_tracer(tracer)
+    yield tracer
+    set_tracer(None)
+
+
+def spans(tracer):
+    return [event for event in tracer.trace()["traceEvents"] if event["ph"] == "X"]
+
+
+def call_set_param(mcp, value):
+    return asyncio.run(
+        mcp.call_tool(
+            "set_param",
+            {"section": "amp", "parameter": "VOL", "value": value, "track": 1},
+        )
+    )
+
+
+def test_spans_are_noops_without_a_tracer():
+    assert tracing.get_tracer() is None
+    assert span("anything") is NULL_SPAN
+    assert tracing.recording() is None
+
+
+def test_nested_spans(tracer):
+    with span("outer", "test", track=1) as outer:
+        with span("inner", "test"):
+            pass
+        outer.set("result", True)
+
+    inner, outer = spans(tracer)
+    assert (inner["name"], outer["name"]) == ("inner", "outer")
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert outer["args"] == {"track": 1, "result": True}
+
+
+def test_failing_spans_record_the_error(tracer):
+    with pytest.raises(ValueError):
+        with span("broken"):
+            raise ValueError("bad value")
+
+    assert spans(tracer)[0]["args"]["error"] == "ValueError: bad value"
+
+
+def test_tool_call_is_traced_down_to_the_port_write(tracer):
+    mcp = TracedFastMCP("test")
+    register_generic_tools(mcp, DigitoneMIDI(backend=MemoryBackend()))
+
+    call_set_param(mcp, 90)
+
+    names = [event["name"] for event in spans(tracer)]
+    assert names == [
+        "section_controller",
+        "send_cc_batch",
+        "set_one",
+        "tool:set_param",
+    ]
+    assert spans(tracer)[1]["args"] == {"messages": 1, "bytes": 3}
+
+
+def test_traces_continue_on_the_io_thread(tracer):
+    midi = AsyncDigitoneMIDI(DigitoneMIDI(backend=MemoryBackend()))
+    mcp = TracedFastMCP("test")
+    register_generic_tools(mcp, midi)
+    try:
+        call_set_param(mcp, 91)
+    finally:
+        midi.close()
+
+    by_name = {event["name"]: event for event in spans(tracer)}
+    assert by_name["send_cc_batch"]["tid"] == midi._thread.ident
+    assert by_name["set_one"]["tid"] == midi._thread.ident
+    assert by_name["tool:set_param"]["tid"] != midi._thread.ident
+    thread_names = {
+        event["args"]["name"]
+        for event in tracer.trace()["traceEvents"]
+        if event["ph"] == "M"
+    }
+    assert "digitone-midi-io" in thread_names
+
+
+def test_unsampled_traces_record_nothing():
+    tracer = Tracer(sample_rate=0)
+    set_tracer(tracer)
+    try:
+        with span("root"):
+            with span("child"):
+                assert tracing.recording() is None
+    finally:
+        set_tracer(None)
+
+    assert spans(tracer) == []
+
+
+def test_sampling_applies_to_whole_traces(monkeypatch):
+    tracer = Tracer(sample_rate=0.5)
+    decisions = iter([0.1, 0.9, 0.3])
+    monkeypatch.setattr(tracing.random, "random", lambda: next(decisions))
+    set_tracer(tracer)
+    try:
+        for trace in range(3):
+            with span(f"root{trace}"):
+                with span(f"child{trace}"):
+                    pass
+    finally:
+        set_tracer(None)
+
+    assert [event["name"] for event in spans(tracer)] == [
+        "child0",
+        "root0",
+        "child2",
+        "root2",
+    ]
+
+
+def test_export_writes_chrome_trace_json(tracer, tmp_path):
+    with span("root", "test"):
+        pass
+    path = tmp_path / "trace.json"
+
+    tracer.export(path)
+
+    trace = json.loads(path.read_text())
+    event = trace["traceEvents"][-1]
+    assert event["ph"] == "X"
+    assert {"name", "cat", "ts", "dur", "pid", "tid"} <= set(event)
+
+
+def test_invalid_sample_rate():
+    with pytest.raises(ValueError, match="Invalid sample rate"):
+        Tracer(sample_rate=2)
@@ -298,7 +298,7 @@ def test_wavetone_page3_all_params():
             "max_value": 2,
             "min_value": 0,
             "default_value": 0,
-            "options": ["grain nose", "tuned noise", "sample and hold noise"],
+            "options": ["grain noise", "tuned noise", "sample and hold noise"],
         },
         "CHAR": {
             "midi": {"cc_msb": "63", "nrpn_lsb": "1", "nrpn_msb": "96"},
@@ -0,0 +1,170 @@
+from itertools import count
+
+import pytest
+
+from elektron_mcp.midi.backends import DEFAULT_PORT_NAME, MemoryBackend
+from elektron_mcp.midi.digitone_midi import DigitoneMIDI
+from elektron_mcp.midi.wire_log import (
+    HEADER,
+    INCOMING,
+    OUTGOING,
+    SESSION,
+    WireEvent,
+    WireRecorder,
+    port_writer,
+    read_wire_log,
+    replay,
+)
+
+
+class FakeClock:
+    """Nanosecond clock that only advances when slept on."""
+
+    def __init__(self):
+        self.now = 0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += int(seconds * 1e9)
+
+
+def test_recorder_logs_outgoing_and_incoming_traffic(tmp_path):
+    path = tmp_path / "session.emwl"
+    ticks = count(1000, 1000)
+    backend = MemoryBackend()
+    with WireRecorder(path, clock=lambda: next(ticks)) as recorder:
+        midi = DigitoneMIDI(backend=backend, recorder=recorder)
+        midi.send_cc(1, 40, 64)
+        midi.send_nrpn(2, 73, 1, 5)
+        backend.receive(bytes([0xB0, 41, 7]))
+
+    events = list(read_wire_log(path))
+
+    assert path.read_bytes().startswith(HEADER)
+    assert [event.kind for event in events] == [SESSION, OUTGOING, OUTGOING, INCOMING]
+    assert [event.timestamp_ns for event in events] == [1000, 2000, 3000, 4000]
+    assert events[1].data == bytes([0xB0, 40, 64])
+    records = backend.outputs[DEFAULT_PORT_NAME].records
+    assert events[2].data == b"".join(record.data for record in records[1:])
+    assert events[3].data == bytes([0xB0, 41, 7])
+
+
+def test_recorders_append_sessions(tmp_path):
+    path = tmp_path / "session.emwl"
+    for value in (1, 2):
+        with WireRecorder(path) as recorder:
+            recorder.record_outgoing(bytes([0xB0, 40, value]))
+
+    kinds = [event.kind for event in read_wire_log(path)]
+
+    assert kinds == [SESSION, OUTGOING, SESSION, OUTGOING]
+
+
+def test_truncated_record_ends_the_log(tmp_path):
+    path = tmp_path / "session.emwl"
+    with WireRecorder(path) as recorder:
+        recorder.record_outgoing(bytes([0xB0, 40, 1]))
+        recorder.record_outgoing(bytes([0xB0, 40, 2]))
+    path.write_bytes(path.read_bytes()[:-2])
+
+    assert [event.data for event in read_wire_log(path)][1:] == [bytes([0xB0, 40, 1])]
+
+
+def test_non_log_files_are_rejected(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"hello")
+
+    with pytest.raises(ValueError, match="Not a MIDI wire log"):
+        list(read_wire_log(path))
+
+
+EVENTS = [
+    WireEvent(0, SESSION, b""),
+    WireEvent(1_000_000, OUTGOING, bytes([0xB0, 40, 1])),
+    WireEvent(1_500_000, INCOMING, bytes([0xB0, 41, 1])),
+    WireEvent(3_000_000, OUTGOING, bytes([0xB0, 40, 2])),
+    # A later session restarts the timing
+    WireEvent(0, SESSION, b""),
+    WireEvent(9_000_000, OUTGOING, bytes([0xB0, 40, 3])),
+    WireEvent(9_500_000, OUTGOING, bytes([0xB0, 40, 4])),
+]
+
+
+def test_replay_keeps_relative_timing():
+    clock, port = FakeClock(), MemoryBackend().open_output()
+
+    stats = replay(EVENTS, port.send_raw, clock=clock, sleep=clock.sleep)
+
+    assert port.wire_bytes() == bytes(
+        [0xB0, 40, 1, 0xB0, 40, 2, 0xB0, 40, 3, 0xB0, 40, 4]
+    )
+    assert clock.sleeps == pytest.approx([0.002, 0.0005])
+    assert stats.messages == 4
+    assert stats.bytes == 12
+    assert stats.max_lag_ns == 0
+
+
+def test_replay_speed():
+    clock, writes = FakeClock(), []
+
+    replay(EVENTS, writes.append, speed=4, clock=clock, sleep=clock.sleep)
+    assert clock.sleeps == pytest.approx([0.0005, 0.000125])
+
+    clock.sleeps.clear()
+    replay(EVENTS, writes.append, speed=0, clock=clock, sleep=clock.sleep)
+    assert clock.sleeps == []
+    assert len(writes) == 8
+
+
+def test_replay_incoming_events():
+    writes = []
+
+    replay(EVENTS, writes.append, speed=None, kind=INCOMING)
+
+    assert writes == [bytes([0xB0, 41, 1])]
+
+
+class FakeRtMidiOut:
+    """Stands in for rtmidi.MidiOut, which rejects non-SysEx writes over 3 bytes."""
+
+    def __init__(self):
+        self.writes = []
+
+    def send_message(self, message):
+        if len(message) > 3 and message[0] != 0xF0:
+            raise ValueError(
+                "'message' longer than 3 bytes but does not start with 0xF0."
+            )
+        self.writes.append(bytes(message))
+
+
+class FakeRtMidiPort:
+    def __init__(self):
+        self._rt = FakeRtMidiOut()
+
+
+def test_port_writer_splits_records_for_rtmidi():
+    port = FakeRtMidiPort()
+    nrpn = bytes([0xB0, 99, 1, 0xB0, 98, 73, 0xB0, 6, 0, 0xB0, 38, 64])
+
+    port_writer(port)(nrpn)
+
+    assert port._rt.writes == [nrpn[i : i + 3] for i in range(0, 12, 3)]
+
+
+def test_port_writer_keeps_records_whole_on_coalescing_ports():
+    nrpn = bytes([0xB0, 99, 1, 0xB0, 98, 73, 0xB0, 6, 0, 0xB0, 38, 64])
+    coalescing = MemoryBackend(coalesce=True).open_output()
+    split = MemoryBackend(coalesce=False).open_output()
+
+    port_writer(coalescing)(nrpn)
+    port_writer(split)(nrpn)
+
+    assert [record.data for record in coalescing.records] == [nrpn]
+    assert [record.data for record in split.records] == [
+        nrpn[i : i + 3] for i in range(0, 12, 3)
+    ]